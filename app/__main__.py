@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Run ndfc_mock under uvicorn with command-line control of the database
+engine profile.
+
+## Usage
+
+From the directory immediately above `app`:
+
+```bash
+python -m app --db-profile wal --port 8000
+python -m app --db-profile memory --no-db-echo
+```
+"""
+
+import argparse
+import os
+
+import uvicorn
+
+from .common.enums.db import DB_ECHO_ENV_VAR, DB_FILE_ENV_VAR, DB_PROFILE_ENV_VAR, DbProfileEnum
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    # Summary
+
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="python -m app", description="Run the ndfc_mock application.")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to listen on (default: 0.0.0.0).")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000).")
+    parser.add_argument(
+        "--db-profile",
+        choices=[profile.value for profile in DbProfileEnum],
+        default=os.environ.get(DB_PROFILE_ENV_VAR, DbProfileEnum.file.value),
+        help=f"Database engine profile (default: ${DB_PROFILE_ENV_VAR} or file).",
+    )
+    parser.add_argument("--db-file", default=None, help=f"Database file for the file and wal profiles (default: ${DB_FILE_ENV_VAR} or database.db).")
+    parser.add_argument("--db-echo", action=argparse.BooleanOptionalAction, default=None, help="Echo SQL statements to stdout.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Export the selected options as environment variables, then start uvicorn.
+
+    The options are passed through the environment because app.db builds
+    its engine when it is first imported.
+    """
+    args = parse_args()
+    os.environ[DB_PROFILE_ENV_VAR] = args.db_profile
+    if args.db_file is not None:
+        os.environ[DB_FILE_ENV_VAR] = args.db_file
+    if args.db_echo is not None:
+        os.environ[DB_ECHO_ENV_VAR] = str(args.db_echo).lower()
+    uvicorn.run("app.main:app", host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
 #!/usr/bin/env python
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .db import create_db_and_tables
+from .common.enums.mock import SCENARIO_ENV_VAR
+from .common.journal import journal_recorder
+from .db import create_db_and_tables, engine
+from .mock.scenario import seed_scenario_file
 
 
 @asynccontextmanager
@@ -16,7 +20,19 @@ async def lifespan(runner: FastAPI):
     """
     print(f"app version {runner.version}. Creating db and tables")
     create_db_and_tables()
+    scenario_file = os.environ.get(SCENARIO_ENV_VAR)
+    if scenario_file:
+        counts = seed_scenario_file(engine, scenario_file)
+        if counts is None:
+            print(f"Database already holds fabrics. Not loading scenario {scenario_file}")
+        else:
+            print(f"Loaded scenario {scenario_file}: {counts}")
+    journal_recorder.configure_from_env()
+    if journal_recorder.path:
+        journal_recorder.start()
+        print(f"Recording requests to {journal_recorder.path} (sample rate {journal_recorder.sample_rate})")
     yield
+    journal_recorder.stop()
 
 
 app = FastAPI(lifespan=lifespan)
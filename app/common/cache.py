@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+A registry of the mock's in-process caches, so their statistics can be
+reported, and their contents discarded, from one place, and the per-engine
+storage of their entries.
+"""
+
+import threading
+import weakref
+from typing import Any, Protocol
+
+from sqlalchemy.engine import Connection, Engine
+
+
+class RegisteredCache(Protocol):
+    """
+    # Summary
+
+    The methods a cache must implement to be registered with CacheRegistry.
+    """
+
+    def clear(self) -> None:
+        """
+        Discard all cached entries.
+        """
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the cache statistics.
+        """
+
+
+class CacheRegistry:
+    """
+    # Summary
+
+    Keep a reference to each in-process cache by name.
+
+    ## Methods
+
+    - register: Register a cache by name.
+    - clear: Discard the entries of every registered cache.
+    - stats: Return the statistics of every registered cache, by name.
+
+    ## Example Usage
+
+    ```python
+    cache_registry.register("fabrics", fabric_cache)
+    print(cache_registry.stats()["fabrics"]["hits"])
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._caches: dict[str, RegisteredCache] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, cache: RegisteredCache) -> None:
+        """
+        Register cache by name, replacing any cache registered with that name.
+        """
+        with self._lock:
+            self._caches[name] = cache
+
+    def clear(self) -> None:
+        """
+        Discard the entries of every registered cache.
+        """
+        with self._lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the statistics of every registered cache, by name.
+        """
+        with self._lock:
+            caches = dict(self._caches)
+        return {name: caches[name].stats() for name in sorted(caches)}
+
+
+cache_registry = CacheRegistry()
+
+
+def cache_engine(bind: Engine | Connection) -> Engine:
+    """
+    # Summary
+
+    Return the Engine that caches key their entries by, for bind, the
+    result of Session.get_bind().
+
+    A Session bound to a Connection (e.g. the one shared by the requests
+    of a /mock/batch) returns the Connection, which stands for its Engine.
+    """
+    return bind.engine
+
+
+class EngineEntries:
+    """
+    # Summary
+
+    The entries of an in-process cache, one dict per database engine.
+
+    Entries are kept per engine, so that an engine (e.g. a unit-test
+    database) never sees the entries of another.  Engines are weakly
+    referenced, so their entries are discarded with the engine.
+
+    EngineEntries does no locking.  The cache that holds it serializes
+    access.
+
+    ## Methods
+
+    - get: Return the entries of an engine.
+    - setdefault: Return the entries of an engine, adding them if needed.
+    - values: Return the entries of every engine.
+    - clear: Remove the entries of every engine.
+
+    ## Example Usage
+
+    ```python
+    self._entries = EngineEntries()
+    self._entries.setdefault(session.get_bind())[fabric_id] = body
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._engines: weakref.WeakKeyDictionary[Engine, dict] = weakref.WeakKeyDictionary()
+
+    def get(self, bind: Engine | Connection) -> dict:
+        """
+        Return the entries of the engine of bind, or an empty dict that is
+        not kept.
+        """
+        return self._engines.get(cache_engine(bind), {})
+
+    def setdefault(self, bind: Engine | Connection) -> dict:
+        """
+        Return the entries of the engine of bind, adding an empty dict if
+        the engine has none.
+        """
+        return self._engines.setdefault(cache_engine(bind), {})
+
+    def values(self) -> list[dict]:
+        """
+        Return the entries of every engine.
+        """
+        return list(self._engines.values())
+
+    def clear(self) -> None:
+        """
+        Remove the entries of every engine.
+        """
+        self._engines.clear()
@@ -0,0 +1,21 @@
+from enum import Enum
+
+DB_ECHO_ENV_VAR = "NDFC_MOCK_DB_ECHO"
+DB_FILE_ENV_VAR = "NDFC_MOCK_DB_FILE"
+DB_PROFILE_ENV_VAR = "NDFC_MOCK_DB_PROFILE"
+
+
+class DbProfileEnum(str, Enum):
+    """
+    Choices for the database engine profile.
+
+    - file: File-backed database with SQLite default pragmas (legacy behavior).
+    - memory: Private in-memory database on a single connection, which requests take in turn.
+    - wal: File-backed database tuned for throughput (WAL journal, synchronous=NORMAL, etc).
+    - shared: Named in-memory database in SQLite shared-cache mode, one connection per pool slot.
+    """
+
+    file = "file"
+    memory = "memory"
+    wal = "wal"
+    shared = "shared"
@@ -0,0 +1,25 @@
+from enum import Enum
+
+SCENARIO_ENV_VAR = "NDFC_MOCK_SCENARIO"
+SNAPSHOT_DIR_ENV_VAR = "NDFC_MOCK_SNAPSHOT_DIR"
+PROFILE_DIR_ENV_VAR = "NDFC_MOCK_PROFILE_DIR"
+JOURNAL_ENV_VAR = "NDFC_MOCK_JOURNAL"
+JOURNAL_SAMPLE_ENV_VAR = "NDFC_MOCK_JOURNAL_SAMPLE"
+JOURNAL_MAX_BYTES_ENV_VAR = "NDFC_MOCK_JOURNAL_MAX_BYTES"
+JOURNAL_BACKUPS_ENV_VAR = "NDFC_MOCK_JOURNAL_BACKUPS"
+SERVER_TIMING_ENV_VAR = "NDFC_MOCK_SERVER_TIMING"
+
+
+class ServerTimingEnum(str, Enum):
+    """
+    Choices for the requests whose phases are timed, for the Server-Timing
+    header and the serialization time metric.
+
+    - off: No request.  Endpoint functions are not wrapped to time them.
+    - header: Requests with an X-Mock-Server-Timing or X-Mock-Profile header (default).
+    - all: Every request.
+    """
+
+    off = "off"
+    header = "header"
+    all = "all"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+from starlette.types import Scope
+
+# The route of requests that matched no route, e.g. 404s.
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    # Summary
+
+    Return the path template of the route that handled the request of
+    scope, e.g. "/appcenter/.../fabrics/{fabric_name}", or UNMATCHED_ROUTE.
+
+    Call this after the app has handled the request.  FastAPI adds the
+    matched route to scope while routing.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+def header_value(scope: Scope, name: bytes) -> str | None:
+    """
+    # Summary
+
+    Return the value of the request header name (lower case), or None.
+    """
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
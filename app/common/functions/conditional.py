@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Helpers for conditional (ETag / If-None-Match / Last-Modified) and
+content-negotiated
+responses.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+
+def build_etag(body: bytes, suffix: str = "") -> str:
+    """
+    # Summary
+
+    Return a strong, quoted entity tag for body.
+
+    suffix distinguishes representations of the same body, e.g. "gzip".
+    """
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    if suffix:
+        return f'"{digest}-{suffix}"'
+    return f'"{digest}"'
+
+
+def build_last_modified(value: datetime) -> str:
+    """
+    # Summary
+
+    Return value as an HTTP-date, for a Last-Modified header.
+
+    A naive value is taken to be local time, as returned by get_datetime().
+    """
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    # Summary
+
+    Return True if the If-None-Match header value matches etag.
+
+    Per RFC 9110, If-None-Match uses the weak comparison function, so a
+    W/ prefix on either tag is ignored.  "*" matches any etag.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == target:
+            return True
+    return False
+
+
+def select_encoding(accept_encoding: str | None, available: list[str]) -> str | None:
+    """
+    # Summary
+
+    Return the first encoding in available (in order of server preference)
+    that accept_encoding allows, or None for the identity encoding.
+
+    Encodings with q=0 are treated as refused.
+    """
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if params.replace(" ", "").lower() in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        accepted.add(coding)
+    for encoding in available:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def accepts_media_type(accept: str | None, media_type: str) -> bool:
+    """
+    # Summary
+
+    Return True if the Accept header value explicitly lists media_type
+    with a non-zero quality.
+
+    Wildcards (e.g. */*) do not match, so callers can use this to detect
+    an opt-in to a non-default representation.
+    """
+    if not accept:
+        return False
+    for item in accept.split(","):
+        candidate, _, params = item.strip().partition(";")
+        if candidate.strip().lower() != media_type:
+            continue
+        return params.replace(" ", "").lower() not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
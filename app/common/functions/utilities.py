@@ -1,6 +1,8 @@
+import json
 import random
 import string
 from datetime import datetime
+from typing import Any
 
 from fastapi import HTTPException
 
@@ -53,6 +55,48 @@ def random_switch_serial_number() -> str:
     return f"FOX{gen_number(4)}{gen_string(4).upper()}"
 
 
+# Switch serial numbers are FOX, 4 digits, then 4 upper-case letters.
+SWITCH_SERIAL_NUMBER_SPACE = 10**4 * 26**4
+# Every pair of upper-case letters, in order.  Index n encodes n in base 26.
+LETTER_PAIRS = [first + second for first in string.ascii_uppercase for second in string.ascii_uppercase]
+
+
+def unique_switch_serial_numbers(count: int, rng: random.Random) -> list[str]:
+    """
+    # Summary
+
+    Return count distinct switch serial numbers, in the format of
+    random_switch_serial_number(), drawn from rng.
+
+    The numbers are drawn with one rng.sample() from the serial number
+    space, so they are distinct by construction, and a seeded rng always
+    returns the same numbers.
+
+    ## Raises
+
+    -   ValueError: count exceeds SWITCH_SERIAL_NUMBER_SPACE.
+    """
+    serial_numbers = []
+    for index in rng.sample(range(SWITCH_SERIAL_NUMBER_SPACE), count):
+        number, letters = divmod(index, 26**4)
+        serial_numbers.append(f"FOX{number:04d}{LETTER_PAIRS[letters // 676]}{LETTER_PAIRS[letters % 676]}")
+    return serial_numbers
+
+
+def unique_unicast_mac_addresses(count: int, rng: random.Random) -> list[str]:
+    """
+    # Summary
+
+    Return count distinct unicast MAC addresses, with the OUI of
+    random_unicast_mac_address(), drawn from rng.
+
+    ## Raises
+
+    -   ValueError: count exceeds 2**24, the addresses of the OUI.
+    """
+    return [f"00:AA:BB:{index >> 16:02X}:{(index >> 8) & 0xFF:02X}:{index & 0xFF:02X}" for index in rng.sample(range(2**24), count)]
+
+
 external_role_to_db = {
     "access": "access",
     "aggregation": "aggregation",
@@ -121,3 +165,15 @@ def switch_role_external_to_db(role: str) -> str:
         msg = f"Invalid role: {role}."
         raise HTTPException(status_code=500, detail=msg)
     return return_role
+
+
+def serialize_json(content: Any) -> bytes:
+    """
+    # Summary
+
+    Serialize content to bytes exactly as fastapi.responses.JSONResponse does.
+
+    Use this to prepare a response body ahead of time, or to bypass
+    response_model validation for content already known to be valid.
+    """
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
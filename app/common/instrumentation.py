@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+The ASGI middleware that instruments the mock's HTTP requests: the
+metrics of /metrics, the query counters of /mock/metrics, the
+Server-Timing and X-Mock-Queries response headers, the request journal
+and the request profiler.
+
+Each layer of middleware costs a call, and a send wrapper per response
+message, on every request.  The work every request needs is therefore
+done in one layer, and the journal and profiler middlewares are called
+only for the requests they record or profile.  A request that opts in to
+nothing costs a few microseconds; see tests/unit/test_mock_instrumentation.py.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .enums.mock import ServerTimingEnum
+from .functions.asgi import route_template
+from .journal import JournalMiddleware, journal_recorder
+from .metrics import SERVER_TIMING_REQUEST_HEADER, RequestTimings, current_request_timings, get_server_timing, metrics_registry
+from .profiler import PROFILE_REQUEST_HEADER, ProfileMiddleware
+from .query_stats import QUERY_STATS_REQUEST_HEADER, QueryStats, current_query_stats, query_stats_registry
+
+# The request headers with which a client opts in to more instrumentation.
+OPT_IN_HEADERS = frozenset({PROFILE_REQUEST_HEADER, QUERY_STATS_REQUEST_HEADER, SERVER_TIMING_REQUEST_HEADER})
+NO_HEADERS: frozenset[bytes] = frozenset()
+# With ServerTimingEnum.header, the opt-in headers of the requests whose
+# phases are timed.  A profiled request is always timed.
+TIMING_HEADERS = frozenset({PROFILE_REQUEST_HEADER, SERVER_TIMING_REQUEST_HEADER})
+
+
+def opt_in_headers(scope: Scope) -> frozenset[bytes]:
+    """
+    # Summary
+
+    Return the OPT_IN_HEADERS the request of scope has, with a value other
+    than "0".
+
+    Most requests have none, so no set is built for them.
+    """
+    opt_in = NO_HEADERS
+    for key, value in scope["headers"]:
+        if key in OPT_IN_HEADERS and value != b"0":
+            opt_in = opt_in | {key}
+    return opt_in
+
+
+class InstrumentationMiddleware:
+    """
+    # Summary
+
+    ASGI middleware that, for each HTTP request:
+
+    -   counts its queries in a QueryStats (see query_stats.py), and
+        records them in query_stats_registry under "<method> <route>"
+    -   records its latency, database time, response size and status in
+        metrics_registry, under its method and route
+    -   if its phases are timed (see ServerTimingEnum), records them in a
+        RequestTimings, adds them to the response in a Server-Timing
+        header, and records its serialization time in metrics_registry
+    -   if it has an X-Mock-Query-Stats header, returns its QueryStats in
+        the X-Mock-Queries, X-Mock-Rows and X-Mock-Commits headers
+    -   if journal_recorder is recording, passes it to JournalMiddleware
+    -   if it has an X-Mock-Profile header, passes it to ProfileMiddleware
+
+    The headers are added when the response starts, so they do not count
+    the queries of a streamed response body.
+
+    ## Notes
+
+    -   The requests whose phases are timed are selected by the
+        NDFC_MOCK_SERVER_TIMING environment variable when the middleware
+        is built, i.e. when the app handles its first request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.server_timing = get_server_timing()
+        self.profiled_app = ProfileMiddleware(app)
+        self.journaled_app = JournalMiddleware(app)
+        self.journaled_profiled_app = JournalMiddleware(self.profiled_app)
+
+    def timed(self, opt_in: frozenset[bytes]) -> bool:
+        """
+        Return True if the phases of a request with opt_in headers are timed.
+        """
+        if self.server_timing == ServerTimingEnum.header:
+            return not opt_in.isdisjoint(TIMING_HEADERS)
+        return self.server_timing == ServerTimingEnum.all
+
+    def select_app(self, profiled: bool) -> ASGIApp:
+        """
+        Return the app, within JournalMiddleware and ProfileMiddleware as
+        needed, to pass a request to.
+        """
+        if journal_recorder.enabled:
+            return self.journaled_profiled_app if profiled else self.journaled_app
+        return self.profiled_app if profiled else self.app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        opt_in = opt_in_headers(scope)
+        profiled = PROFILE_REQUEST_HEADER in opt_in
+        timed = self.timed(opt_in)
+        query_headers = QUERY_STATS_REQUEST_HEADER in opt_in
+        stats = QueryStats()
+        stats_token = current_query_stats.set(stats)
+        # ProfileMiddleware keeps the profiles of the threadpool threads in
+        # the RequestTimings, so a profiled request always has one.
+        timings = RequestTimings(start) if timed or profiled else None
+        timings_token = current_request_timings.set(timings) if timings is not None else None
+        status = 500
+        size = 0
+
+        async def send_instrumented(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            elif message["type"] == "http.response.start":
+                status = message["status"]
+                if timings is not None:
+                    timings.response_start = time.perf_counter()
+                if timed or query_headers:
+                    headers = list(message.get("headers", []))
+                    if timed:
+                        headers.append((b"server-timing", timings.server_timing(stats.db_seconds)))
+                    if query_headers:
+                        headers.extend(stats.headers())
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        metrics_registry.started()
+        try:
+            await self.select_app(profiled)(scope, receive, send_instrumented)
+        finally:
+            if timings_token is not None:
+                current_request_timings.reset(timings_token)
+            current_query_stats.reset(stats_token)
+            method = scope["method"]
+            route = route_template(scope)
+            serialize = timings.phases(stats.db_seconds).get("serialize") if timed else None
+            metrics_registry.record(method, route, status, time.perf_counter() - start, stats.db_seconds, serialize, size, stats.queries)
+            query_stats_registry.record(f"{method} {route}", stats)
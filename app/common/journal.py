@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Record the requests the mock receives, as JSON lines, to capture real
+client sessions (e.g. ansible-dcnm playbook runs) for replay and
+benchmarking with utils/replay.py.
+
+Recording is off unless a journal file is configured, e.g. with the
+NDFC_MOCK_JOURNAL environment variable.  Requests only build a dict and
+put it on a bounded queue; a background thread decodes the request
+body, encodes the entry, and writes it.
+"""
+
+import json
+import os
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .enums.mock import JOURNAL_BACKUPS_ENV_VAR, JOURNAL_ENV_VAR, JOURNAL_MAX_BYTES_ENV_VAR, JOURNAL_SAMPLE_ENV_VAR
+from .functions.asgi import header_value, route_template
+
+# Request bodies larger than this are recorded as null, with
+# body_truncated set.
+JOURNAL_MAX_BODY_BYTES = 1024 * 1024
+JOURNAL_QUEUE_SIZE = 10000
+# Requests to paths with these prefixes control the mock itself, and are
+# not part of a client session.
+JOURNAL_EXCLUDED_PREFIXES = ("/mock/", "/metrics", "/docs", "/openapi.json")
+# Top-level request body fields whose values are replaced with
+# JOURNAL_REDACTED.
+JOURNAL_REDACTED_FIELDS = frozenset({"password", "userPasswd"})
+JOURNAL_REDACTED = "REDACTED"
+
+
+def decode_body(body: bytes, content_type: str | None) -> Any:
+    """
+    # Summary
+
+    Return body decoded as JSON if content_type is JSON, as text
+    otherwise, or None if it is empty.  The JOURNAL_REDACTED_FIELDS of a
+    JSON object are redacted.
+    """
+    if not body:
+        return None
+    text = body.decode("utf-8", errors="replace")
+    if content_type is None or "json" not in content_type:
+        return text
+    try:
+        content = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(content, dict):
+        for field in JOURNAL_REDACTED_FIELDS.intersection(content):
+            content[field] = JOURNAL_REDACTED
+    return content
+
+
+class JournalRecorder:
+    """
+    # Summary
+
+    Append journal entries to a JSON lines file, from a background thread.
+
+    - path: The journal file.  Recording is disabled if None.
+    - sample_rate: The fraction of requests recorded, 0.0 to 1.0.
+    - max_bytes: The journal is rotated before it grows past this size,
+      to <path>.1, <path>.1 to <path>.2, and so on.  0 disables rotation.
+    - backup_count: The number of rotated journals kept.
+
+    record() never blocks.  If the writer falls JOURNAL_QUEUE_SIZE entries
+    behind, entries are dropped, and counted.
+
+    ## Methods
+
+    - start: Open the journal and start the writer thread.
+    - stop: Write the queued entries, then stop the writer thread.
+    - sampled: Return True if a request should be recorded.
+    - record: Queue an entry.
+    - flush: Wait until the queued entries are written.
+    - status: Return the configuration and counters.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.path: str | None = None
+        self.sample_rate = 1.0
+        self.max_bytes = 100 * 1024 * 1024
+        self.backup_count = 5
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(maxsize=JOURNAL_QUEUE_SIZE)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+
+    def configure_from_env(self) -> None:
+        """
+        Set path, sample_rate, max_bytes and backup_count from the
+        NDFC_MOCK_JOURNAL* environment variables, where set.
+        """
+        self.path = os.environ.get(JOURNAL_ENV_VAR) or None
+        self.sample_rate = float(os.environ.get(JOURNAL_SAMPLE_ENV_VAR, self.sample_rate))
+        self.max_bytes = int(os.environ.get(JOURNAL_MAX_BYTES_ENV_VAR, self.max_bytes))
+        self.backup_count = int(os.environ.get(JOURNAL_BACKUPS_ENV_VAR, self.backup_count))
+        self.validate_properties()
+
+    def validate_properties(self) -> None:
+        """
+        Raise ValueError if a property is out of range.
+        """
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError(f"{self.class_name}: sample_rate must be between 0.0 and 1.0. Got {self.sample_rate}")
+        if self.max_bytes < 0 or self.backup_count < 0:
+            raise ValueError(f"{self.class_name}: max_bytes and backup_count must be >= 0. Got {self.max_bytes}, {self.backup_count}")
+
+    @property
+    def enabled(self) -> bool:
+        """
+        True if the writer thread is running.
+        """
+        return self._thread is not None
+
+    def start(self) -> None:
+        """
+        Start the writer thread, if path is set and it is not running.
+        """
+        self.validate_properties()
+        with self._lock:
+            if self.path is None or self._thread is not None:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._thread = threading.Thread(target=self._write, args=(self.path,), name="journal-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Write the queued entries, then stop the writer thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def sampled(self) -> bool:
+        """
+        Return True if the writer is running, and the request is sampled.
+        """
+        return self._thread is not None and (self.sample_rate >= 1.0 or random.random() < self.sample_rate)
+
+    def record(self, entry: dict[str, Any]) -> None:
+        """
+        Queue entry to be written, or drop it if the queue is full.
+        A bytes body is decoded by the writer, with decode_body().
+        """
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def flush(self) -> None:
+        """
+        Wait until every queued entry is written.
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def status(self) -> dict[str, Any]:
+        """
+        Return the configuration and counters of the recorder.
+        """
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "sample_rate": self.sample_rate,
+            "max_bytes": self.max_bytes,
+            "backup_count": self.backup_count,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+        }
+
+    def rotate(self, path: str) -> None:
+        """
+        Shift path to path.1, path.1 to path.2, ..., dropping the oldest
+        beyond backup_count.  The caller has closed path.
+        """
+        self.rotations += 1
+        if self.backup_count == 0:
+            os.remove(path)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+    def _write(self, path: str) -> None:
+        # Entries are written as UTF-8, non-ASCII characters unescaped, so
+        # size, which is compared with max_bytes, counts bytes, not characters.
+        file = open(path, "ab")  # pylint: disable=consider-using-with
+        size = file.tell()
+        try:
+            while True:
+                entry = self._queue.get()
+                try:
+                    if entry is None:
+                        return
+                    if isinstance(entry["body"], bytes):
+                        entry["body"] = decode_body(entry["body"], entry["content_type"])
+                    line = (json.dumps(entry, separators=(",", ":"), ensure_ascii=False, default=str) + "\n").encode("utf-8")
+                    if self.max_bytes and size and size + len(line) > self.max_bytes:
+                        file.close()
+                        self.rotate(path)
+                        file = open(path, "ab")  # pylint: disable=consider-using-with
+                        size = 0
+                    file.write(line)
+                    size += len(line)
+                    self.written += 1
+                    if self._queue.empty():
+                        file.flush()
+                finally:
+                    self._queue.task_done()
+        finally:
+            file.close()
+
+
+journal_recorder = JournalRecorder()
+
+
+class JournalMiddleware:
+    """
+    # Summary
+
+    ASGI middleware that records each sampled HTTP request with
+    journal_recorder: its time, method, path, query string, route, body,
+    response status, latency and response size.
+
+    InstrumentationMiddleware calls this only while journal_recorder is
+    recording.  Requests are passed through untouched while recording is
+    disabled, if they are not sampled, and for the paths in
+    JOURNAL_EXCLUDED_PREFIXES.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not journal_recorder.sampled() or scope["path"].startswith(JOURNAL_EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        received = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        chunks: list[bytes] = []
+        body_size = 0
+        status = 500
+        size = 0
+
+        async def receive_recording() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if body_size <= JOURNAL_MAX_BODY_BYTES:
+                    chunks.append(chunk)
+            return message
+
+        async def send_recording(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_recording, send_recording)
+        finally:
+            truncated = body_size > JOURNAL_MAX_BODY_BYTES
+            journal_recorder.record(
+                {
+                    "time": received.isoformat(),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "query": scope["query_string"].decode("latin-1"),
+                    "route": route_template(scope),
+                    "content_type": header_value(scope, b"content-type"),
+                    "body": None if truncated else b"".join(chunks),
+                    "body_truncated": truncated,
+                    "status": status,
+                    "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "response_bytes": size,
+                }
+            )
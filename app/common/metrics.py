@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Per-route request latency, database time, serialization time and
+response size histograms, and the number of requests in flight, kept in
+process and rendered in the Prometheus text exposition format for
+/metrics, and a Server-Timing header that breaks a request into the
+same phases.
+
+No client library is used.  Each request costs two lock acquisitions and
+a bisect per histogram.  The requests are measured by
+InstrumentationMiddleware, in instrumentation.py.
+"""
+
+import cProfile
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from .enums.mock import SERVER_TIMING_ENV_VAR, ServerTimingEnum
+
+METRICS_PREFIX = "ndfc_mock"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds, in seconds, of the latency buckets.  The mock answers
+# most requests in well under a millisecond, so the low end is dense.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds, in bytes, of the response size buckets.
+SIZE_BUCKETS = (128, 512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608)
+# Before Python 3.12, cProfile profiles only the thread that enabled it,
+# so sync endpoint functions, run in the threadpool, need a profile of
+# their own.  From 3.12 it uses sys.monitoring: one profile sees every
+# thread, and no other profile can be enabled while it runs.
+PROFILE_THREADS = sys.version_info < (3, 12)
+
+# With ServerTimingEnum.header, requests with this header (any value but
+# "0") are timed by phase, and get a Server-Timing header.
+SERVER_TIMING_REQUEST_HEADER = b"x-mock-server-timing"
+
+
+def get_server_timing() -> ServerTimingEnum:
+    """
+    # Summary
+
+    Return the requests whose phases are timed, as selected by the
+    NDFC_MOCK_SERVER_TIMING environment variable.  Defaults to
+    ServerTimingEnum.header.
+
+    ## Raises
+
+    ValueError if the environment variable contains an unknown choice.
+    """
+    value = os.environ.get(SERVER_TIMING_ENV_VAR, ServerTimingEnum.header.value).strip().lower()
+    try:
+        return ServerTimingEnum(value)
+    except ValueError as error:
+        msg = f"Invalid {SERVER_TIMING_ENV_VAR}: {value}. "
+        msg += f"Expected one of {','.join(choice.value for choice in ServerTimingEnum)}."
+        raise ValueError(msg) from error
+
+
+class Histogram:
+    """
+    # Summary
+
+    A Prometheus histogram, with fixed bucket upper bounds.
+
+    counts holds the number of observations of each bucket, plus one for
+    +Inf.  They are made cumulative when rendered.
+    """
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add value.  The caller holds the registry's lock.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: str) -> list[str]:
+        """
+        Return the _bucket, _sum and _count lines of the histogram.
+        """
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class RouteMetrics:
+    """
+    # Summary
+
+    The metrics of the requests of one method and route.
+    """
+
+    __slots__ = ("duration", "db", "serialize", "size", "queries", "responses")
+
+    def __init__(self):
+        self.duration = Histogram(LATENCY_BUCKETS)
+        self.db = Histogram(LATENCY_BUCKETS)
+        self.serialize = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.queries = 0
+        self.responses: dict[int, int] = {}
+
+
+class RequestTimings:
+    """
+    # Summary
+
+    The phase boundaries of the current request, as time.perf_counter()
+    values, or None if not reached.
+
+    - start: The request was received.
+    - handler_start: The route's endpoint function was called, after the
+      request body was parsed and validated, and the dependencies solved.
+    - handler_end: The endpoint function returned.  The return value is
+      validated against the response model, and serialized, after this.
+    - response_start: The response status and headers were sent.
+    - thread_profiles: If the request is being profiled, the profiles of
+      the endpoint functions run in the threadpool (before Python 3.12,
+      see PROFILE_THREADS).  None otherwise.
+    """
+
+    __slots__ = ("start", "handler_start", "handler_end", "response_start", "thread_profiles")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.handler_start: float | None = None
+        self.handler_end: float | None = None
+        self.response_start: float | None = None
+        self.thread_profiles: list[cProfile.Profile] | None = None
+
+    def phases(self, db: float) -> dict[str, float]:
+        """
+        # Summary
+
+        Return the seconds spent, up to the response start (or now), in:
+
+        - validate: Reading, parsing and validating the request, and
+          solving the dependencies.
+        - db: Executing SQL statements (db, from the request's QueryStats).
+        - build: Running the endpoint function, less db.
+        - serialize: Validating the return value against the response
+          model, and encoding the body.
+
+        build and serialize are omitted if the endpoint function was not
+        called, e.g. the request failed validation.
+        """
+        end = self.response_start or time.perf_counter()
+        if self.handler_start is None:
+            return {"validate": end - self.start, "db": db}
+        handler_end = self.handler_end or end
+        return {
+            "validate": self.handler_start - self.start,
+            "db": db,
+            "build": max(handler_end - self.handler_start - db, 0.0),
+            "serialize": end - handler_end,
+        }
+
+    def server_timing(self, db: float) -> bytes:
+        """
+        # Summary
+
+        Return the value of a Server-Timing header with phases(db) and the
+        total, in milliseconds, e.g.
+
+        validate;dur=0.412, db;dur=1.207, build;dur=0.301, serialize;dur=0.095, total;dur=2.015
+        """
+        phases = self.phases(db)
+        phases["total"] = (self.response_start or time.perf_counter()) - self.start
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in phases.items()).encode()
+
+
+# The RequestTimings of the current request, if its phases are timed.  Set
+# by InstrumentationMiddleware.
+current_request_timings: ContextVar[RequestTimings | None] = ContextVar("current_request_timings", default=None)
+
+
+def timed_endpoint(call: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    # Summary
+
+    Return call wrapped to record its start and end in the current
+    request's RequestTimings, and, for a sync call before Python 3.12,
+    to run it under a profile of its own if the request is being
+    profiled.
+
+    FastAPI runs sync endpoint functions in a threadpool.  See
+    PROFILE_THREADS.
+    """
+    if inspect.iscoroutinefunction(call):
+
+        @functools.wraps(call)
+        async def timed_async(*args, **kwargs):
+            timings = current_request_timings.get()
+            if timings is None:
+                return await call(*args, **kwargs)
+            timings.handler_start = time.perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                timings.handler_end = time.perf_counter()
+
+        return timed_async
+
+    @functools.wraps(call)
+    def timed(*args, **kwargs):
+        timings = current_request_timings.get()
+        if timings is None:
+            return call(*args, **kwargs)
+        profile = None
+        if PROFILE_THREADS and timings.thread_profiles is not None:
+            profile = cProfile.Profile()
+            timings.thread_profiles.append(profile)
+            profile.enable()
+        timings.handler_start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            timings.handler_end = time.perf_counter()
+            if profile is not None:
+                profile.disable()
+
+    return timed
+
+
+def instrument_endpoints(app: FastAPI) -> None:
+    """
+    # Summary
+
+    Wrap the endpoint function of every route of app with timed_endpoint(),
+    unless get_server_timing() is ServerTimingEnum.off.
+
+    Call this once, after every router is included.  FastAPI calls
+    route.dependant.call with the solved parameters, so the wrapper sees
+    exactly the time spent in the endpoint function.  For a request whose
+    phases are not timed, the wrapper only looks up the RequestTimings.
+    """
+    if get_server_timing() == ServerTimingEnum.off:
+        return
+    for route in app.router.routes:
+        if isinstance(route, APIRoute):
+            route.dependant.call = timed_endpoint(route.dependant.call)
+
+
+def escape_label(value: str) -> str:
+    """
+    Return value escaped for use as a Prometheus label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    # Summary
+
+    Hold the metrics of every route, and render them for /metrics.
+
+    ## Methods
+
+    - record: Add the metrics of a request.
+    - clear: Discard the metrics.
+    - render: Return the metrics in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def started(self) -> None:
+        """
+        Count a request in flight.
+        """
+        with self._lock:
+            self.in_flight += 1
+
+    # pylint: disable-next=too-many-arguments
+    def record(self, method: str, route: str, status: int, duration: float, db: float, serialize: float | None, size: int, queries: int) -> None:
+        """
+        Add the metrics of a finished request, and count it out of flight.
+        serialize is None if the request's phases were not timed.
+        """
+        key = (method, route)
+        with self._lock:
+            self.in_flight -= 1
+            metrics = self._routes.get(key)
+            if metrics is None:
+                metrics = self._routes[key] = RouteMetrics()
+            metrics.duration.observe(duration)
+            metrics.db.observe(db)
+            if serialize is not None:
+                metrics.serialize.observe(serialize)
+            metrics.size.observe(size)
+            metrics.queries += queries
+            metrics.responses[status] = metrics.responses.get(status, 0) + 1
+
+    def clear(self) -> None:
+        """
+        Discard the metrics of every route.
+        """
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            routes = sorted(self._routes.items())
+            in_flight = self.in_flight
+            histograms = {
+                "http_request_duration_seconds": ("Time from receiving a request to sending the end of its response.", "duration"),
+                "http_request_db_seconds": ("Time spent executing SQL statements, per request.", "db"),
+                "http_response_serialize_seconds": ("Time spent validating and encoding response bodies, per request whose phases are timed.", "serialize"),
+                "http_response_size_bytes": ("Size of response bodies.", "size"),
+            }
+            lines = [
+                f"# HELP {METRICS_PREFIX}_http_requests_in_flight Requests being handled.",
+                f"# TYPE {METRICS_PREFIX}_http_requests_in_flight gauge",
+                f"{METRICS_PREFIX}_http_requests_in_flight {in_flight}",
+                f"# HELP {METRICS_PREFIX}_http_requests_total Requests handled, by response status.",
+                f"# TYPE {METRICS_PREFIX}_http_requests_total counter",
+            ]
+            for (method, route), metrics in routes:
+                for status, count in sorted(metrics.responses.items()):
+                    lines.append(f'{METRICS_PREFIX}_http_requests_total{{method="{method}",route="{escape_label(route)}",status="{status}"}} {count}')
+            lines.append(f"# HELP {METRICS_PREFIX}_db_queries_total SQL statements executed.")
+            lines.append(f"# TYPE {METRICS_PREFIX}_db_queries_total counter")
+            for (method, route), metrics in routes:
+                lines.append(f'{METRICS_PREFIX}_db_queries_total{{method="{method}",route="{escape_label(route)}"}} {metrics.queries}')
+            for name, (description, attribute) in histograms.items():
+                lines.append(f"# HELP {METRICS_PREFIX}_{name} {description}")
+                lines.append(f"# TYPE {METRICS_PREFIX}_{name} histogram")
+                for (method, route), metrics in routes:
+                    labels = f'method="{method}",route="{escape_label(route)}"'
+                    lines.extend(getattr(metrics, attribute).samples(f"{METRICS_PREFIX}_{name}", labels))
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Run single requests under cProfile on demand, and keep their profiles as
+pstats files, to find where a slow request spends its time.
+
+A request with an X-Mock-Profile header (any value but "0") is profiled.
+Other requests are not affected.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Literal
+
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .enums.mock import PROFILE_DIR_ENV_VAR
+from .functions.asgi import header_value, route_template
+from .metrics import current_request_timings
+
+PROFILE_REQUEST_HEADER = b"x-mock-profile"
+PROFILE_NAME_PATTERN = r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$"
+PROFILE_FILE_SUFFIX = ".prof"
+
+ProfileSort = Literal["cumulative", "tottime", "calls"]
+
+
+class RequestProfiler:
+    """
+    # Summary
+
+    The profiles of the profiled requests, as pstats files,
+    <name>.prof, in directory.
+
+    Each file holds the profile of the event loop thread, which parses,
+    validates and serializes the request, and runs async endpoint
+    functions, and of the threadpool thread that ran a sync endpoint
+    function.  Before Python 3.12, the two are separate profiles, merged
+    when saved.  From 3.12, one profile sees every thread.  Either way,
+    the work of requests handled concurrently with a profiled one is
+    included.
+
+    cProfile can run only one profile (per thread, before Python 3.12)
+    at a time, so only one request is profiled at a time.  Requests asking for a profile while
+    another is running are handled normally, with X-Mock-Profile: busy.
+
+    ## Methods
+
+    - path: Return the file of a profile.
+    - list: Return the metadata of every profile.
+    - text: Return a profile as a pstats report.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.lock = threading.Lock()
+        self._directory = os.environ.get(PROFILE_DIR_ENV_VAR, "profiles")
+
+    def path(self, name: str) -> str:
+        """
+        Return the file of the profile name.
+        """
+        return os.path.join(self.directory, f"{name}{PROFILE_FILE_SUFFIX}")
+
+    @staticmethod
+    def build_name(method: str, route: str) -> str:
+        """
+        Return a unique name for a profile of a request of method and route.
+        """
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_")
+        if len(slug) > 80:
+            slug = slug[-80:].split("_", 1)[-1]
+        return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{method}-{slug}"
+
+    def save(self, name: str, profiles: list[cProfile.Profile]) -> None:
+        """
+        Merge profiles, and write them to the file of the profile name.
+        """
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        os.makedirs(self.directory, exist_ok=True)
+        stats.dump_stats(self.path(name))
+
+    def list(self) -> list[dict[str, Any]]:
+        """
+        Return the metadata of every profile, oldest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for file_name in sorted(os.listdir(self.directory)):
+            name = file_name[: -len(PROFILE_FILE_SUFFIX)]
+            if file_name.endswith(PROFILE_FILE_SUFFIX) and re.match(PROFILE_NAME_PATTERN, name):
+                path = self.path(name)
+                created = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+                profiles.append({"name": name, "created": created.isoformat(), "bytes": os.path.getsize(path)})
+        return profiles
+
+    def text(self, name: str, sort: ProfileSort = "cumulative", limit: int = 40) -> str:
+        """
+        Return the limit functions of the profile name with the most sort
+        time, or calls, as a pstats report.
+
+        ## Raises
+
+        -   HTTPException 404: There is no profile name.
+        """
+        self.verify_exists(name)
+        stream = io.StringIO()
+        pstats.Stats(self.path(name), stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def verify_exists(self, name: str) -> None:
+        """
+        Raise HTTPException 404 if there is no profile name.
+        """
+        if not re.match(PROFILE_NAME_PATTERN, name) or not os.path.isfile(self.path(name)):
+            raise HTTPException(status_code=404, detail=f"Profile {name} not found")
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the profiles.
+        """
+        return self._directory
+
+    @directory.setter
+    def directory(self, value: str):
+        self._directory = value
+
+
+request_profiler = RequestProfiler()
+
+
+class ProfileMiddleware:
+    """
+    # Summary
+
+    ASGI middleware that runs each HTTP request with an X-Mock-Profile
+    header under cProfile, saves the profile with request_profiler, and
+    returns its name in the X-Mock-Profile response header.  The profile
+    is saved when the request completes.
+
+    InstrumentationMiddleware calls this only for requests with the
+    header, after setting their RequestTimings.  Other requests are
+    passed through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timings = current_request_timings.get()
+        if scope["type"] != "http" or timings is None or header_value(scope, PROFILE_REQUEST_HEADER) in (None, "0"):
+            await self.app(scope, receive, send)
+            return
+        if not request_profiler.lock.acquire(blocking=False):
+            await self.app(scope, receive, self.send_with_header(send, lambda: "busy"))
+            return
+        name = ""
+
+        def profile_name() -> str:
+            nonlocal name
+            name = name or request_profiler.build_name(scope["method"], route_template(scope))
+            return name
+
+        profile = cProfile.Profile()
+        timings.thread_profiles = []
+        try:
+            profile.enable()
+            try:
+                await self.app(scope, receive, self.send_with_header(send, profile_name))
+            finally:
+                profile.disable()
+            request_profiler.save(profile_name(), [profile, *timings.thread_profiles])
+        finally:
+            timings.thread_profiles = None
+            request_profiler.lock.release()
+
+    @staticmethod
+    def send_with_header(send: Send, value: Callable[[], str]) -> Send:
+        """
+        Return send, adding an X-Mock-Profile header, of value(), to the
+        response start.
+        """
+
+        async def wrapped(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (PROFILE_REQUEST_HEADER, value().encode())]}
+            await send(message)
+
+        return wrapped
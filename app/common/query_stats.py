@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Count the SQL queries, rows written and commits of each request, with
+SQLAlchemy engine events, to make the database cost of each handler
+visible, and to catch query-count regressions in the unit tests.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# A statement executed at least this many times by one request is
+# reported as a likely N+1 query pattern.
+N_PLUS_ONE_THRESHOLD = 5
+
+# Requests with this header (any value but "0") get the X-Mock-Queries,
+# X-Mock-Rows and X-Mock-Commits response headers.
+QUERY_STATS_REQUEST_HEADER = b"x-mock-query-stats"
+
+
+class QueryStats:
+    """
+    # Summary
+
+    The queries, rows written and commits of one unit of work, e.g. a
+    request.
+
+    - queries: Statements sent to the driver.  An executemany() is one query.
+    - rows: Rows written by INSERT, UPDATE and DELETE (the cursor's rowcount).
+      SQLite reports no rowcount for statements with RETURNING.
+    - commits: Transactions committed.
+    - db_seconds: Time spent executing the statements, in the driver.
+    - statements: The number of times each statement was executed.
+    """
+
+    __slots__ = ("queries", "rows", "commits", "db_seconds", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+        self.commits = 0
+        self.db_seconds = 0.0
+        self.statements: dict[str, int] = {}
+
+    def record_query(self, statement: str, rowcount: int, seconds: float = 0.0) -> None:
+        """
+        Add an executed statement, which took seconds.
+        """
+        self.queries += 1
+        self.db_seconds += seconds
+        if rowcount > 0:
+            self.rows += rowcount
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> dict[str, int]:
+        """
+        Return the statements executed at least threshold times, with
+        their counts, most frequent first.
+        """
+        repeated = [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+        return dict(sorted(repeated, key=lambda item: item[1], reverse=True))
+
+    def as_dict(self) -> dict[str, int]:
+        """
+        Return the counters.
+        """
+        return {"queries": self.queries, "rows": self.rows, "commits": self.commits}
+
+    def headers(self) -> list[tuple[bytes, bytes]]:
+        """
+        Return the counters as X-Mock-Queries, X-Mock-Rows and
+        X-Mock-Commits response headers.
+        """
+        return [
+            (b"x-mock-queries", str(self.queries).encode()),
+            (b"x-mock-rows", str(self.rows).encode()),
+            (b"x-mock-commits", str(self.commits).encode()),
+        ]
+
+
+# The QueryStats of the current request, set by InstrumentationMiddleware.
+# Starlette copies the context into the threadpool that runs sync handlers,
+# and SQLAlchemy into the greenlets that run async sessions, so queries
+# are attributed to the request that issued them.
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+# QueryStats that record every query of the process, from any thread.
+# See collect_queries().
+_collectors: list[QueryStats] = []
+_collectors_lock = threading.Lock()
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """
+    # Summary
+
+    Yield a QueryStats that records every query executed by the process,
+    in any thread, within the with block.
+
+    Use this where the queries are not issued in the caller's context,
+    e.g. requests sent through a TestClient, which runs the app in a
+    thread of its own.
+    """
+    stats = QueryStats()
+    with _collectors_lock:
+        _collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        with _collectors_lock:
+            _collectors.remove(stats)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument,too-many-arguments
+    if context is not None and (_collectors or current_query_stats.get() is not None):
+        context.mock_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument,too-many-arguments
+    stats = current_query_stats.get()
+    if stats is None and not _collectors:
+        return
+    start = getattr(context, "mock_query_start", None)
+    seconds = time.perf_counter() - start if start is not None else 0.0
+    rowcount = cursor.rowcount
+    if stats is not None:
+        stats.record_query(statement, rowcount, seconds)
+    if _collectors:
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.record_query(statement, rowcount, seconds)
+
+
+def _commit(conn):  # pylint: disable=unused-argument
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.commits += 1
+    if _collectors:
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.commits += 1
+
+
+def count_queries(db_engine: Engine) -> None:
+    """
+    # Summary
+
+    Count the queries and commits of db_engine in the current request's
+    QueryStats, and in those of collect_queries().
+
+    The listeners run for every statement of db_engine, so they are added
+    only to the mock's own engines, rather than to every Engine of the
+    process, and return at once when no QueryStats is recording.  Adding
+    them twice to the same engine has no effect.
+    """
+    for name, listener in (("before_cursor_execute", _before_cursor_execute), ("after_cursor_execute", _after_cursor_execute), ("commit", _commit)):
+        if not event.contains(db_engine, name, listener):
+            event.listen(db_engine, name, listener)
+
+
+class RouteQueryStats:
+    """
+    # Summary
+
+    The query counters of the requests of one route.
+    """
+
+    __slots__ = ("requests", "queries", "rows", "commits", "max_queries", "n_plus_one")
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.rows = 0
+        self.commits = 0
+        self.max_queries = 0
+        self.n_plus_one: dict[str, int] = {}
+
+
+class QueryStatsRegistry:
+    """
+    # Summary
+
+    Aggregate the QueryStats of each request by route, for /mock/metrics.
+
+    ## Methods
+
+    - record: Add the QueryStats of a request.
+    - clear: Discard the aggregates.
+    - stats: Return the aggregates, by route.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._routes: dict[str, RouteQueryStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        """
+        Add stats, of a request handled by route.
+        """
+        repeated = stats.repeated() if stats.queries >= N_PLUS_ONE_THRESHOLD else {}
+        with self._lock:
+            totals = self._routes.get(route)
+            if totals is None:
+                totals = self._routes[route] = RouteQueryStats()
+            totals.requests += 1
+            totals.queries += stats.queries
+            totals.rows += stats.rows
+            totals.commits += stats.commits
+            totals.max_queries = max(totals.max_queries, stats.queries)
+            for statement, count in repeated.items():
+                totals.n_plus_one[statement] = max(totals.n_plus_one.get(statement, 0), count)
+
+    def clear(self) -> None:
+        """
+        Discard the aggregates.
+        """
+        with self._lock:
+            self._routes.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the aggregates, by route.
+
+        n_plus_one maps each statement a single request of the route
+        executed at least N_PLUS_ONE_THRESHOLD times to the most times it
+        did.
+        """
+        with self._lock:
+            return {
+                route: {
+                    "requests": totals.requests,
+                    "queries": totals.queries,
+                    "rows": totals.rows,
+                    "commits": totals.commits,
+                    "queries_per_request": totals.queries / totals.requests,
+                    "max_queries": totals.max_queries,
+                    "n_plus_one": dict(totals.n_plus_one),
+                }
+                for route, totals in sorted(self._routes.items())
+            }
+
+
+query_stats_registry = QueryStatsRegistry()
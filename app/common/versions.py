@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+In-process version tracking for conditional GETs, so that a request with
+a matching If-None-Match can be answered with 304 Not Modified without
+querying the database.
+"""
+
+import secrets
+import threading
+import weakref
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy.engine import Engine
+
+from .cache import cache_engine, cache_registry
+from .functions.conditional import build_etag, etag_matches
+
+# A resource key is (kind, name).  e.g. ("inventory", "F1")
+ResourceKey = tuple[str, str]
+
+
+class EngineVersions:
+    """
+    # Summary
+
+    The resource generations and recorded ETags of one database engine.
+
+    token is random, so that ETags built from the generations of one
+    EngineVersions never match those of another, e.g. after a restart, a
+    clear(), or for another engine that happens to reach the same
+    generations.
+    """
+
+    def __init__(self):
+        self.token = secrets.token_hex(8)
+        self.generations: dict[ResourceKey, int] = {}
+        self.etags: dict[tuple[ResourceKey, str], tuple[int, str]] = {}
+
+
+class ResourceVersions:
+    """
+    # Summary
+
+    Track a generation counter per resource key, per database engine, and
+    the ETags built from them.
+
+    Handlers that modify a resource call bump() for its key after they
+    commit.  Handlers that return a resource read its generation before
+    they query the database, so an ETag never describes a state older than
+    the body it is returned with.  They check that the resource exists
+    (e.g. through FabricResolver) before answering 304, since a resource
+    deleted outside of the handlers does not advance its generation.
+
+    ## Resource keys
+
+    - ("fabric", fabric_name): A v1 fabric.
+    - ("fabrics", ""): The list of v1 fabrics.
+    - ("fabric_v2", fabric_name): A v2 fabric.
+    - ("fabrics_v2", ""): The list of v2 fabrics.
+    - ("inventory", fabric_name): The switches in a v1 fabric, and their overview.
+
+    ## Methods
+
+    - generation: Return the current generation of a key.
+    - bump: Advance the generation of one or more keys.
+    - generation_etag: Return the ETag for a generation of a key.
+    - current_etag: Return the ETag for the current generation of a key.
+    - etag: Return the ETag recorded for the current generation of a key, or None.
+    - record: Record an ETag, e.g. derived from a database column, for a generation of a key.
+    - not_modified: Return True if If-None-Match matches an ETag.
+    - clear: Forget all generations and ETags.  No ETag issued before matches after.
+    - stats: Return the statistics.
+
+    ## Example Usage
+
+    ```python
+    etag = resource_versions.current_etag(db_engine, ("inventory", fabric_name), str(request.url))
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._engines: weakref.WeakKeyDictionary[Engine, EngineVersions] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.bumps = 0
+        self.not_modified_count = 0
+
+    def _versions(self, db_engine: Engine) -> EngineVersions:
+        db_engine = cache_engine(db_engine)
+        versions = self._engines.get(db_engine)
+        if versions is None:
+            versions = EngineVersions()
+            self._engines[db_engine] = versions
+        return versions
+
+    def generation(self, db_engine: Engine, key: ResourceKey) -> int:
+        """
+        Return the current generation of key in db_engine.
+        """
+        with self._lock:
+            return self._versions(db_engine).generations.get(key, 0)
+
+    def bump(self, db_engine: Engine, *keys: ResourceKey) -> None:
+        """
+        Advance the generation of each of keys in db_engine, which
+        invalidates their ETags.  Call this after committing a change.
+        """
+        with self._lock:
+            versions = self._versions(db_engine)
+            for key in dict.fromkeys(keys):
+                versions.generations[key] = versions.generations.get(key, 0) + 1
+                self.bumps += 1
+
+    def generation_etag(self, db_engine: Engine, key: ResourceKey, generation: int, variant: str = "") -> str:
+        """
+        Return the strong ETag for generation of key in db_engine.
+
+        variant distinguishes representations of the same generation,
+        e.g. the query string of the request.
+        """
+        with self._lock:
+            token = self._versions(db_engine).token
+        return build_etag(f"{token}:{key[0]}:{key[1]}:{generation}:{variant}".encode())
+
+    def current_etag(self, db_engine: Engine, key: ResourceKey, variant: str = "") -> str:
+        """
+        Return the strong ETag for the current generation of key in
+        db_engine.  Call this before querying the database for the
+        resource.
+        """
+        return self.generation_etag(db_engine, key, self.generation(db_engine, key), variant)
+
+    def etag(self, db_engine: Engine, key: ResourceKey, variant: str = "") -> str | None:
+        """
+        Return the ETag recorded for the current generation of key in
+        db_engine, or None.
+        """
+        with self._lock:
+            versions = self._versions(db_engine)
+            recorded = versions.etags.get((key, variant))
+            if recorded is None or recorded[0] != versions.generations.get(key, 0):
+                return None
+            return recorded[1]
+
+    def record(self, db_engine: Engine, key: ResourceKey, generation: int, etag: str, variant: str = "") -> None:
+        """
+        Record etag for generation of key in db_engine.  The ETag is
+        returned by etag() until key is bumped.
+        """
+        with self._lock:
+            self._versions(db_engine).etags[(key, variant)] = (generation, etag)
+
+    def not_modified(self, if_none_match: str | None, etag: str | None) -> bool:
+        """
+        Return True if if_none_match matches etag, i.e. the handler should
+        return not_modified_response(etag).
+        """
+        if etag is None or not etag_matches(if_none_match, etag):
+            return False
+        with self._lock:
+            self.not_modified_count += 1
+        return True
+
+    def clear(self) -> None:
+        """
+        Forget all generations and ETags.
+        """
+        with self._lock:
+            self._engines.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the statistics.
+
+        not_modified counts the requests answered with 304 Not Modified.
+        """
+        with self._lock:
+            return {
+                "entries": sum(len(versions.generations) for versions in self._engines.values()),
+                "etags": sum(len(versions.etags) for versions in self._engines.values()),
+                "bumps": self.bumps,
+                "not_modified": self.not_modified_count,
+            }
+
+
+resource_versions = ResourceVersions()
+cache_registry.register("versions", resource_versions)
+
+
+def not_modified_response(etag: str, headers: dict[str, str] | None = None) -> Response:
+    """
+    # Summary
+
+    Return a 304 Not Modified response for etag.
+    """
+    return Response(status_code=304, headers={**(headers or {}), "ETag": etag})
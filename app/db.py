@@ -1,26 +1,379 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from contextvars import ContextVar
+
+import aiosqlite
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .common.enums.db import DB_ECHO_ENV_VAR, DB_FILE_ENV_VAR, DB_PROFILE_ENV_VAR, DbProfileEnum
+from .common.query_stats import count_queries
+from .v1.models.fabric import migrate_fabric_table
 
-sqlite_file_name = "database.db"
+sqlite_file_name = os.environ.get(DB_FILE_ENV_VAR, "database.db")
 sqlite_url = f"sqlite:///{sqlite_file_name}"
+sqlite_shared_cache_name = "ndfc_mock"
 
 connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, echo=True, connect_args=connect_args)
+
+# Pragmas applied to every new DBAPI connection, per profile.
+# cache_size is negative, so it is expressed in KiB (64 MiB).
+db_profile_pragmas: dict[DbProfileEnum, dict[str, str | int]] = {
+    DbProfileEnum.file: {},
+    DbProfileEnum.memory: {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+    },
+    DbProfileEnum.wal: {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+    },
+    DbProfileEnum.shared: {
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+    },
+}
+
+# The Session shared by the requests of a /mock/batch, while it runs.
+# See begin_batch().
+batch_session: ContextVar[Session | None] = ContextVar("batch_session", default=None)
+
+# Held while a /mock/batch is open, so that one batch runs at a time.
+# See begin_batch() and check_batch_open().
+batch_lock = threading.Lock()
+
+# Keeps named shared-cache in-memory databases alive for the life of the
+# process.  SQLite discards such a database when its last connection closes.
+shared_cache_anchors: dict[str, sqlite3.Connection] = {}
+
+
+def get_db_profile() -> DbProfileEnum:
+    """
+    # Summary
+
+    Return the database engine profile selected by the NDFC_MOCK_DB_PROFILE
+    environment variable.  Defaults to DbProfileEnum.file.
+
+    ## Raises
+
+    ValueError if the environment variable contains an unknown profile.
+    """
+    value = os.environ.get(DB_PROFILE_ENV_VAR, DbProfileEnum.file.value).strip().lower()
+    try:
+        return DbProfileEnum(value)
+    except ValueError as error:
+        msg = f"Invalid {DB_PROFILE_ENV_VAR}: {value}. "
+        msg += f"Expected one of {','.join(profile.value for profile in DbProfileEnum)}."
+        raise ValueError(msg) from error
+
+
+def get_db_echo(profile: DbProfileEnum) -> bool:
+    """
+    # Summary
+
+    Return True if SQL statements should be echoed to stdout.
+
+    The NDFC_MOCK_DB_ECHO environment variable takes precedence.  Otherwise,
+    echo is enabled only for DbProfileEnum.file, which preserves the original
+    behavior of this application.
+    """
+    value = os.environ.get(DB_ECHO_ENV_VAR)
+    if value is None:
+        return profile == DbProfileEnum.file
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def set_sqlite_pragmas(db_engine: Engine, pragmas: dict[str, str | int]) -> None:
+    """
+    # Summary
+
+    Register a connect listener on db_engine that applies pragmas to each
+    new DBAPI connection.
+    """
+    if not pragmas:
+        return
+
+    @event.listens_for(db_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+
+def build_engine(profile: DbProfileEnum, echo: bool | None = None, file_name: str | None = None, shared_cache_name: str | None = None) -> Engine:
+    """
+    # Summary
+
+    Build a SQLAlchemy engine for profile.
+
+    ## Parameters
+
+    - profile: The DbProfileEnum to build.
+    - echo: Echo SQL statements.  If None, get_db_echo(profile) is used.
+    - file_name: Database file for DbProfileEnum.file and DbProfileEnum.wal.
+    - shared_cache_name: Database name for DbProfileEnum.shared.
+    """
+    if echo is None:
+        echo = get_db_echo(profile)
+    if file_name is None:
+        file_name = sqlite_file_name
+    if shared_cache_name is None:
+        shared_cache_name = sqlite_shared_cache_name
+
+    if profile == DbProfileEnum.memory:
+        # The database exists only on its one connection, which requests take in turn.
+        db_engine = create_engine("sqlite://", echo=echo, connect_args=connect_args, poolclass=QueuePool, pool_size=1, max_overflow=0)
+    elif profile == DbProfileEnum.shared:
+        uri = f"file:{shared_cache_name}?mode=memory&cache=shared"
+        if shared_cache_name not in shared_cache_anchors:
+            shared_cache_anchors[shared_cache_name] = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        db_engine = create_engine(f"sqlite:///{uri}&uri=true", echo=echo, connect_args=connect_args, poolclass=QueuePool, pool_size=10, max_overflow=30)
+    else:
+        db_engine = create_engine(f"sqlite:///{file_name}", echo=echo, connect_args=connect_args)
+
+    set_sqlite_pragmas(db_engine, db_profile_pragmas[profile])
+    count_queries(db_engine)
+    return db_engine
+
+
+class PooledDbapiConnection:
+    """
+    # Summary
+
+    Stand in for the DBAPI connection of pooled, a connection checked out
+    of a pool, except that close() returns pooled to its pool rather than
+    closing the DBAPI connection.
+
+    build_async_engine() hands this to aiosqlite, so that an aiosqlite
+    connection holds its pool slot until it is closed.
+    """
+
+    def __init__(self, pooled) -> None:
+        object.__setattr__(self, "pooled", pooled)
+
+    def __getattr__(self, name):
+        return getattr(self.pooled.dbapi_connection, name)
+
+    def __setattr__(self, name, value) -> None:
+        setattr(self.pooled.dbapi_connection, name, value)
+
+    def close(self) -> None:
+        """
+        # Summary
+
+        Return the connection to its pool.
+        """
+        self.pooled.close()
+
+
+def is_private_memory_database(db_engine: Engine) -> bool:
+    """
+    # Summary
+
+    Return True if db_engine is a private in-memory database, which exists
+    only on the connection of db_engine (DbProfileEnum.memory).
+    """
+    return db_engine.url.database in (None, "", ":memory:")
 
 
-def get_session():
+def build_async_engine(db_engine: Engine, pragmas: dict[str, str | int] | None = None) -> AsyncEngine:
+    """
+    # Summary
+
+    Build an aiosqlite AsyncEngine for the database of db_engine.
+
+    If db_engine is a private in-memory database (DbProfileEnum.memory),
+    the database exists only on the connection of db_engine, so each
+    connection of the AsyncEngine checks that connection out of the pool
+    of db_engine and wraps it, rather than opening a new (empty) database.
+    Since the memory profile's pool has one slot, the sync and async
+    engines then take turns on the connection, one transaction at a time.
+    Otherwise, the AsyncEngine connects to the URL of db_engine with
+    aiosqlite.
+
+    ## Parameters
+
+    - db_engine: The synchronous engine, as returned by build_engine().
+    - pragmas: Pragmas to apply to each new aiosqlite connection.  The
+      pragmas of db_engine already apply to an in-memory database.
+
+    ## Notes
+
+    -   An async connection waits for the slot in a worker thread, so
+        that the event loop is not blocked meanwhile.
+    """
+    url = db_engine.url.set(drivername="sqlite+aiosqlite")
+    if is_private_memory_database(db_engine):
+
+        async def async_creator() -> aiosqlite.Connection:
+            pooled = await asyncio.to_thread(db_engine.raw_connection)
+            return await aiosqlite.Connection(lambda: PooledDbapiConnection(pooled), iter_chunk_size=64)
+
+        db_async_engine = create_async_engine(url, echo=db_engine.echo, poolclass=NullPool, async_creator=async_creator)
+    else:
+        db_async_engine = create_async_engine(url, echo=db_engine.echo, connect_args=connect_args)
+        set_sqlite_pragmas(db_async_engine.sync_engine, pragmas or {})
+    count_queries(db_async_engine.sync_engine)
+    return db_async_engine
+
+
+engine = build_engine(get_db_profile())
+async_engine = build_async_engine(engine, db_profile_pragmas[get_db_profile()])
+
+
+def http_exception_503_batch_open() -> HTTPException:
+    """
+    # Summary
+
+    Return an HTTPException (503) for a request refused while a
+    /mock/batch is open.
+    """
+    detail = "A /mock/batch is in progress.  Retry after it ends."
+    return HTTPException(status_code=503, detail=detail, headers={"Retry-After": "1"})
+
+
+def check_batch_open(request: Request, db_engine: Engine) -> None:
+    """
+    # Summary
+
+    Raise HTTPException (503) if a /mock/batch is open, request is not one
+    of its requests, and request would otherwise wait for the batch.
+
+    The batch holds the database write lock until it ends, and, with the
+    memory profile, the database's only connection.  Requests outside the
+    batch that may write (any method but GET and HEAD), and all requests
+    with the memory profile, are therefore refused.  With the other
+    profiles, GET and HEAD requests run as usual, and see the database as
+    it was before the batch.
+    """
+    if not batch_lock.locked() or batch_session.get() is not None:
+        return
+    if request.method in ("GET", "HEAD") and not is_private_memory_database(db_engine):
+        return
+    raise http_exception_503_batch_open()
+
+
+def get_session(request: Request):
     """
     # Summary
 
     yield a database session
+
+    Within a /mock/batch, yield the batch's Session instead, so that the
+    request runs in the batch's transaction.  Outside it, see
+    check_batch_open().
     """
+    session = batch_session.get()
+    if session is not None:
+        yield session
+        return
+    check_batch_open(request, engine)
     with Session(engine) as session:
         yield session
 
 
-def create_db_and_tables():
+async def get_async_session(request: Request):
+    """
+    # Summary
+
+    yield an asyncio database session
+
+    Use this from `async def` handlers, so that waiting on the database
+    (e.g. for the write lock) does not block the event loop.  See
+    check_batch_open().
+    """
+    check_batch_open(request, engine)
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def begin_batch(db_engine: Engine) -> Session:
+    """
+    # Summary
+
+    Begin a transaction on a new connection of db_engine, and return a
+    Session in which session.commit() and session.rollback() only release,
+    or roll back to, a savepoint of that transaction.  Pass the Session to
+    end_batch() to commit or roll back the transaction.
+
+    batch_lock is held until end_batch(), so that check_batch_open()
+    refuses the requests that would otherwise write within, or wait for,
+    the batch.
+
+    ## Raises
+
+    HTTPException (503) if another batch is open.
+
+    ## Notes
+
+    -   pysqlite does not begin a transaction before SAVEPOINT, so the
+        first RELEASE would commit.  The transaction is therefore begun
+        explicitly, with BEGIN IMMEDIATE, which also takes the write lock
+        up front, so the batch cannot deadlock with another writer.
+        BEGIN IMMEDIATE waits for the requests that were already writing
+        when the batch began.
+    """
+    if not batch_lock.acquire(blocking=False):
+        raise http_exception_503_batch_open()
+    try:
+        connection = db_engine.connect()
+        try:
+            connection.begin()
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        except Exception:
+            connection.close()
+            raise
+    except Exception:
+        batch_lock.release()
+        raise
+    return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+
+def end_batch(session: Session, commit: bool) -> None:
+    """
+    # Summary
+
+    Commit, or roll back, the transaction of a Session returned by
+    begin_batch(), close its connection, and release batch_lock.
+    """
+    connection = session.bind
+    transaction = connection.get_transaction()
+    session.close()
+    try:
+        if commit:
+            transaction.commit()
+        else:
+            transaction.rollback()
+    finally:
+        connection.close()
+        batch_lock.release()
+
+
+def create_db_and_tables(db_engine: Engine | None = None):
     """
     # Summary
 
     Generate the database
+
+    A fabric table created by an earlier version, with one column per
+    nvPairs field, is first migrated by migrate_fabric_table(), so an
+    existing database file keeps its fabrics.
     """
-    SQLModel.metadata.create_all(engine)
+    if db_engine is None:
+        db_engine = engine
+    migrated = migrate_fabric_table(db_engine)
+    if migrated is not None:
+        print(f"Migrated {migrated} fabric(s) to the nvPairsJson fabric table layout")
+    SQLModel.metadata.create_all(db_engine)
@@ -1,6 +1,16 @@
 #!/usr/bin/env python
 # pylint: disable=unused-import
 from .app import app
+from .common.instrumentation import InstrumentationMiddleware
+from .common.metrics import instrument_endpoints
+from .mock.endpoints import batch as mock_batch
+from .mock.endpoints import caches as mock_caches
+from .mock.endpoints import journal as mock_journal
+from .mock.endpoints import metrics as mock_metrics
+from .mock.endpoints import profiles as mock_profiles
+from .mock.endpoints import prometheus
+from .mock.endpoints import scenario as mock_scenario
+from .mock.endpoints import snapshots as mock_snapshots
 from .v1.endpoints import login
 from .v1.endpoints.cisco.ndfc.api.about import version_get_internal
 from .v1.endpoints.configtemplate.rest.config.templates import config_template_by_name
@@ -48,3 +58,17 @@ app.include_router(fabric_name_get.router, tags=["Switches (v1)"])
 app.include_router(overview_get.router, tags=["Switches (v1)"])
 app.include_router(switch_remove.router, tags=["Switches (v1)"])
 app.include_router(config_template_by_name.router, tags=["Templates (v1)"])
+app.include_router(mock_batch.router, tags=["Mock"])
+app.include_router(mock_caches.router, tags=["Mock"])
+app.include_router(mock_journal.router, tags=["Mock"])
+app.include_router(mock_metrics.router, tags=["Mock"])
+app.include_router(mock_profiles.router, tags=["Mock"])
+app.include_router(mock_scenario.router, tags=["Mock"])
+app.include_router(mock_snapshots.router, tags=["Mock"])
+app.include_router(prometheus.router, tags=["Mock"])
+
+instrument_endpoints(app)
+
+# One middleware instruments every request, and calls the journal and
+# profiler middlewares only for the requests they record or profile.
+app.add_middleware(InstrumentationMiddleware)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+from typing import Any, Literal
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+
+from ...common.cache import cache_engine, cache_registry
+from ...db import batch_session, begin_batch, end_batch, get_async_session, get_session
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+# The largest number of requests accepted in one batch.
+BATCH_MAX_REQUESTS = 10000
+
+
+class BatchRequestItem(BaseModel):
+    """
+    # Summary
+
+    One request of a batch.
+
+    - path: The request path, optionally with a query string.
+    - body: The JSON request body, if any.
+    - headers: Additional request headers, e.g. Accept.
+    """
+
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str
+    body: Any = None
+    headers: dict[str, str] = Field(default_factory=dict)
+
+
+class BatchRequest(BaseModel):
+    """
+    # Summary
+
+    The body of a /mock/batch request.
+
+    If atomic is True, the first request that fails (status >= 400) rolls
+    back the whole batch, and the requests after it are skipped.
+    Otherwise, only the changes of the failed request are rolled back,
+    and the remaining requests run.
+    """
+
+    requests: list[BatchRequestItem] = Field(min_length=1, max_length=BATCH_MAX_REQUESTS)
+    atomic: bool = True
+
+
+class BatchResponseItem(BaseModel):
+    """
+    # Summary
+
+    The result of one request of a batch.  status and body are None if the
+    request was skipped.
+    """
+
+    method: str
+    path: str
+    status: int | None = None
+    body: Any = None
+
+
+def uses_dependency(dependant: Dependant, call: Any) -> bool:
+    """
+    # Summary
+
+    Return True if dependant, or any of its sub-dependencies, depends on
+    call.
+    """
+    if dependant.call is call:
+        return True
+    return any(uses_dependency(dependency, call) for dependency in dependant.dependencies)
+
+
+def find_route(app: FastAPI, method: str, path: str) -> APIRoute | None:
+    """
+    # Summary
+
+    Return the APIRoute of app that handles method and path, or None.
+    """
+    scope = {"type": "http", "method": method, "path": path.split("?", 1)[0], "root_path": ""}
+    for route in app.router.routes:
+        if isinstance(route, APIRoute) and route.matches(scope)[0] == Match.FULL:
+            return route
+    return None
+
+
+def build_response_body(response: httpx.Response) -> Any:
+    """
+    # Summary
+
+    Return the body of response: decoded JSON if it is JSON, its text
+    otherwise, or None if it is empty.
+    """
+    if not response.content:
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+async def dispatch(client: httpx.AsyncClient, app: FastAPI, item: BatchRequestItem) -> BatchResponseItem:
+    """
+    # Summary
+
+    Send item to app through client, and return its result.
+
+    Handlers that use get_async_session run on a connection of their own,
+    outside the batch's transaction, so their requests are refused with
+    400 rather than run against a database that does not reflect the
+    batch.
+    """
+    route = find_route(app, item.method, item.path)
+    if route is not None and uses_dependency(route.dependant, get_async_session):
+        detail = f"{item.method} {item.path} is not supported in a batch."
+        return BatchResponseItem(method=item.method, path=item.path, status=400, body={"detail": detail})
+    kwargs: dict[str, Any] = {"headers": item.headers}
+    if item.body is not None:
+        kwargs["json"] = item.body
+    response = await client.request(item.method, item.path, **kwargs)
+    return BatchResponseItem(method=item.method, path=item.path, status=response.status_code, body=build_response_body(response))
+
+
+@router.post(
+    "/batch",
+    description="(mock) Run a list of requests in one database transaction.",
+)
+async def mock_batch_post(*, session: Session = Depends(get_session), request: Request, batch: BatchRequest) -> dict[str, Any]:
+    """
+    # Summary
+
+    POST request handler.
+
+    Run the requests in batch, in order, in-process, through the mock's
+    own routes, within one database transaction, and return the result of
+    each.
+
+    ## Path
+
+    /mock/batch
+
+    ## Response
+
+    ```json
+    {
+        "committed": true,
+        "results": [
+            {"method": "POST", "path": "/appcenter/.../fabrics/F1/Easy_Fabric", "status": 200, "body": {"id": 1, "nvPairs": {}}}
+        ]
+    }
+    ```
+
+    ## Notes
+
+    -   Each request's session.commit() releases a savepoint.  The batch
+        is committed once, after the last request.
+    -   The in-process caches are cleared when the batch ends.  If it is
+        rolled back, they may hold entries for the rolled back changes.
+        If it is committed, its requests bumped versions and invalidated
+        caches before their changes were visible to other connections, so
+        a request outside the batch may have cached the state before it,
+        e.g. under a bumped version.
+    -   Batches cannot be nested.  One batch runs at a time, and, while it
+        runs, other requests that may write, and all other requests with
+        the memory profile, are refused with 503 (see check_batch_open()).
+    """
+    if batch_session.get() is not None:
+        raise HTTPException(status_code=400, detail="/mock/batch cannot be nested.")
+
+    db_session = await run_in_threadpool(begin_batch, cache_engine(session.get_bind()))
+    token = batch_session.set(db_session)
+    results: list[BatchResponseItem] = []
+    failed = False
+    try:
+        transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://ndfc-mock") as client:
+            for item in batch.requests:
+                if failed and batch.atomic:
+                    results.append(BatchResponseItem(method=item.method, path=item.path))
+                    continue
+                result = await dispatch(client, request.app, item)
+                if result.status is not None and result.status >= 400:
+                    failed = True
+                    await run_in_threadpool(db_session.rollback)
+                results.append(result)
+    except BaseException:
+        await run_in_threadpool(end_batch, db_session, False)
+        cache_registry.clear()
+        raise
+    finally:
+        batch_session.reset(token)
+
+    committed = not (failed and batch.atomic)
+    await run_in_threadpool(end_batch, db_session, committed)
+    cache_registry.clear()
+    return {"committed": committed, "results": [result.model_dump() for result in results]}
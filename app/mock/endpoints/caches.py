@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+from typing import Any
+
+from fastapi import APIRouter
+
+from ...common.cache import cache_registry
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.get(
+    "/caches",
+    description="(mock) Get the statistics of the mock's in-process caches.",
+)
+def mock_caches_get() -> dict[str, dict[str, Any]]:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the statistics of each cache registered with cache_registry,
+    keyed by cache name.
+
+    ## Path
+
+    /mock/caches
+    """
+    return cache_registry.stats()
+
+
+@router.delete(
+    "/caches",
+    description="(mock) Discard the entries of the mock's in-process caches.",
+)
+def mock_caches_delete() -> dict[str, str]:
+    """
+    # Summary
+
+    DELETE request handler.
+
+    Discard the entries of each cache registered with cache_registry.
+    Statistics are kept.
+
+    ## Path
+
+    /mock/caches
+    """
+    cache_registry.clear()
+    return {"status": "Success"}
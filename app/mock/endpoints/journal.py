@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from typing import Any
+
+from fastapi import APIRouter
+from starlette.concurrency import run_in_threadpool
+
+from ...common.journal import journal_recorder
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.get(
+    "/journal",
+    description="(mock) Get the configuration and counters of the request journal.",
+)
+def mock_journal_get() -> dict[str, Any]:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the configuration of the request journal, and the number of
+    entries queued, written and dropped, and of journal rotations.
+
+    ## Path
+
+    /mock/journal
+
+    ## Response
+
+    ```json
+    {
+        "enabled": true,
+        "path": "journal/session.jsonl",
+        "sample_rate": 1.0,
+        "max_bytes": 104857600,
+        "backup_count": 5,
+        "queued": 0,
+        "written": 412,
+        "dropped": 0,
+        "rotations": 0
+    }
+    ```
+    """
+    return journal_recorder.status()
+
+
+@router.post(
+    "/journal/flush",
+    description="(mock) Wait until the queued journal entries are written.",
+)
+async def mock_journal_flush_post() -> dict[str, Any]:
+    """
+    # Summary
+
+    POST request handler.
+
+    Wait until every queued journal entry is written to the journal
+    file, e.g. before copying it for replay, and return the journal's
+    status.
+
+    ## Path
+
+    /mock/journal/flush
+    """
+    await run_in_threadpool(journal_recorder.flush)
+    return journal_recorder.status()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+from typing import Any
+
+from fastapi import APIRouter
+
+from ...common.query_stats import query_stats_registry
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.get(
+    "/metrics",
+    description="(mock) Get the SQL query counters of each route.",
+)
+def mock_metrics_get() -> dict[str, dict[str, Any]]:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the queries, rows written and commits of the requests of each
+    route, keyed by "<method> <route>", and the statements that a single
+    request executed often enough to suggest an N+1 query pattern.
+
+    ## Path
+
+    /mock/metrics
+
+    ## Response
+
+    ```json
+    {
+        "queries": {
+            "POST /appcenter/.../fabrics/{fabric_name}/inventory/discover": {
+                "requests": 2,
+                "queries": 24,
+                "rows": 16,
+                "commits": 2,
+                "queries_per_request": 12.0,
+                "max_queries": 12,
+                "n_plus_one": {}
+            }
+        }
+    }
+    ```
+    """
+    return {"queries": query_stats_registry.stats()}
+
+
+@router.delete(
+    "/metrics",
+    description="(mock) Reset the SQL query counters.",
+)
+def mock_metrics_delete() -> dict[str, str]:
+    """
+    # Summary
+
+    DELETE request handler.
+
+    Discard the query counters of every route.
+
+    ## Path
+
+    /mock/metrics
+    """
+    query_stats_registry.clear()
+    return {"status": "Success"}
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+from typing import Any, Literal
+
+from fastapi import APIRouter, Path
+from fastapi.responses import FileResponse, PlainTextResponse, Response
+
+from ...common.profiler import PROFILE_FILE_SUFFIX, PROFILE_NAME_PATTERN, ProfileSort, request_profiler
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.get(
+    "/profiles",
+    description="(mock) List the request profiles.",
+)
+def mock_profiles_get() -> list[dict[str, Any]]:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the metadata of the profiles of the requests sent with an
+    X-Mock-Profile header, oldest first.
+
+    ## Path
+
+    /mock/profiles
+
+    ## Response
+
+    ```json
+    [{"name": "20250301T120000000000-POST-appcenter_..._fabric_name_template_name", "created": "2025-03-01T12:00:00+00:00", "bytes": 48213}]
+    ```
+    """
+    return request_profiler.list()
+
+
+@router.get(
+    "/profiles/{name}",
+    description="(mock) Get a request profile.",
+    response_class=Response,
+)
+def mock_profile_get(
+    name: str = Path(pattern=PROFILE_NAME_PATTERN),
+    output: Literal["text", "pstats"] = "text",
+    sort: ProfileSort = "cumulative",
+    limit: int = 40,
+) -> Response:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the profile name as a pstats report of the limit functions with
+    the most sort time (default), or as the pstats file, for snakeviz or
+    pstats.Stats().
+
+    ## Path
+
+    /mock/profiles/{name}?output=text|pstats&sort=cumulative|tottime|calls&limit=40
+    """
+    if output == "pstats":
+        request_profiler.verify_exists(name)
+        return FileResponse(request_profiler.path(name), media_type="application/octet-stream", filename=f"{name}{PROFILE_FILE_SUFFIX}")
+    return PlainTextResponse(request_profiler.text(name, sort, limit))
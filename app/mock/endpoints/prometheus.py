@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ...common.metrics import PROMETHEUS_CONTENT_TYPE, metrics_registry
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    description="(mock) Get the request metrics of each route, in the Prometheus text format.",
+    response_class=Response,
+)
+def prometheus_metrics_get() -> Response:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the requests in flight, and the request count, SQL statement
+    count, and latency, database time, serialization time and response
+    size histograms of each route, labelled by method and route template,
+    in the Prometheus text exposition format.
+
+    ## Path
+
+    /metrics
+
+    ## Response
+
+    ```text
+    # TYPE ndfc_mock_http_request_duration_seconds histogram
+    ndfc_mock_http_request_duration_seconds_bucket{method="GET",route="/appcenter/.../fabrics/{fabric_name}",le="0.001"} 41
+    ```
+    """
+    return Response(content=metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.delete(
+    "/metrics",
+    description="(mock) Reset the request metrics.",
+)
+def prometheus_metrics_delete() -> dict[str, str]:
+    """
+    # Summary
+
+    DELETE request handler.
+
+    Discard the metrics of every route.  The requests in flight are kept.
+
+    ## Path
+
+    /metrics
+    """
+    metrics_registry.clear()
+    return {"status": "Success"}
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from ...db import get_session
+from ..scenario import Scenario, load_scenario
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.post(
+    "/scenario",
+    description="(mock) Load fabrics, v1 and v2, and switches, in bulk.",
+)
+def mock_scenario_post(*, session: Session = Depends(get_session), scenario: Scenario) -> dict[str, int]:
+    """
+    # Summary
+
+    POST request handler.
+
+    Load scenario with bulk inserts, in one transaction, and return the
+    number of fabrics, v2 fabrics and switches loaded.  See app/mock/scenario.py
+    for the scenario format.
+
+    ## Path
+
+    /mock/scenario
+
+    ## Response
+
+    ```json
+    {"fabrics": 100, "fabrics_v2": 0, "switches": 50000}
+    ```
+
+    ## Notes
+
+    -   Returns 409, and loads nothing, if a fabric, switch serial number
+        or switch IP address of the scenario already exists.
+    """
+    return load_scenario(session, scenario)
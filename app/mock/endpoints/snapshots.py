@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+from sqlmodel import Session
+
+from ...db import batch_session, get_session
+from ..snapshots import SNAPSHOT_NAME_PATTERN, SnapshotStorage, snapshot_store
+
+router = APIRouter(
+    prefix="/mock",
+)
+
+
+@router.get(
+    "/snapshots",
+    description="(mock) List the database snapshots.",
+)
+def mock_snapshots_get() -> list[dict[str, Any]]:
+    """
+    # Summary
+
+    GET request handler.
+
+    Return the metadata of every snapshot, by name.
+
+    ## Path
+
+    /mock/snapshots
+
+    ## Response
+
+    ```json
+    [{"name": "baseline", "storage": "memory", "created": "2025-03-01T12:00:00+00:00", "bytes": 1052672}]
+    ```
+    """
+    return snapshot_store.list()
+
+
+@router.post(
+    "/snapshots/{name}",
+    description="(mock) Snapshot the database.",
+)
+def mock_snapshot_post(
+    *,
+    session: Session = Depends(get_session),
+    name: str = Path(pattern=SNAPSHOT_NAME_PATTERN),
+    storage: SnapshotStorage = "memory",
+) -> dict[str, Any]:
+    """
+    # Summary
+
+    POST request handler.
+
+    Snapshot the whole database as name, in memory (default) or on disk,
+    replacing any snapshot of that name.
+
+    ## Path
+
+    /mock/snapshots/{name}?storage=memory|disk
+    """
+    return snapshot_store.save(session, name, storage)
+
+
+@router.post(
+    "/snapshots/{name}/restore",
+    description="(mock) Restore the database from a snapshot.",
+)
+def mock_snapshot_restore_post(*, session: Session = Depends(get_session), name: str = Path(pattern=SNAPSHOT_NAME_PATTERN)) -> dict[str, Any]:
+    """
+    # Summary
+
+    POST request handler.
+
+    Replace the whole database with the snapshot name, atomically, and
+    clear the in-process caches.
+
+    ## Path
+
+    /mock/snapshots/{name}/restore
+
+    ## Notes
+
+    -   Returns 404 if there is no snapshot name, 409 within a
+        /mock/batch, whose transaction is still open, and 503 if another
+        connection keeps the database locked.
+    """
+    if batch_session.get() is not None:
+        raise HTTPException(status_code=409, detail=f"Cannot restore snapshot {name} within a /mock/batch.")
+    return snapshot_store.restore(session, name)
+
+
+@router.delete(
+    "/snapshots/{name}",
+    description="(mock) Discard a database snapshot.",
+)
+def mock_snapshot_delete(*, name: str = Path(pattern=SNAPSHOT_NAME_PATTERN)) -> dict[str, str]:
+    """
+    # Summary
+
+    DELETE request handler.
+
+    Discard the snapshot name, in memory or on disk.
+
+    ## Path
+
+    /mock/snapshots/{name}
+    """
+    snapshot_store.delete(name)
+    return {"status": "Success"}
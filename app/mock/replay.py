@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Replay a request journal (see app/common/journal.py) against the mock,
+in-process or over HTTP, and summarize the throughput, latency
+percentiles and errors of each route, to compare with a baseline.
+"""
+
+import asyncio
+import json
+import math
+import time
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+# A route regresses if a latency percentile grows by more than the
+# threshold fraction AND by more than this many milliseconds.  The floor
+# keeps noise on sub-millisecond routes from being reported.
+REPLAY_MIN_DELTA_MS = 0.5
+REPLAY_PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+# A percentile is compared only if at least this many of a route's
+# requests lie above it, e.g. p95 from 100 requests, since one slow
+# request moves a percentile estimated from fewer.
+REPLAY_MIN_TAIL_SAMPLES = 5
+
+
+def read_journal(paths: list[str]) -> list[dict[str, Any]]:
+    """
+    # Summary
+
+    Return the entries of the journal files at paths, in order.  Pass
+    rotated journals oldest first, e.g. session.jsonl.2 session.jsonl.1
+    session.jsonl.
+    """
+    entries = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            entries.extend(json.loads(line) for line in file if line.strip())
+    return entries
+
+
+def route_key(entry: dict[str, Any]) -> str:
+    """
+    Return the "<method> <route>" a journal entry is summarized under.
+    """
+    route = entry.get("route") or "unmatched"
+    return f"{entry['method']} {entry['path'] if route == 'unmatched' else route}"
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile fraction of the sorted values.
+    """
+    if not values:
+        return 0.0
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+class JournalReplayer:
+    """
+    # Summary
+
+    Send the requests of a journal through an httpx.AsyncClient, e.g. one
+    with an httpx.ASGITransport for the app (no sockets), or one with a
+    base_url of a running mock.
+
+    - concurrency: The most requests in flight.  Requests are sent in
+      journal order, but with concurrency above 1 a request may be sent
+      before the one it depends on completes.
+    - speedup: Requests are sent at their recorded offsets from the first
+      request, divided by speedup.  0 sends each request as soon as
+      concurrency allows.
+
+    ## Methods
+
+    - run: Replay the entries, and return a sample per request.
+    - summarize: Return the throughput, and the latency percentiles and error counts of each route.
+
+    ## Example Usage
+
+    ```python
+    replayer = JournalReplayer()
+    replayer.concurrency = 4
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://mock") as client:
+        samples, elapsed = await replayer.run(client, read_journal(["session.jsonl"]))
+    results = replayer.summarize(samples, elapsed)
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.concurrency = 1
+        self.speedup = 0.0
+
+    async def run(self, client: httpx.AsyncClient, entries: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], float]:
+        """
+        Replay entries with client, and return a sample per entry, in
+        journal order, and the elapsed seconds.
+
+        Each sample holds the entry's route key, its recorded and replayed
+        status (None if the request failed), and its latency.
+        """
+        self.validate_properties()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        offsets = self.offsets(entries)
+        start = time.perf_counter()
+
+        async def send(entry: dict[str, Any]) -> dict[str, Any]:
+            request_start = time.perf_counter()
+            try:
+                response = await client.request(entry["method"], self.url(entry), **self.content(entry))
+                status = response.status_code
+            except httpx.HTTPError:
+                status = None
+            finally:
+                semaphore.release()
+            return {"route": route_key(entry), "recorded_status": entry.get("status"), "status": status, "latency_ms": (time.perf_counter() - request_start) * 1000}
+
+        tasks = []
+        for entry, offset in zip(entries, offsets):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(send(entry)))
+        samples = list(await asyncio.gather(*tasks))
+        return samples, time.perf_counter() - start
+
+    def offsets(self, entries: list[dict[str, Any]]) -> list[float]:
+        """
+        Return the seconds after the start of the replay at which each
+        entry is sent.
+        """
+        if not self.speedup or not entries:
+            return [0.0] * len(entries)
+        first = datetime.fromisoformat(entries[0]["time"])
+        return [max((datetime.fromisoformat(entry["time"]) - first).total_seconds() / self.speedup, 0.0) for entry in entries]
+
+    @staticmethod
+    def url(entry: dict[str, Any]) -> str:
+        """
+        Return the path and query string of entry.
+        """
+        return f"{entry['path']}?{entry['query']}" if entry.get("query") else entry["path"]
+
+    @staticmethod
+    def content(entry: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the httpx request arguments for the body of entry.
+        """
+        body = entry.get("body")
+        if body is None:
+            return {}
+        if isinstance(body, str):
+            return {"content": body, "headers": {"content-type": entry.get("content_type") or "text/plain"}}
+        return {"json": body}
+
+    @staticmethod
+    def summarize(samples: list[dict[str, Any]], elapsed: float) -> dict[str, Any]:
+        """
+        # Summary
+
+        Return the totals, and, for each route key, the number of
+        requests, errors (the replayed status differs from the recorded
+        one, or the request failed), error_rate, and latency mean, p50,
+        p95, p99 and max, in milliseconds.
+        """
+        by_route: dict[str, list[dict[str, Any]]] = {}
+        for sample in samples:
+            by_route.setdefault(sample["route"], []).append(sample)
+        routes = {}
+        for route, route_samples in sorted(by_route.items()):
+            latencies = sorted(sample["latency_ms"] for sample in route_samples)
+            errors = sum(1 for sample in route_samples if sample["status"] is None or sample["status"] != sample["recorded_status"])
+            routes[route] = {
+                "requests": len(route_samples),
+                "errors": errors,
+                "error_rate": round(errors / len(route_samples), 4),
+                "mean_ms": round(sum(latencies) / len(latencies), 3),
+                **{name: round(percentile(latencies, fraction), 3) for name, fraction in REPLAY_PERCENTILES.items()},
+                "max_ms": round(latencies[-1], 3),
+            }
+        errors = sum(route["errors"] for route in routes.values())
+        return {
+            "summary": {
+                "requests": len(samples),
+                "errors": errors,
+                "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+                "elapsed_s": round(elapsed, 3),
+                "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+            },
+            "routes": routes,
+        }
+
+    def validate_properties(self) -> None:
+        """
+        Raise ValueError if a property is out of range.
+        """
+        if self.concurrency < 1:
+            raise ValueError(f"{self.class_name}: concurrency must be >= 1. Got {self.concurrency}")
+        if self.speedup < 0:
+            raise ValueError(f"{self.class_name}: speedup must be >= 0. Got {self.speedup}")
+
+
+def compare_to_baseline(results: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.2, min_delta_ms: float = REPLAY_MIN_DELTA_MS) -> list[str]:
+    """
+    # Summary
+
+    Return a description of each regression of results relative to
+    baseline, both as returned by JournalReplayer.summarize():
+
+    - A route's p50, p95 or p99 latency grew by more than threshold (a
+      fraction) and by more than min_delta_ms.  Percentiles with fewer
+      than REPLAY_MIN_TAIL_SAMPLES requests above them, in either, are
+      not compared.
+    - A route's error_rate grew.
+    - The throughput fell by more than threshold.
+
+    Routes in only one of the two are not compared.
+    """
+    regressions = []
+    for route, current in results["routes"].items():
+        previous = baseline["routes"].get(route)
+        if previous is None:
+            continue
+        requests = min(current["requests"], previous["requests"])
+        for name, fraction in REPLAY_PERCENTILES.items():
+            if requests * (1 - fraction) < REPLAY_MIN_TAIL_SAMPLES:
+                continue
+            if current[name] > previous[name] * (1 + threshold) and current[name] - previous[name] > min_delta_ms:
+                regressions.append(f"{route}: {name} {previous[name]:.3f}ms -> {current[name]:.3f}ms")
+        if current["error_rate"] > previous["error_rate"]:
+            regressions.append(f"{route}: error_rate {previous['error_rate']:.2%} -> {current['error_rate']:.2%}")
+    previous_rps = baseline["summary"]["throughput_rps"]
+    current_rps = results["summary"]["throughput_rps"]
+    if current_rps < previous_rps * (1 - threshold):
+        regressions.append(f"throughput {previous_rps} -> {current_rps} requests/s")
+    return regressions
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Declarative scenarios: fabrics (v1 and v2), switches, roles and health
+described in a YAML or JSON file, and loaded into the database with bulk
+inserts rather than one HTTP request per object.
+
+## Scenario format
+
+```yaml
+fabrics:
+  - name: F1
+    template: Easy_Fabric
+    nvPairs:
+      BGP_AS: "65001"
+    switches:
+      - serialNumber: FOX0001AAAA
+        ipAddress: 10.1.1.1
+        hostName: leaf1
+        macAddress: 00:AA:BB:00:00:01
+        model: N9K-C93180YC-EX
+        release: 10.2(5)
+        role: leaf
+        operStatus: Healthy
+        ccStatus: In-Sync
+fabrics_v2:
+  - name: F2
+    category: fabric
+    licenseTier: essentials
+    location: {latitude: 37.4, longitude: -121.9}
+    management: {bgpAsn: "65002", type: vxlanIbgp}
+    telemetryCollectionType: inBand
+    telemetryStreamingProtocol: ipv4
+```
+
+nvPairs are the body of a v1 fabric POST, fabrics_v2 items the body of a
+v2 fabric POST.  Switch fields other than serialNumber and ipAddress are
+optional, and default to the values a v1 discover sets.
+"""
+
+import json
+import os
+from typing import Any, Literal
+
+import yaml
+from fastapi import HTTPException
+from pydantic import BaseModel, Field, field_validator, model_validator
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from ..common.enums.switch import SwitchRoleEnum, SwitchRoleFriendlyEnum
+from ..common.functions.utilities import external_role_to_db
+from ..common.versions import resource_versions
+from ..v1.endpoints.lan_fabric.rest.control.fabrics.inventory.common import build_switch_row, build_switch_row_template, insert_switch_rows
+from ..v1.models.fabric import FabricCreate, FabricDbModelV1
+from ..v1.models.inventory import SwitchDiscoverItem
+from ..v2.endpoints.manage.fabrics.fabric_post import build_db_fabric
+from ..v2.models.fabric import FabricDbModelV2, FabricResponseModel
+
+
+class ScenarioSwitch(BaseModel):
+    """
+    # Summary
+
+    A switch in a v1 fabric of a scenario.
+
+    - hostName: Defaults to serialNumber.
+    - macAddress: The switch MAC address (SwitchDbModel.vdcMac), if any.
+    - role: An external role name, e.g. "leaf" or "border gateway".
+    - operStatus: The switch health.
+    - ccStatus: The configuration sync status.
+    """
+
+    serialNumber: str = Field(min_length=1)
+    ipAddress: str = Field(min_length=1)
+    hostName: str | None = None
+    macAddress: str | None = None
+    model: str = "N9K-C93180YC-EX"
+    release: str = "10.2(5)"
+    role: str = "spine"
+    operStatus: Literal["Healthy", "Major", "Minor"] = "Healthy"
+    ccStatus: Literal["In-Sync", "Out-of-Sync"] = "In-Sync"
+
+    @field_validator("role")
+    @classmethod
+    def validate_role(cls, value: str) -> str:
+        """
+        Verify role is a known external role name.
+        """
+        if value not in external_role_to_db:
+            raise ValueError(f"Invalid role: {value}. Expected one of {sorted(external_role_to_db)}")
+        return value
+
+
+class ScenarioFabric(BaseModel):
+    """
+    # Summary
+
+    A v1 fabric of a scenario, and the switches in it.
+
+    nvPairs FABRIC_NAME and FF are replaced by name and template.
+    """
+
+    name: str = Field(min_length=1, max_length=32)
+    template: str = "Easy_Fabric"
+    nvPairs: FabricCreate
+    switches: list[ScenarioSwitch] = Field(default_factory=list)
+
+
+class Scenario(BaseModel):
+    """
+    # Summary
+
+    The fabrics, v1 and v2, of a scenario.
+
+    Fabric names, and switch serial numbers and IP addresses, must be
+    unique within the scenario.
+    """
+
+    fabrics: list[ScenarioFabric] = Field(default_factory=list)
+    fabrics_v2: list[FabricResponseModel] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_unique(self) -> "Scenario":
+        """
+        Verify that names, serial numbers and IP addresses are unique.
+        """
+        checks = {
+            "fabric name": [fabric.name for fabric in self.fabrics],
+            "v2 fabric name": [fabric.name for fabric in self.fabrics_v2],
+            "switch serialNumber": [switch.serialNumber for fabric in self.fabrics for switch in fabric.switches],
+            "switch ipAddress": [switch.ipAddress for fabric in self.fabrics for switch in fabric.switches],
+        }
+        for label, values in checks.items():
+            seen: set[str] = set()
+            duplicates = sorted({value for value in values if value in seen or seen.add(value)})
+            if duplicates:
+                raise ValueError(f"Duplicate {label}: {', '.join(duplicates[:10])}")
+        return self
+
+
+class ScenarioLoader:
+    """
+    # Summary
+
+    Load a Scenario into the database with bulk inserts.
+
+    -   v1 fabrics are inserted with one flush, which assigns their ids.
+    -   Switches of all fabrics are inserted with one executemany(), from
+        rows built by build_switch_row(), as a v1 discover builds them,
+        then given their role, operStatus and ccStatus.  The switch
+        overview is derived from them when it is read.
+    -   v2 fabrics are built by build_db_fabric(), as a v2 POST builds them.
+
+    The caller is responsible for committing the session, and then for
+    calling bump_versions().
+
+    ## Raises
+
+    -   HTTPException 409: A fabric of the scenario already exists.
+
+    ## Example Usage
+
+    ```python
+    loader = ScenarioLoader()
+    loader.session = session
+    loader.scenario = scenario
+    loader.load()
+    session.commit()
+    loader.bump_versions()
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._scenario = None
+        self._session = None
+        self.counts: dict[str, int] = {}
+
+    def load(self) -> None:
+        """
+        Add the fabrics and switches of the scenario to the session.
+        """
+        self.validate_properties()
+        self.verify_fabrics_absent()
+
+        db_fabrics = []
+        for fabric in self.scenario.fabrics:
+            db_fabric = FabricDbModelV1.from_fabric(fabric.nvPairs)
+            setattr(db_fabric, "FABRIC_NAME", fabric.name)
+            setattr(db_fabric, "FF", fabric.template)
+            db_fabrics.append(db_fabric)
+        self.session.add_all(db_fabrics)
+        self.session.add_all([build_db_fabric(fabric) for fabric in self.scenario.fabrics_v2])
+        self.session.flush()
+
+        rows = []
+        for fabric, db_fabric in zip(self.scenario.fabrics, db_fabrics):
+            template = build_switch_row_template(db_fabric)
+            for switch in fabric.switches:
+                rows.append(self.build_row(switch, template))
+        insert_switch_rows(self.session, rows)
+        self.session.flush()
+        self.counts = {"fabrics": len(db_fabrics), "fabrics_v2": len(self.scenario.fabrics_v2), "switches": len(rows)}
+
+    @staticmethod
+    def build_row(switch: ScenarioSwitch, template: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return the SwitchDbModel row of switch, for a bulk insert.
+        """
+        host_name = switch.hostName or switch.serialNumber
+        item = SwitchDiscoverItem(
+            deviceIndex=f"{host_name}({switch.serialNumber})",
+            serialNumber=switch.serialNumber,
+            sysName=host_name,
+            platform=switch.model,
+            version=switch.release,
+            ipaddr=switch.ipAddress,
+        )
+        row = build_switch_row(item, template)
+        role_key = external_role_to_db[switch.role]
+        row["switchRole"] = SwitchRoleFriendlyEnum[role_key].value
+        row["switchRoleEnum"] = SwitchRoleEnum[role_key].value
+        row["operStatus"] = switch.operStatus
+        row["ccStatus"] = switch.ccStatus
+        if switch.macAddress:
+            row["vdcMac"] = switch.macAddress
+        return row
+
+    def verify_fabrics_absent(self) -> None:
+        """
+        Raise HTTPException 409 if a fabric of the scenario already exists.
+        """
+        names = [fabric.name for fabric in self.scenario.fabrics]
+        names_v2 = [fabric.name for fabric in self.scenario.fabrics_v2]
+        # pylint: disable=no-member
+        existing = self.session.exec(select(FabricDbModelV1.FABRIC_NAME).where(FabricDbModelV1.FABRIC_NAME.in_(names))).all()
+        existing_v2 = self.session.exec(select(FabricDbModelV2.name).where(FabricDbModelV2.name.in_(names_v2))).all()
+        # pylint: enable=no-member
+        if existing or existing_v2:
+            raise HTTPException(status_code=409, detail=f"Fabrics already exist: {', '.join(sorted([*existing, *existing_v2]))}")
+
+    def bump_versions(self) -> None:
+        """
+        Advance the resource versions of the loaded fabrics, so that no
+        ETag issued before the load matches.  Call this after committing.
+        """
+        keys = [("fabrics", ""), ("fabrics_v2", "")]
+        for fabric in self.scenario.fabrics:
+            keys.extend([("fabric", fabric.name), ("inventory", fabric.name)])
+        keys.extend(("fabric_v2", fabric.name) for fabric in self.scenario.fabrics_v2)
+        resource_versions.bump(self.session.get_bind(), *keys)
+
+    def validate_properties(self) -> None:
+        """
+        Validate the properties of the class.
+        """
+        if self._scenario is None:
+            raise ValueError("Scenario not set")
+        if self._session is None:
+            raise ValueError("Session not set")
+
+    @property
+    def scenario(self) -> Scenario:
+        """
+        The scenario to load.
+        """
+        return self._scenario
+
+    @scenario.setter
+    def scenario(self, value: Scenario):
+        self._scenario = value
+
+    @property
+    def session(self) -> Session:
+        """
+        Get the session object.
+        """
+        return self._session
+
+    @session.setter
+    def session(self, value: Session):
+        self._session = value
+
+
+def load_scenario(session: Session, scenario: Scenario) -> dict[str, int]:
+    """
+    # Summary
+
+    Load scenario with ScenarioLoader, commit, and return the number of
+    fabrics, v2 fabrics and switches loaded.
+
+    ## Raises
+
+    -   HTTPException 409: A fabric, or a switch serial number or IP
+        address, of the scenario already exists.  Nothing is loaded.
+    """
+    loader = ScenarioLoader()
+    loader.session = session
+    loader.scenario = scenario
+    try:
+        loader.load()
+        session.commit()
+    except IntegrityError as error:
+        session.rollback()
+        raise HTTPException(status_code=409, detail=f"Scenario conflicts with the database: {error.orig}") from error
+    except Exception:
+        session.rollback()
+        raise
+    loader.bump_versions()
+    return loader.counts
+
+
+def read_scenario_file(path: str) -> Scenario:
+    """
+    # Summary
+
+    Read a Scenario from a JSON (.json) or YAML file.
+    """
+    with open(path, encoding="utf-8") as file:
+        if path.endswith(".json"):
+            content = json.load(file)
+        else:
+            # The C loader, if PyYAML was built with it, is ~10x faster for large scenarios.
+            content = yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    return Scenario.model_validate(content or {})
+
+
+def seed_scenario_file(db_engine: Engine, path: str) -> dict[str, int] | None:
+    """
+    # Summary
+
+    Load the scenario in path into db_engine at startup, and return the
+    counts from load_scenario(), or None if the database already holds
+    fabrics (e.g. a file database seeded by a previous run), in which case
+    nothing is loaded.
+    """
+    scenario = read_scenario_file(os.path.expanduser(path))
+    with Session(db_engine) as session:
+        if session.exec(select(FabricDbModelV1.id)).first() is not None or session.exec(select(FabricDbModelV2.name)).first() is not None:
+            return None
+        return load_scenario(session, scenario)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Named snapshots of the whole database, taken and restored with the SQLite
+online backup API, so that a test suite can return the mock to a seeded
+baseline without replaying requests or restarting it.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from fastapi import HTTPException
+from sqlmodel import Session
+
+from ..common.cache import cache_registry
+from ..common.enums.mock import SNAPSHOT_DIR_ENV_VAR
+
+SnapshotStorage = Literal["memory", "disk"]
+
+# Snapshot names are also file names, so keep them to a safe subset.
+SNAPSHOT_NAME_PATTERN = r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$"
+SNAPSHOT_FILE_SUFFIX = ".sqlite3"
+# Seconds a backup waits for a lock held by another connection, as the
+# wal profile's busy_timeout does, before it gives up.
+SNAPSHOT_BUSY_TIMEOUT = 5.0
+
+
+def session_dbapi_connection(session: Session) -> sqlite3.Connection:
+    """
+    # Summary
+
+    Return the sqlite3 connection on which session runs.
+    """
+    return session.connection().connection.dbapi_connection
+
+
+def backup(source: sqlite3.Connection, target: sqlite3.Connection, timeout: float = SNAPSHOT_BUSY_TIMEOUT) -> None:
+    """
+    # Summary
+
+    Copy the main database of source over that of target, in one step.
+
+    sqlite3.Connection.backup() retries for as long as either database is
+    locked, each attempt waiting up to the connection's busy_timeout.
+    This disables the busy_timeouts for the copy, and gives up after
+    timeout seconds instead.
+
+    ## Raises
+
+    -   HTTPException 503: A database stayed locked for timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+
+    def progress(status: int, remaining: int, total: int) -> None:  # pylint: disable=unused-argument
+        if status in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED) and time.monotonic() > deadline:
+            raise TimeoutError
+
+    busy_timeouts = [(connection, connection.execute("PRAGMA busy_timeout").fetchone()[0]) for connection in (source, target)]
+    try:
+        for connection, _ in busy_timeouts:
+            connection.execute("PRAGMA busy_timeout=0")
+        source.backup(target, progress=progress, sleep=0.01)
+    except TimeoutError as error:
+        raise HTTPException(status_code=503, detail=f"The database stayed locked for {timeout} seconds.") from error
+    finally:
+        for connection, busy_timeout in busy_timeouts:
+            connection.execute(f"PRAGMA busy_timeout={busy_timeout}")
+
+
+def database_size(connection: sqlite3.Connection) -> int:
+    """
+    # Summary
+
+    Return the size, in bytes, of the main database of connection.
+    """
+    page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+    page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+    return page_count * page_size
+
+
+class SnapshotStore:
+    """
+    # Summary
+
+    Named snapshots of the database.
+
+    -   memory: The snapshot is an in-memory SQLite database, held by this
+        process.  It is lost when the process exits.
+    -   disk: The snapshot is a SQLite database file, <name>.sqlite3, in
+        directory.  It outlives the process, and is found again by name.
+
+    Taking a snapshot copies every page of the database with one
+    sqlite3.Connection.backup() step, within one read transaction, so the
+    snapshot is consistent.  Restoring copies every page of the snapshot
+    back, within one write transaction on the live database, so other
+    connections see either the old state or the snapshot, never a mix.
+
+    ## Methods
+
+    - save: Snapshot the database of a session.
+    - restore: Replace the database of a session with a snapshot.
+    - delete: Discard a snapshot.
+    - list: Return the metadata of every snapshot.
+
+    ## Notes
+
+    -   The in-process caches are cleared after a restore, as the fabric
+        ids, names and versions they hold may not exist in the snapshot.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._lock = threading.Lock()
+        self._memory: dict[str, tuple[sqlite3.Connection, datetime]] = {}
+        self._directory = os.environ.get(SNAPSHOT_DIR_ENV_VAR, "snapshots")
+        self.busy_timeout = SNAPSHOT_BUSY_TIMEOUT
+
+    def path(self, name: str) -> str:
+        """
+        Return the file of the disk snapshot name.
+        """
+        return os.path.join(self.directory, f"{name}{SNAPSHOT_FILE_SUFFIX}")
+
+    def save(self, session: Session, name: str, storage: SnapshotStorage = "memory") -> dict[str, Any]:
+        """
+        Snapshot the database of session as name, replacing any snapshot
+        of that name, and return its metadata.
+        """
+        self.validate_name(name)
+        source = session_dbapi_connection(session)
+        start = time.perf_counter()
+        with self._lock:
+            if storage == "memory":
+                target = sqlite3.connect(":memory:", check_same_thread=False)
+                backup(source, target, self.busy_timeout)
+                self.discard(name)
+                self._memory[name] = (target, datetime.now(timezone.utc))
+            else:
+                os.makedirs(self.directory, exist_ok=True)
+                # Back up to a temporary file, then rename it, so an existing
+                # snapshot of the same name is replaced atomically.
+                temporary = f"{self.path(name)}.tmp"
+                target = sqlite3.connect(temporary)
+                try:
+                    backup(source, target, self.busy_timeout)
+                finally:
+                    target.close()
+                self.discard(name)
+                os.replace(temporary, self.path(name))
+        return {**self.describe(name), "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    def restore(self, session: Session, name: str) -> dict[str, Any]:
+        """
+        Replace the database of session with the snapshot name, clear the
+        in-process caches, and return the snapshot's metadata.
+
+        ## Raises
+
+        -   HTTPException 404: There is no snapshot name.
+        -   HTTPException 409: The session's connection is in a transaction.
+        -   HTTPException 503: Another connection kept the database locked.
+        """
+        self.validate_name(name)
+        target = session_dbapi_connection(session)
+        if target.in_transaction:
+            raise HTTPException(status_code=409, detail=f"Cannot restore snapshot {name} within an open transaction.")
+        start = time.perf_counter()
+        with self._lock:
+            if name in self._memory:
+                backup(self._memory[name][0], target, self.busy_timeout)
+            elif os.path.isfile(self.path(name)):
+                source = sqlite3.connect(f"file:{self.path(name)}?mode=ro", uri=True)
+                try:
+                    backup(source, target, self.busy_timeout)
+                finally:
+                    source.close()
+            else:
+                raise HTTPException(status_code=404, detail=f"Snapshot {name} not found")
+        # Instances loaded before the restore describe the previous state.
+        session.expunge_all()
+        cache_registry.clear()
+        return {**self.describe(name), "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    def delete(self, name: str) -> None:
+        """
+        Discard the snapshot name.
+
+        ## Raises
+
+        -   HTTPException 404: There is no snapshot name.
+        """
+        self.validate_name(name)
+        with self._lock:
+            if not self.discard(name):
+                raise HTTPException(status_code=404, detail=f"Snapshot {name} not found")
+
+    def discard(self, name: str) -> bool:
+        """
+        Discard the snapshot name, if any, and return True if there was one.
+        The caller holds the lock.
+        """
+        found = False
+        if name in self._memory:
+            self._memory.pop(name)[0].close()
+            found = True
+        if os.path.isfile(self.path(name)):
+            os.remove(self.path(name))
+            found = True
+        return found
+
+    def describe(self, name: str) -> dict[str, Any]:
+        """
+        Return the metadata of the snapshot name.
+        """
+        if name in self._memory:
+            connection, created = self._memory[name]
+            return {"name": name, "storage": "memory", "created": created.isoformat(), "bytes": database_size(connection)}
+        path = self.path(name)
+        created = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+        return {"name": name, "storage": "disk", "created": created.isoformat(), "bytes": os.path.getsize(path)}
+
+    def list(self) -> list[dict[str, Any]]:
+        """
+        Return the metadata of every snapshot, by name.
+        """
+        with self._lock:
+            names = set(self._memory)
+            if os.path.isdir(self.directory):
+                names.update(file_name[: -len(SNAPSHOT_FILE_SUFFIX)] for file_name in os.listdir(self.directory) if file_name.endswith(SNAPSHOT_FILE_SUFFIX))
+            return [self.describe(name) for name in sorted(names) if re.match(SNAPSHOT_NAME_PATTERN, name)]
+
+    def clear(self) -> None:
+        """
+        Discard the memory snapshots.  Disk snapshots are kept.
+        """
+        with self._lock:
+            for connection, _ in self._memory.values():
+                connection.close()
+            self._memory.clear()
+
+    @staticmethod
+    def validate_name(name: str) -> None:
+        """
+        Raise HTTPException 422 if name is not a valid snapshot name.
+        """
+        if not re.match(SNAPSHOT_NAME_PATTERN, name):
+            raise HTTPException(status_code=422, detail=f"Invalid snapshot name {name}. Expected {SNAPSHOT_NAME_PATTERN}")
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the disk snapshots.
+        """
+        return self._directory
+
+    @directory.setter
+    def directory(self, value: str):
+        self._directory = value
+
+
+snapshot_store = SnapshotStore()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Generate synthetic spine/leaf/border gateway topologies, as scenarios
+(see app/mock/scenario.py), for load and scale testing.
+
+A generator is deterministic: the same parameters and seed always yield
+the same scenario.  Serial numbers, MAC addresses and management IP
+addresses are distinct across all fabrics of a scenario.
+"""
+
+import ipaddress
+import random
+from typing import Any
+
+from ..common.functions.utilities import unique_switch_serial_numbers, unique_unicast_mac_addresses
+from .scenario import Scenario
+
+# (value, weight) choices for each switch role.
+ROLE_PLATFORMS: dict[str, list[tuple[str, int]]] = {
+    "spine": [("N9K-C9336C-FX2", 6), ("N9K-C9364C", 3), ("N9K-C9332D-GX2B", 1)],
+    "leaf": [("N9K-C93180YC-EX", 3), ("N9K-C93180YC-FX", 4), ("N9K-C93240YC-FX2", 2), ("N9K-C93360YC-FX2", 1)],
+    "border gateway": [("N9K-C93180YC-FX3", 3), ("N9K-C9336C-FX2", 1)],
+}
+RELEASES: list[tuple[str, int]] = [("10.2(5)", 3), ("10.3(4a)", 5), ("10.4(2)", 2)]
+OPER_STATUSES: list[tuple[str, int]] = [("Healthy", 94), ("Minor", 4), ("Major", 2)]
+CC_STATUSES: list[tuple[str, int]] = [("In-Sync", 95), ("Out-of-Sync", 5)]
+
+# Host name label of each role, e.g. F1-bgw1.
+ROLE_HOST_LABELS = {"spine": "spine", "leaf": "leaf", "border gateway": "bgw"}
+
+
+class TopologyGenerator:
+    """
+    # Summary
+
+    Generate a scenario of fabric_count v1 fabrics, each with
+    switches_per_fabric switches: spines_per_fabric spines,
+    border_gateways_per_fabric border gateways, and leaves.
+
+    Platforms, releases, health and sync status are drawn from weighted
+    mixes (ROLE_PLATFORMS, RELEASES, OPER_STATUSES, CC_STATUSES).
+    Management IP addresses are assigned in order from management_network.
+
+    ## Methods
+
+    - build: Return the scenario as a dict, e.g. to write to a file.
+    - scenario: Return the scenario as a validated Scenario, e.g. to pass to load_scenario().
+
+    ## Example Usage
+
+    ```python
+    generator = TopologyGenerator()
+    generator.seed = 42
+    generator.fabric_count = 2
+    generator.switches_per_fabric = 10000
+    load_scenario(session, generator.scenario())
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self.seed = 0
+        self.fabric_count = 1
+        self.fabric_prefix = "SCALE"
+        self.switches_per_fabric = 64
+        self.spines_per_fabric = 4
+        self.border_gateways_per_fabric = 2
+        self.management_network = "10.0.0.0/8"
+
+    def build(self) -> dict[str, Any]:
+        """
+        Return the scenario as a dict.
+        """
+        self.validate_properties()
+        rng = random.Random(self.seed)
+        total = self.fabric_count * self.switches_per_fabric
+        serial_numbers = unique_switch_serial_numbers(total, rng)
+        mac_addresses = unique_unicast_mac_addresses(total, rng)
+        hosts = ipaddress.IPv4Network(self.management_network).hosts()
+        ip_addresses = [str(next(hosts)) for _ in range(total)]
+        releases = self.choices(rng, RELEASES, total)
+        oper_statuses = self.choices(rng, OPER_STATUSES, total)
+        cc_statuses = self.choices(rng, CC_STATUSES, total)
+        roles = self.build_roles()
+        platforms = {role: self.choices(rng, choices, self.fabric_count * roles.count(role)) for role, choices in ROLE_PLATFORMS.items()}
+
+        fabrics = []
+        index = 0
+        for fabric_index in range(self.fabric_count):
+            fabric_name = f"{self.fabric_prefix}{fabric_index + 1}"
+            role_counts = dict.fromkeys(ROLE_HOST_LABELS, 0)
+            switches = []
+            for role in roles:
+                role_counts[role] += 1
+                switches.append(
+                    {
+                        "serialNumber": serial_numbers[index],
+                        "ipAddress": ip_addresses[index],
+                        "macAddress": mac_addresses[index],
+                        "hostName": f"{fabric_name}-{ROLE_HOST_LABELS[role]}{role_counts[role]}",
+                        "model": platforms[role].pop(),
+                        "release": releases[index],
+                        "role": role,
+                        "operStatus": oper_statuses[index],
+                        "ccStatus": cc_statuses[index],
+                    }
+                )
+                index += 1
+            fabrics.append({"name": fabric_name, "template": "Easy_Fabric", "nvPairs": {"BGP_AS": str(65000 + fabric_index + 1)}, "switches": switches})
+        return {"fabrics": fabrics, "fabrics_v2": []}
+
+    def build_roles(self) -> list[str]:
+        """
+        Return the role of each switch of a fabric, in order.
+        """
+        leaves = self.switches_per_fabric - self.spines_per_fabric - self.border_gateways_per_fabric
+        return ["spine"] * self.spines_per_fabric + ["border gateway"] * self.border_gateways_per_fabric + ["leaf"] * leaves
+
+    @staticmethod
+    def choices(rng: random.Random, weighted: list[tuple[str, int]], count: int) -> list[str]:
+        """
+        Return count values drawn from weighted, (value, weight) tuples.
+        """
+        values, weights = zip(*weighted)
+        return rng.choices(values, weights=weights, k=count)
+
+    def scenario(self) -> Scenario:
+        """
+        Return the scenario as a validated Scenario.
+        """
+        return Scenario.model_validate(self.build())
+
+    def validate_properties(self) -> None:
+        """
+        Validate the properties of the class.
+        """
+        if self.fabric_count < 1:
+            raise ValueError(f"fabric_count must be at least 1. Got {self.fabric_count}")
+        if self.spines_per_fabric < 0 or self.border_gateways_per_fabric < 0:
+            raise ValueError("spines_per_fabric and border_gateways_per_fabric must not be negative")
+        if self.spines_per_fabric + self.border_gateways_per_fabric > self.switches_per_fabric:
+            raise ValueError(f"switches_per_fabric ({self.switches_per_fabric}) is less than spines_per_fabric + border_gateways_per_fabric")
+        hosts = ipaddress.IPv4Network(self.management_network).num_addresses - 2
+        if self.fabric_count * self.switches_per_fabric > hosts:
+            raise ValueError(f"management_network {self.management_network} has {hosts} host addresses, fewer than the {self.fabric_count * self.switches_per_fabric} switches")
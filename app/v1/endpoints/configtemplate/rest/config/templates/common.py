@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+import gzip
+import json
+import os
+import re
+import threading
+
+from fastapi import HTTPException
+
+from .......common.cache import cache_registry
+from .......common.functions.conditional import build_etag
+from .......common.functions.utilities import serialize_json
+from ......models.configtemplate_easy_fabric import V1ConfigtemplateEasyFabricResponseModel
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:
+    brotli = None
+
+TEMPLATES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..", "..", "templates"))
+TEMPLATE_NAME_RE = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$")
+
+
+class TemplateEntry:
+    """
+    # Summary
+
+    A configuration template loaded by TemplateRegistry.
+
+    ## Attributes
+
+    - name: The template name.
+    - model: The validated V1ConfigtemplateEasyFabricResponseModel.
+    - body: The response body, serialized exactly as FastAPI serializes model.
+    - bodies: body keyed by content-encoding.  None is the identity encoding.
+    - etags: The strong ETag of each entry in bodies.
+    - encodings: The available content-encodings, in order of preference.
+    - mtime_ns: st_mtime_ns of the template file when it was loaded.
+    - size: st_size of the template file when it was loaded.
+    """
+
+    def __init__(self, name: str, model: V1ConfigtemplateEasyFabricResponseModel, mtime_ns: int, size: int):
+        self.name = name
+        self.model = model
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.body = serialize_json(model.model_dump(mode="json"))
+        self.bodies: dict[str | None, bytes] = {None: self.body}
+        self.bodies["gzip"] = gzip.compress(self.body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            self.bodies["br"] = brotli.compress(self.body)
+        self.encodings = [encoding for encoding in ("br", "gzip") if encoding in self.bodies]
+        self.etags = {encoding: build_etag(self.body, encoding or "") for encoding in self.bodies}
+
+
+class TemplateRegistry:
+    """
+    # Summary
+
+    Load each configuration template in templates_dir once, and keep the
+    validated model together with its ready-to-send response bodies.
+
+    On each get(), the template file is stat()ed and reloaded only if its
+    mtime or size changed.
+
+    ## Methods
+
+    - get: Return the TemplateEntry for a template name.
+    - clear: Discard all loaded templates.
+    - stats: Return the number of loaded templates, and of loads.
+
+    ## Properties
+
+    - templates_dir: The directory containing <template_name>.json files.
+
+    ## Raises
+
+    HTTPException (404) from get() if the template does not exist, or if
+    its name could resolve outside templates_dir.
+
+    ## Example Usage
+
+    ```python
+    registry = TemplateRegistry()
+    entry = registry.get("Easy_Fabric")
+    print(entry.etags[None])
+    ```
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._templates_dir = TEMPLATES_DIR
+        self._entries: dict[str, TemplateEntry] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def clear(self) -> None:
+        """
+        Discard all loaded templates.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the number of loaded templates, and of loads.
+        """
+        return {"entries": len(self._entries), "loads": self.loads}
+
+    def get(self, name: str) -> TemplateEntry:
+        """
+        # Summary
+
+        Return the TemplateEntry for name, loading it if it is not loaded
+        or if its file changed since it was loaded.
+        """
+        path = self.path(name)
+        try:
+            stat = os.stat(path)
+        except OSError as error:
+            raise HTTPException(status_code=404, detail=f"Template {name} not found.") from error
+
+        entry = self._entries.get(name)
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                return entry
+            try:
+                with open(path, "r", encoding="utf-8") as template:
+                    model = V1ConfigtemplateEasyFabricResponseModel(**json.load(template))
+            except FileNotFoundError as error:
+                raise HTTPException(status_code=404, detail=f"Template {name} not found.") from error
+            entry = TemplateEntry(name, model, stat.st_mtime_ns, stat.st_size)
+            self._entries[name] = entry
+            self.loads += 1
+        return entry
+
+    def path(self, name: str) -> str:
+        """
+        # Summary
+
+        Return the path of the file for template name.
+
+        Names that are not simple file names (e.g. contain "/" or "..")
+        are rejected with a 404, so they cannot address files outside
+        templates_dir.
+        """
+        if not TEMPLATE_NAME_RE.match(name) or ".." in name:
+            raise HTTPException(status_code=404, detail=f"Template {name} not found.")
+        return os.path.join(self.templates_dir, f"{name}.json")
+
+    @property
+    def templates_dir(self) -> str:
+        """
+        The directory containing <template_name>.json files.
+        """
+        return self._templates_dir
+
+    @templates_dir.setter
+    def templates_dir(self, value: str):
+        self._templates_dir = value
+        self.clear()
+
+
+template_registry = TemplateRegistry()
+cache_registry.register("templates", template_registry)
@@ -1,9 +1,9 @@
 #!/usr/bin/env python
-import json
-
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, Response
 
+from .......common.functions.conditional import etag_matches, select_encoding
 from ......models.configtemplate_easy_fabric import V1ConfigtemplateEasyFabricResponseModel
+from .common import template_registry
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates",
@@ -15,15 +15,29 @@ router = APIRouter(
     response_model=V1ConfigtemplateEasyFabricResponseModel,
     description="(v1) Get a configuration template by name.",
 )
-def v1_get_configtemplate_by_name(template_name: str):
+def v1_get_configtemplate_by_name(
+    template_name: str,
+    accept_encoding: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+):
     """
     # Summary
 
     GET request handler.
+
+    ## Notes
+
+    -   The template is served from template_registry, which holds the
+        validated, serialized and compressed body.  The body is identical
+        to the one FastAPI would produce from response_model.
+    -   The ETag of each representation is returned.  A request with a
+        matching If-None-Match receives a 304 with no body.
     """
-    try:
-        with open(f"app/v1/templates/{template_name}.json", "r", encoding="utf-8") as template:
-            response = json.load(template)
-    except FileNotFoundError as error:
-        raise HTTPException(status_code=404, detail=f"Template {template_name} not found.") from error
-    return response
+    entry = template_registry.get(template_name)
+    encoding = select_encoding(accept_encoding, entry.encodings)
+    headers = {"ETag": entry.etags[encoding], "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, entry.etags[encoding]):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=entry.bodies[encoding], media_type="application/json", headers=headers)
@@ -1,4 +1,3 @@
-import copy
 import datetime
 
 
@@ -8,7 +7,7 @@ def build_nv_pairs(fabric):
 
     Build the nvPairs object in a fabric response.
     """
-    return fabric.model_dump()
+    return fabric.nv_pairs()
 
 
 def build_response(fabric):
@@ -20,11 +19,13 @@ def build_response(fabric):
     ## Notes
 
     1. If FabricResponseModel is changed, this function must also be updated
+    2. build_nv_pairs() returns a new dict, so the response shares no
+       state with fabric.
     """
     response = {}
     response["id"] = fabric.id
     response["nvPairs"] = build_nv_pairs(fabric)
-    return copy.deepcopy(response)
+    return response
 
 
 def build_404_response(path: str) -> dict:
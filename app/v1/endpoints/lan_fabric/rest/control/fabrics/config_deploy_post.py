@@ -3,9 +3,9 @@ from pydantic import BaseModel
 from sqlmodel import Session, select
 
 from .......db import get_session
-from ......models.fabric import FabricDbModelV1
 from ......models.inventory import SwitchDbModel
 from .common import build_404_response
+from .fabric_resolver import FabricResolver, get_fabric_resolver
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -30,6 +30,7 @@ class ConfigDeployResponseModel(BaseModel):
 def v1_config_deploy_post(
     *,
     session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
     fabric_name: str,
     switch_id: str,
 ):
@@ -42,7 +43,7 @@ def v1_config_deploy_post(
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/config-deploy{switch_id}
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         path = f"{router.prefix}/{fabric_name}/config-save/{switch_id}"
         raise HTTPException(status_code=404, detail=build_404_response(path))
@@ -1,10 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from sqlmodel import Session, select
 
-from .......db import get_session
-from ......models.fabric import FabricDbModelV1
 from .common import build_404_response
+from .fabric_resolver import FabricResolver, get_fabric_resolver
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -28,7 +26,7 @@ class ConfigSaveResponseModel(BaseModel):
 )
 def v1_fabric_post(
     *,
-    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
     fabric_name: str,
 ):
     """
@@ -40,7 +38,7 @@ def v1_fabric_post(
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/config-save
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         path = f"{router.prefix}/{fabric_name}/config-save"
         raise HTTPException(status_code=404, detail=build_404_response(path))
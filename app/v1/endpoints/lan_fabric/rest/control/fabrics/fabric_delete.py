@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 
+from .......common.versions import resource_versions
 from .......db import get_session
 from ......models.fabric import FabricDbModelV1
 from ......models.inventory import SwitchDbModel
-from ..switches.models.switch_overview import SwitchOverview
 from .common import build_404_response
+from .fabric_resolver import FabricResolver, get_fabric_resolver
+from .fabric_response_cache import fabric_response_cache
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -13,7 +15,12 @@ router = APIRouter(
 
 
 @router.delete("/{fabric_name}", description="(v1) Delete a fabric by name.")
-def v1_fabric_delete(*, session: Session = Depends(get_session), fabric_name: str):
+def v1_fabric_delete(
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabric_name: str,
+):
     """
     # Summary
 
@@ -23,7 +30,7 @@ def v1_fabric_delete(*, session: Session = Depends(get_session), fabric_name: st
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         path = f"{router.prefix}/{fabric_name}"
         raise HTTPException(status_code=404, detail=build_404_response(path))
@@ -33,10 +40,9 @@ def v1_fabric_delete(*, session: Session = Depends(get_session), fabric_name: st
         msg = "Failed to delete the fabric. Please check Events for possible reasons."
         raise HTTPException(status_code=500, detail=msg)
 
-    overview = SwitchOverview()
-    overview.fabric = fabric_name
-    overview.session = session
-    overview.delete()
-    session.delete(db_fabric)
+    session.exec(delete(FabricDbModelV1).where(FabricDbModelV1.id == fabric_id))
     session.commit()
+    resolver.invalidate(fabric_name)
+    fabric_response_cache.invalidate(session.get_bind(), fabric_id)
+    resource_versions.bump(session.get_bind(), ("fabric", fabric_name), ("fabrics", ""), ("inventory", fabric_name))
     return {f"Fabric '{fabric_name}' is deleted successfully!"}
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlmodel import Session, select
 
+from .......common.functions.conditional import build_last_modified
+from .......common.versions import not_modified_response, resource_versions
 from .......db import get_session
 from ......models.fabric import FabricDbModelV1, FabricResponseModel
-from .common import build_response
+from .fabric_response_cache import build_fabric_etag, build_fabric_responses_json
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -15,14 +17,43 @@ router = APIRouter(
     response_model=FabricResponseModel,
     description="(v1) Get a fabric by fabric name.",
 )
-def v1_get_fabric_by_fabric_name(*, session: Session = Depends(get_session), fabric_name: str):
+def v1_get_fabric_by_fabric_name(
+    *,
+    session: Session = Depends(get_session),
+    fabric_name: str,
+    if_none_match: str | None = Header(default=None),
+):
     """
     # Summary
 
     GET request handler with fabric_name as path parameter.
+
+    ## Notes
+
+    -   The response body is served from fabric_response_cache while the
+        fabric's updated_at is unchanged.  See build_fabric_responses_json().
+    -   The ETag is derived from the fabric's id and updated_at, and is
+        recorded in resource_versions until the fabric is modified.  A
+        request whose If-None-Match matches the recorded ETag is answered
+        with 304 Not Modified without querying the database.
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
-    if not db_fabric:
+    db_engine = session.get_bind()
+    key = ("fabric", fabric_name)
+    etag = resource_versions.etag(db_engine, key)
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    generation = resource_versions.generation(db_engine, key)
+    statement = select(FabricDbModelV1.id, FabricDbModelV1.updated_at).where(FabricDbModelV1.FABRIC_NAME == fabric_name)
+    rows = session.exec(statement).all()
+    bodies = build_fabric_responses_json(session, rows)
+    if not bodies:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
-    response = build_response(db_fabric)
-    return response
+    etag = build_fabric_etag(rows)
+    resource_versions.record(db_engine, key, generation, etag)
+    headers = {"ETag": etag}
+    if rows[0].updated_at is not None:
+        headers["Last-Modified"] = build_last_modified(rows[0].updated_at)
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag, headers)
+    return Response(content=bodies[0], media_type="application/json", headers=headers)
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 
+from .......common.versions import resource_versions
 from .......db import get_session
 from ......models.fabric import FabricCreate, FabricDbModelV1, FabricResponseModel
-from ..switches.models.switch_overview import SwitchOverview
 from .common import build_response
+from .fabric_response_cache import fabric_response_cache
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -28,7 +29,7 @@ def v1_fabric_post(
 
     POST request handler
     """
-    db_fabric = FabricDbModelV1.model_validate(fabric)
+    db_fabric = FabricDbModelV1.from_fabric(fabric)
     setattr(db_fabric, "FABRIC_NAME", fabric_name)
     setattr(db_fabric, "FF", template_name)
 
@@ -40,11 +41,9 @@ def v1_fabric_post(
         msg = f"ND Site with name {fabric_name} already exists."
         raise HTTPException(status_code=500, detail=msg) from error
     session.refresh(db_fabric)
+    fabric_response_cache.invalidate(session.get_bind(), db_fabric.id)
 
-    overview = SwitchOverview()
-    overview.fabric = db_fabric.FABRIC_NAME
-    overview.session = session
-    overview.initialize_db_table()
+    resource_versions.bump(session.get_bind(), ("fabric", fabric_name), ("fabrics", ""), ("inventory", fabric_name))
 
     response = build_response(db_fabric)
     return response
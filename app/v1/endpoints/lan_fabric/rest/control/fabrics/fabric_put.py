@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlmodel import Session
 
+from .......common.versions import resource_versions
 from .......db import get_session
 from ......models.fabric import FabricDbModelV1, FabricResponseModel, FabricUpdate
-from .common import build_response
+from .fabric_resolver import FabricResolver, get_fabric_resolver
+from .fabric_response_cache import build_response_json, fabric_response_cache
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -18,6 +20,7 @@ router = APIRouter(
 def v1_fabric_put(
     *,
     session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
     fabric_name: str,
     fabric: FabricUpdate,
 ):
@@ -25,17 +28,39 @@ def v1_fabric_put(
     # Summary
 
     PUT request handler
+
+    ## Notes
+
+    -   The fields set in the request body are written with one
+        UPDATE ... RETURNING (see FabricDbModelV1.update_statement()), and
+        the response is built from the returned row.  The fabric is not
+        loaded before, or refreshed after, the update.
+    -   The response body is added to fabric_response_cache, so the next
+        GET of the fabric does not rebuild it.
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    fabric_data = fabric.model_dump(exclude_unset=True)
+    statement = FabricDbModelV1.update_statement(FabricDbModelV1.FABRIC_NAME == fabric_name, fabric_data)
+    if statement is None:
+        db_fabric = resolver.load(fabric_name)
+    else:
+        row = session.exec(statement).mappings().first()
+        db_fabric = None if row is None else FabricDbModelV1(**row)
     if not db_fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
-    fabric_data = fabric.model_dump(exclude_unset=True)
-
-    for key, value in fabric_data.items():
-        setattr(db_fabric, key, value)
+    body = build_response_json(db_fabric)
+    if statement is None:
+        return Response(content=body, media_type="application/json")
 
-    session.add(db_fabric)
     session.commit()
-    session.refresh(db_fabric)
-    response = build_response(db_fabric)
-    return response
+    db_engine = session.get_bind()
+    resolver.invalidate(fabric_name)
+    fabric_response_cache.put(db_engine, db_fabric.id, db_fabric.updated_at, body)
+    resource_versions.bump(
+        db_engine,
+        ("fabric", fabric_name),
+        ("fabric", db_fabric.FABRIC_NAME),
+        ("fabrics", ""),
+        ("inventory", fabric_name),
+        ("inventory", db_fabric.FABRIC_NAME),
+    )
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+import threading
+from typing import Any, NamedTuple
+
+from fastapi import Depends
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from .......common.cache import EngineEntries, cache_registry
+from .......db import get_session
+from ......models.fabric import FabricDbModelV1
+
+
+class FabricRef(NamedTuple):
+    """
+    # Summary
+
+    The FabricDbModelV1 columns most handlers need, under the same names,
+    so a FabricRef can stand in for a FabricDbModelV1 that is only read.
+    """
+
+    id: int
+    FABRIC_NAME: str
+    FABRIC_TYPE: str | None
+    FF: str
+
+
+class FabricCache:
+    """
+    # Summary
+
+    Map fabric names to FabricRef, per database engine.
+
+    Entries are added by FabricResolver when a name is resolved from the
+    database, and removed by the handlers that modify or delete a fabric.
+    Names that do not resolve are not cached.  Entries are kept in an
+    EngineEntries (see app/common/cache.py).
+
+    ## Methods
+
+    - get: Return the FabricRef for a fabric name, or None.
+    - put: Add a FabricRef.
+    - invalidate: Remove the FabricRef for a fabric name.
+    - clear: Remove all entries.
+    - record_request: Add the counters of a FabricResolver to the totals.
+    - stats: Return the cache statistics.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._entries = EngineEntries()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.requests = 0
+        self.queries_saved = 0
+
+    def get(self, db_engine: Engine, name: str) -> FabricRef | None:
+        """
+        Return the FabricRef for fabric name in db_engine, or None.
+        """
+        with self._lock:
+            fabric_ref = self._entries.get(db_engine).get(name)
+            if fabric_ref is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return fabric_ref
+
+    def put(self, db_engine: Engine, fabric_ref: FabricRef) -> None:
+        """
+        Add fabric_ref for db_engine.
+        """
+        with self._lock:
+            self._entries.setdefault(db_engine)[fabric_ref.FABRIC_NAME] = fabric_ref
+
+    def invalidate(self, db_engine: Engine, name: str) -> None:
+        """
+        Remove the FabricRef for fabric name in db_engine, if any.
+        """
+        with self._lock:
+            if self._entries.get(db_engine).pop(name, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def record_request(self, resolver: "FabricResolver") -> None:
+        """
+        Add the counters of the FabricResolver of a completed request to
+        the totals.
+        """
+        with self._lock:
+            self.requests += 1
+            self.queries_saved += resolver.queries_saved
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the cache statistics.
+
+        queries_saved counts the fabric SELECTs that handlers no longer
+        issue, because the fabric was resolved from the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": sum(len(entries) for entries in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "requests": self.requests,
+                "queries_saved": self.queries_saved,
+                "queries_saved_per_request": self.queries_saved / self.requests if self.requests else 0.0,
+            }
+
+
+fabric_cache = FabricCache()
+cache_registry.register("fabrics", fabric_cache)
+
+
+class FabricResolver:
+    """
+    # Summary
+
+    Resolve fabric names for one request, through fabric_cache.
+
+    ## Methods
+
+    - resolve: Return the FabricRef for a fabric name, or None.
+    - load: Return the FabricDbModelV1 for a fabric name, or None.
+    - invalidate: Remove a fabric name from the cache.  Call this after
+      committing a change to, or the deletion of, the fabric.
+
+    ## Example Usage
+
+    ```python
+    def handler(*, resolver: FabricResolver = Depends(get_fabric_resolver), fabric_name: str):
+        fabric_ref = resolver.resolve(fabric_name)
+        if fabric_ref is None:
+            raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
+        print(fabric_ref.id)
+    ```
+    """
+
+    def __init__(self, session: Session, cache: FabricCache = fabric_cache):
+        self.class_name = __class__.__name__
+        self.session = session
+        self.cache = cache
+        self.db_engine = session.get_bind()
+        self.queries_saved = 0
+
+    def resolve(self, name: str) -> FabricRef | None:
+        """
+        # Summary
+
+        Return the FabricRef for fabric name, or None if the fabric does
+        not exist.
+
+        On a cache miss, only the FabricRef columns are selected.
+        """
+        fabric_ref = self.cache.get(self.db_engine, name)
+        if fabric_ref is not None:
+            self.queries_saved += 1
+            return fabric_ref
+        # pylint: disable=no-member
+        statement = select(FabricDbModelV1.id, FabricDbModelV1.FABRIC_NAME, FabricDbModelV1.FABRIC_TYPE, FabricDbModelV1.FF)
+        row = self.session.exec(statement.where(FabricDbModelV1.FABRIC_NAME == name)).first()
+        # pylint: enable=no-member
+        if row is None:
+            return None
+        fabric_ref = FabricRef(*row)
+        self.cache.put(self.db_engine, fabric_ref)
+        return fabric_ref
+
+    def load(self, name: str) -> FabricDbModelV1 | None:
+        """
+        # Summary
+
+        Return the FabricDbModelV1 for fabric name, or None if the fabric
+        does not exist.
+
+        Use this only when the handler needs the nvPairs of the fabric.
+        The row is selected by primary key if the fabric is cached, and by
+        name otherwise.
+        """
+        fabric_ref = self.cache.get(self.db_engine, name)
+        if fabric_ref is not None:
+            db_fabric = self.session.get(FabricDbModelV1, fabric_ref.id)
+            if db_fabric is not None and db_fabric.FABRIC_NAME == name:
+                return db_fabric
+            # The entry is stale, e.g. the database was modified directly.
+            self.invalidate(name)
+        db_fabric = self.session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == name)).first()
+        if db_fabric is not None:
+            self.cache.put(self.db_engine, FabricRef(db_fabric.id, db_fabric.FABRIC_NAME, db_fabric.FABRIC_TYPE, db_fabric.FF))
+        return db_fabric
+
+    def invalidate(self, name: str) -> None:
+        """
+        Remove fabric name from the cache.
+        """
+        self.cache.invalidate(self.db_engine, name)
+
+
+def get_fabric_resolver(session: Session = Depends(get_session)):
+    """
+    # Summary
+
+    yield a FabricResolver for the request's session, and record its
+    counters in fabric_cache once the request completes.
+    """
+    resolver = FabricResolver(session)
+    yield resolver
+    fabric_cache.record_request(resolver)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+import threading
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from .......common.cache import EngineEntries, cache_registry
+from .......common.functions.conditional import build_etag
+from .......common.functions.utilities import serialize_json
+from ......models.fabric import FabricDbModelV1, FabricResponseModel
+from .common import build_response
+
+
+class FabricResponseCache:
+    """
+    # Summary
+
+    Map fabric ids to the serialized FabricResponseModel of the fabric, per
+    database engine.
+
+    Each entry holds the updated_at of the fabric it was built from, and is
+    returned only while the fabric's updated_at is unchanged.  The handlers
+    that modify or delete a fabric also invalidate its entry.  Entries are
+    kept in an EngineEntries (see app/common/cache.py).
+
+    ## Methods
+
+    - get: Return the response body for a fabric id and updated_at, or None.
+    - put: Add a response body.
+    - invalidate: Remove the response body for a fabric id.
+    - clear: Remove all entries.
+    - stats: Return the cache statistics.
+    """
+
+    def __init__(self):
+        self.class_name = __class__.__name__
+        self._entries = EngineEntries()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, db_engine: Engine, fabric_id: int, updated_at: datetime | None) -> bytes | None:
+        """
+        Return the response body for fabric_id in db_engine, if it was built
+        from the fabric as of updated_at, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(db_engine).get(fabric_id)
+            if entry is None or entry[0] != updated_at:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, db_engine: Engine, fabric_id: int, updated_at: datetime | None, body: bytes) -> None:
+        """
+        Add body, built from fabric_id as of updated_at, for db_engine.
+        """
+        with self._lock:
+            self._entries.setdefault(db_engine)[fabric_id] = (updated_at, body)
+
+    def invalidate(self, db_engine: Engine, fabric_id: int | None) -> None:
+        """
+        Remove the response body for fabric_id in db_engine, if any.
+        """
+        with self._lock:
+            if self._entries.get(db_engine).pop(fabric_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the cache statistics.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            entries = [entry for engine_entries in self._entries.values() for entry in engine_entries.values()]
+            return {
+                "entries": len(entries),
+                "bytes": sum(len(body) for _, body in entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+fabric_response_cache = FabricResponseCache()
+cache_registry.register("fabric_responses", fabric_response_cache)
+
+
+def build_response_json(db_fabric: FabricDbModelV1) -> bytes:
+    """
+    # Summary
+
+    Return the FabricResponseModel of db_fabric, serialized exactly as
+    FastAPI serializes it for a handler with response_model=FabricResponseModel.
+    """
+    return serialize_json(FabricResponseModel.model_validate(build_response(db_fabric)).model_dump(mode="json"))
+
+
+def build_fabric_etag(rows: Sequence[tuple[int, datetime | None]], variant: str = "") -> str:
+    """
+    # Summary
+
+    Return the strong ETag of the fabric responses for rows, which are
+    (FabricDbModelV1.id, FabricDbModelV1.updated_at) tuples, in response
+    order.
+
+    variant distinguishes representations of the same rows, e.g. the
+    query string of the request.
+    """
+    versions = ";".join(f"{fabric_id}:{updated_at.isoformat() if updated_at else ''}" for fabric_id, updated_at in rows)
+    return build_etag(f"{versions}|{variant}".encode())
+
+
+def build_fabric_responses_json(session: Session, rows: Sequence[tuple[int, datetime | None]], cache: FabricResponseCache = fabric_response_cache) -> list[bytes]:
+    """
+    # Summary
+
+    Return the serialized FabricResponseModel of each fabric in rows, in
+    order, through cache.
+
+    rows are (FabricDbModelV1.id, FabricDbModelV1.updated_at) tuples.
+    Only the fabrics whose response is not cached are loaded, with one
+    query, and their responses are added to cache.
+    """
+    db_engine = session.get_bind()
+    bodies: dict[int, bytes] = {}
+    stale: dict[int, datetime | None] = {}
+    for fabric_id, updated_at in rows:
+        body = cache.get(db_engine, fabric_id, updated_at)
+        if body is None:
+            stale[fabric_id] = updated_at
+        else:
+            bodies[fabric_id] = body
+    if stale:
+        # pylint: disable=no-member
+        for db_fabric in session.exec(select(FabricDbModelV1).where(FabricDbModelV1.id.in_(list(stale)))).all():
+            # pylint: enable=no-member
+            body = build_response_json(db_fabric)
+            bodies[db_fabric.id] = body
+            cache.put(db_engine, db_fabric.id, db_fabric.updated_at, body)
+    return [bodies[fabric_id] for fabric_id, _ in rows if fabric_id in bodies]
@@ -1,12 +1,12 @@
-import copy
 from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlmodel import Session, select
 
+from .......common.versions import not_modified_response, resource_versions
 from .......db import get_session
 from ......models.fabric import FabricDbModelV1, FabricResponseModel
-from .common import build_response
+from .fabric_response_cache import build_fabric_etag, build_fabric_responses_json
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -19,16 +19,37 @@ def v1_fabrics_get(
     session: Session = Depends(get_session),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    if_none_match: str | None = Header(default=None),
 ):
     """
     # Summary
 
     GET request handler with limit and offset query parameters.
+
+    ## Notes
+
+    -   The response is assembled from the serialized response of each
+        fabric, served from fabric_response_cache while the fabric's
+        updated_at is unchanged.  See build_fabric_responses_json().
+    -   The ETag is derived from the id and updated_at of each fabric
+        returned, and is recorded in resource_versions until a fabric is
+        created, modified or deleted.  A request whose If-None-Match
+        matches the recorded ETag is answered with 304 Not Modified without
+        querying the database.
     """
-    fabrics = session.exec(select(FabricDbModelV1).offset(offset).limit(limit)).all()
-    response = []
-    response_fabric = {}
-    for fabric in fabrics:
-        response_fabric = build_response(fabric)
-        response.append(copy.deepcopy(response_fabric))
-    return response
+    db_engine = session.get_bind()
+    key = ("fabrics", "")
+    variant = f"{offset}:{limit}"
+    etag = resource_versions.etag(db_engine, key, variant)
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    generation = resource_versions.generation(db_engine, key)
+    statement = select(FabricDbModelV1.id, FabricDbModelV1.updated_at).offset(offset).limit(limit)
+    rows = session.exec(statement).all()
+    bodies = build_fabric_responses_json(session, rows)
+    etag = build_fabric_etag(rows, variant)
+    resource_versions.record(db_engine, key, generation, etag, variant)
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json", headers={"ETag": etag})
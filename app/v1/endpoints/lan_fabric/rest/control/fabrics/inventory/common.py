@@ -1,8 +1,294 @@
+from operator import itemgetter
+from typing import Any, Iterator
+
+from fastapi import HTTPException, Response
+from fastapi.datastructures import URL
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import literal
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, select
+
+from ........common.functions.conditional import accepts_media_type
+from ........common.functions.utilities import serialize_json
+from ........common.versions import not_modified_response, resource_versions
 from .......models.fabric import FabricDbModelV1
-from .......models.inventory import SwitchDbModel, SwitchDiscoverItem, SwitchResponseModel
+from .......models.inventory import SwitchDbModel, SwitchDiscoverItem, SwitchQueryModel, SwitchResponseModel
+from ..fabric_resolver import FabricRef, FabricResolver
+
+# SwitchResponseModel fields that build_response_switch() does not copy from
+# SwitchDbModel.  role is selected as a literal so the field order of each
+# row matches SwitchResponseModel.  fexMap is the last field, and is
+# selected as a placeholder that build_switch_dicts() replaces.
+SWITCH_RESPONSE_LITERALS: dict[str, Any] = {"role": ""}
+SWITCH_RESPONSE_FEX_MAP = "fexMap"
+
+# Streamed switch listings fetch, serialize and send this many rows at a time.
+SWITCH_STREAM_YIELD_PER = 1000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# SwitchQueryModel filters, and the SwitchDbModel column each one matches.
+SWITCH_QUERY_FILTERS = {"role": "switchRole", "model": "model", "release": "release", "ccStatus": "ccStatus", "operStatus": "operStatus"}
+
+
+def switch_response_fields(fields: str | None = None) -> list[str]:
+    """
+    # Summary
+
+    Return the SwitchResponseModel fields named in fields, a comma-separated
+    list, in model field order.  Return all fields if fields is not set.
+
+    ## Raises
+
+    HTTPException (400) if fields names a field that SwitchResponseModel
+    does not have.
+    """
+    if not fields:
+        return list(SwitchResponseModel.model_fields)
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    invalid = sorted(requested - set(SwitchResponseModel.model_fields))
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid fields: {', '.join(invalid)}.")
+    return [field for field in SwitchResponseModel.model_fields if field in requested]
+
+
+def build_switch_query_conditions(fabric_id: int, query: SwitchQueryModel | None = None) -> list:
+    """
+    # Summary
+
+    Return the WHERE conditions selecting the switches in the fabric with
+    id fabric_id that match the filters, and follow the after cursor, of
+    query.
+    """
+    conditions = [SwitchDbModel.fabricId == fabric_id]
+    if query is None:
+        return conditions
+    for parameter, column in SWITCH_QUERY_FILTERS.items():
+        value = getattr(query, parameter)
+        if value is not None:
+            conditions.append(SwitchDbModel.__table__.c[column] == value)
+    if query.after is not None:
+        conditions.append(SwitchDbModel.switchDbID > query.after)
+    return conditions
+
+
+def build_switch_response_statement(fabric_id: int, query: SwitchQueryModel | None = None):
+    """
+    # Summary
+
+    Return a SELECT of the SwitchResponseModel fields, in model field order,
+    for the switches in the fabric with id fabric_id, in switchDbID order.
+
+    If query is set, only the switches matching its filters, and only
+    the fields it names, are selected, at most query.limit of them.
+
+    fexMap is selected as a placeholder.  See build_response_switches_json().
+    """
+    columns = []
+    for field in switch_response_fields(query.fields if query else None):
+        if field == SWITCH_RESPONSE_FEX_MAP:
+            columns.append(literal(None).label(field))
+        elif field in SWITCH_RESPONSE_LITERALS:
+            columns.append(literal(SWITCH_RESPONSE_LITERALS[field]).label(field))
+        else:
+            columns.append(SwitchDbModel.__table__.c[field])
+    statement = select(*columns).where(*build_switch_query_conditions(fabric_id, query)).order_by(SwitchDbModel.switchDbID)
+    if query is not None and query.limit is not None:
+        statement = statement.limit(query.limit)
+    return statement
+
+
+def build_switch_next_after(session: Session, fabric_id: int, query: SwitchQueryModel | None = None) -> int | None:
+    """
+    # Summary
+
+    Return the after cursor of the page following the one selected by
+    query, or None if query is not paged or selects the last page.
+    """
+    if query is None or query.limit is None:
+        return None
+    statement = select(SwitchDbModel.switchDbID).where(*build_switch_query_conditions(fabric_id, query)).order_by(SwitchDbModel.switchDbID).offset(query.limit - 1).limit(2)
+    switch_db_ids = session.exec(statement).all()
+    if len(switch_db_ids) < 2:
+        return None
+    return switch_db_ids[0]
+
+
+def build_switch_dicts(fields: list[str], rows) -> list[dict[str, Any]]:
+    """
+    # Summary
+
+    Return rows, selected by build_switch_response_statement(), as
+    dictionaries keyed by fields, with the fexMap placeholder replaced.
+    """
+    if SWITCH_RESPONSE_FEX_MAP in fields:
+        return [{**dict(zip(fields, row)), SWITCH_RESPONSE_FEX_MAP: {}} for row in rows]
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def build_response_switches_json(session: Session, fabric_id: int, query: SwitchQueryModel | None = None) -> bytes:
+    """
+    # Summary
+
+    Return the JSON body of a List[SwitchResponseModel] response for the
+    switches in the fabric with id fabric_id.
+
+    This is the fast path for build_response_switch().  Rows go straight
+    from the database to JSON bytes without building SwitchDbModel or
+    SwitchResponseModel instances, and without FastAPI re-validating the
+    list against response_model.  The output is byte-identical to the
+    validated path, which tests/unit/v1/test_v1_inventory.py verifies.
+
+    The statement is run with execute() rather than exec(), since exec()
+    returns a ScalarResult, without keys(), when a single field is selected.
+    """
+    result = session.execute(build_switch_response_statement(fabric_id, query))
+    return serialize_json(build_switch_dicts(list(result.keys()), result))
+
+
+def iter_response_switches_json(
+    db_engine: Engine, fabric_id: int, query: SwitchQueryModel | None = None, ndjson: bool = False, yield_per: int = SWITCH_STREAM_YIELD_PER
+) -> Iterator[bytes]:
+    """
+    # Summary
 
+    Yield the JSON body of a List[SwitchResponseModel] response for the
+    switches in the fabric with id fabric_id, yield_per rows at a time.
 
-def build_db_switch(switch: SwitchDiscoverItem, db_fabric: FabricDbModelV1) -> SwitchDbModel:
+    Rows are fetched with yield_per, so memory use does not grow with the
+    number of switches in the fabric.
+
+    ## Parameters
+
+    - db_engine: The engine to open a Session on.  The streaming body is
+      sent after the request's session is closed, so it uses its own.
+    - fabric_id: The id of the fabric.
+    - query: See build_switch_response_statement().
+    - ndjson: If False, the concatenated chunks are byte-identical to
+      build_response_switches_json().  If True, one JSON object per line
+      (application/x-ndjson) is yielded instead.
+    - yield_per: The number of rows fetched and serialized per chunk.
+    """
+    with Session(db_engine) as session:
+        result = session.execute(build_switch_response_statement(fabric_id, query).execution_options(yield_per=yield_per))
+        fields = list(result.keys())
+        separator = b"" if ndjson else b"["
+        for partition in result.partitions():
+            switches = build_switch_dicts(fields, partition)
+            if ndjson:
+                yield b"".join(serialize_json(switch) + b"\n" for switch in switches)
+                continue
+            yield separator + serialize_json(switches)[1:-1]
+            separator = b","
+        if not ndjson:
+            yield b"[]" if separator == b"[" else b"]"
+
+
+def build_switches_etag_variant(url: URL, accept: str | None = None) -> str:
+    """
+    # Summary
+
+    Return the ETag variant of a switch listing: its path and query, and
+    whether it is newline-delimited JSON.  stream=true is part of the
+    query, although the streamed body is identical.
+    """
+    media_type = NDJSON_MEDIA_TYPE if accepts_media_type(accept, NDJSON_MEDIA_TYPE) else "application/json"
+    return f"{url.path}?{url.query}|{media_type}"
+
+
+def build_switches_response(
+    session: Session, fabric_id: int, query: SwitchQueryModel | None = None, accept: str | None = None, stream: bool = False, url: URL | None = None
+) -> Response:
+    """
+    # Summary
+
+    Return the response for a listing of the switches in the fabric with id
+    fabric_id, paged, filtered and projected by query.
+
+    - If accept lists application/x-ndjson, the switches are streamed, one
+      JSON object per line.
+    - If stream is True, the JSON array is streamed.
+    - Otherwise, the JSON array is built in memory and sent in one piece.
+
+    If query selects a page that is not the last, and url (the request URL)
+    is set, a Link header with rel="next" gives the URL of the next page.
+
+    ## Raises
+
+    HTTPException (400) if query.fields names an unknown field.  It is
+    checked here, since a streamed response has started, with status 200,
+    before its statement is built.
+    """
+    switch_response_fields(query.fields if query else None)
+    headers = {}
+    next_after = build_switch_next_after(session, fabric_id, query)
+    if next_after is not None and url is not None:
+        headers["Link"] = f'<{url.include_query_params(after=next_after)}>; rel="next"'
+    if accepts_media_type(accept, NDJSON_MEDIA_TYPE):
+        content = iter_response_switches_json(session.get_bind(), fabric_id, query, ndjson=True)
+        return StreamingResponse(content, media_type=NDJSON_MEDIA_TYPE, headers=headers)
+    if stream:
+        return StreamingResponse(iter_response_switches_json(session.get_bind(), fabric_id, query), media_type="application/json", headers=headers)
+    return Response(content=build_response_switches_json(session, fabric_id, query), media_type="application/json", headers=headers)
+
+
+def build_fabric_switches_response(
+    session: Session,
+    resolver: FabricResolver,
+    fabric_name: str,
+    url: URL,
+    query: SwitchQueryModel | None = None,
+    accept: str | None = None,
+    stream: bool = False,
+    if_none_match: str | None = None,
+    empty_if_not_found: bool = False,
+) -> Response:
+    """
+    # Summary
+
+    Return the response for a GET of the switches hosted in fabric_name,
+    for the switchesByFabric and (internal) inventory endpoints.
+
+    ## Notes
+
+    -   The response body is built by build_switches_response(), which
+        bypasses response_model validation.
+    -   With Accept: application/x-ndjson, the switches are streamed as
+        newline-delimited JSON.  With stream=true, the JSON array is
+        streamed.  Either way, memory use does not grow with the number of
+        switches in the fabric.
+    -   limit and after page through the switches in switchDbID order.  If
+        there is a next page, a Link header with rel="next" gives its URL.
+    -   role, model, release, ccStatus and operStatus filter the switches.
+    -   fields, a comma-separated list of field names, limits the fields
+        returned for each switch.
+    -   The ETag is derived from the fabric's inventory generation in
+        resource_versions, which is advanced whenever a switch in the
+        fabric is added, removed or modified, and from the fabric's id.
+        fabric_name is resolved first, so a deleted fabric is never
+        answered with 304.  A request whose If-None-Match matches is then
+        answered with 304 Not Modified without querying the switches (nor
+        the fabric, if it is cached).
+
+    ## Raises
+
+    HTTPException (404) if fabric_name does not exist, unless
+    empty_if_not_found is True, in which case an empty list is returned.
+    """
+    db_fabric = resolver.resolve(fabric_name)
+    if not db_fabric and not empty_if_not_found:
+        raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
+    variant = f"{db_fabric.id if db_fabric else ''}|{build_switches_etag_variant(url, accept)}"
+    etag = resource_versions.current_etag(session.get_bind(), ("inventory", fabric_name), variant)
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    if not db_fabric:
+        return JSONResponse(content=[], headers={"ETag": etag})
+    response = build_switches_response(session, db_fabric.id, query, accept=accept, stream=stream, url=url)
+    response.headers["ETag"] = etag
+    return response
+
+
+def build_db_switch(switch: SwitchDiscoverItem, db_fabric: FabricDbModelV1 | FabricRef) -> SwitchDbModel:
     """
     # Summary
 
@@ -122,6 +408,73 @@ def build_db_switch(switch: SwitchDiscoverItem, db_fabric: FabricDbModelV1) -> S
     )
 
 
+def build_switch_row_template(db_fabric: FabricDbModelV1 | FabricRef) -> dict[str, Any]:
+    """
+    # Summary
+
+    Return a mapping of SwitchDbModel column names to the values shared by
+    every switch discovered into db_fabric.
+
+    The template is derived from build_db_switch(), so rows built from it
+    are identical to those persisted via SwitchDbModel.  The per-switch
+    columns are filled in by build_switch_row().
+    """
+    placeholder = SwitchDiscoverItem(deviceIndex="", serialNumber="", sysName="", platform="", version="", ipaddr="")
+    db_switch = build_db_switch(placeholder, db_fabric)
+    template = {}
+    for column in SwitchDbModel.__table__.columns:
+        if column.primary_key:
+            continue
+        value = getattr(db_switch, column.name)
+        # As the ORM does on INSERT, replace None with the column's default, if any.
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        template[column.name] = value
+    return template
+
+
+def build_switch_row(switch: SwitchDiscoverItem, template: dict[str, Any]) -> dict[str, Any]:
+    """
+    # Summary
+
+    Given a SwitchDiscoverItem and a template from build_switch_row_template(),
+    return a mapping suitable for a bulk (executemany) insert into the
+    SwitchDbModel table.
+    """
+    row = dict(template)
+    row["hostName"] = switch.sysName
+    row["ipAddress"] = switch.ipaddr
+    row["logicalName"] = switch.sysName
+    row["model"] = switch.platform
+    row["name"] = switch.sysName
+    row["release"] = switch.version
+    row["serialNumber"] = switch.serialNumber
+    row["version"] = switch.version
+    return row
+
+
+def insert_switch_rows(session: Session, rows: list[dict[str, Any]]) -> None:
+    """
+    # Summary
+
+    Insert rows, built by build_switch_row() from a single template, into the
+    SwitchDbModel table with one DBAPI executemany() on the session's
+    connection.
+
+    The statement is passed to the driver as-is, which avoids SQLAlchemy's
+    per-row parameter processing.  This matters at 10k rows x 110 columns.
+    All values in rows are native sqlite3 types (str, int, bool, None).
+    """
+    if not rows:
+        return
+    connection = session.connection()
+    quote = connection.dialect.identifier_preparer.quote
+    columns = list(rows[0])
+    statement = f"INSERT INTO {quote(SwitchDbModel.__tablename__)} ({', '.join(quote(column) for column in columns)}) "
+    statement += f"VALUES ({', '.join('?' for _ in columns)})"
+    connection.exec_driver_sql(statement, list(map(itemgetter(*columns), rows)))
+
+
 def build_response_switch(db_switch: SwitchDbModel) -> SwitchResponseModel:
     """
     # Summary
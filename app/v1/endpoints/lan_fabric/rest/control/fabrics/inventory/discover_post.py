@@ -1,108 +1,85 @@
 #!/usr/bin/env python
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from ........common.versions import resource_versions
 from ........db import get_session
-from .......models.fabric import FabricDbModelV1
 from .......models.inventory import SwitchDbModel, SwitchDiscoverBodyModel
-from ...switches.models.switch_overview import SwitchOverviewHealth, SwitchOverviewHw, SwitchOverviewRoles, SwitchOverviewSw, SwitchOverviewSync
-from .common import build_db_switch
+from ..fabric_resolver import FabricResolver, get_fabric_resolver
+from .common import build_switch_row, build_switch_row_template, insert_switch_rows
+
+# Number of requested switches checked for conflicts per query.  Each switch
+# contributes two bound parameters (serial number and IP address).
+DISCOVERY_QUERY_CHUNK = 5000
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
 )
 
 
-def build_success_response():
-    """
-    # Summary
-
-    Build a 200 response body for a successful operation.
-
-    ## Notes
-
-    """
-    return {"status": "Success"}
-
-
-def update_health(db_session: Session, fabric_name: str, health: str):
+def validate_discovery_conflicts(session: Session, switch_discovery_body: SwitchDiscoverBodyModel) -> None:
     """
     # Summary
 
-    Update the switch health information associated with SwitchOverview.
-    """
-    instance = SwitchOverviewHealth()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    # This initializes the table if it doesn't exist.
-    instance.initialize_db_table()
-    instance.health = health
-    instance.add()
-
-
-def update_hw(db_session: Session, fabric_name: str, model: str):
-    """
-    # Summary
+    Raise HTTPException (500) if any switch in switch_discovery_body
+    has a serial number or IP address that is repeated in the request, or
+    that already exists in the inventory.
 
-    Update the switch hardware information associated with SwitchOverview.
+    Existing switches are found with one `IN (...)` query per
+    DISCOVERY_QUERY_CHUNK switches, rather than by scanning the inventory
+    once per requested switch.
     """
-    instance = SwitchOverviewHw()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    # This initializes the table if it doesn't exist.
-    instance.initialize_db_table()
-    instance.model = model
-    instance.add()
-
-
-def update_role(db_session: Session, fabric_name: str, role: str):
-    """
-    # Summary
-
-    Update the switch role information associated with SwitchOverview.
-    """
-    instance = SwitchOverviewRoles()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    # This initializes the table if it doesn't exist.
-    instance.initialize_db_table()
-    instance.role = role
-    instance.add()
+    serial_numbers: set[str] = set()
+    ip_addresses: set[str] = set()
+    for discovery_body in switch_discovery_body.switches:
+        if discovery_body.serialNumber in serial_numbers:
+            raise HTTPException(status_code=500, detail=f"Switch {discovery_body.serialNumber} is duplicated in the discovery request")
+        if discovery_body.ipaddr in ip_addresses:
+            raise HTTPException(status_code=500, detail=f"Switch {discovery_body.ipaddr} is duplicated in the discovery request")
+        serial_numbers.add(discovery_body.serialNumber)
+        ip_addresses.add(discovery_body.ipaddr)
+
+    switches = switch_discovery_body.switches
+    for start in range(0, len(switches), DISCOVERY_QUERY_CHUNK):
+        end = start + DISCOVERY_QUERY_CHUNK
+        chunk = switches[start:end]
+        # pylint: disable=no-member
+        statement = select(SwitchDbModel.serialNumber, SwitchDbModel.ipAddress, SwitchDbModel.fabricName).where(
+            or_(
+                SwitchDbModel.serialNumber.in_([item.serialNumber for item in chunk]),
+                SwitchDbModel.ipAddress.in_([item.ipaddr for item in chunk]),
+            )
+        )
+        # pylint: enable=no-member
+        for serial_number, ip_address, existing_fabric_name in session.exec(statement).all():
+            if serial_number in serial_numbers:
+                raise HTTPException(status_code=500, detail=f"Switch {serial_number} already exists in fabric {existing_fabric_name}")
+            raise HTTPException(status_code=500, detail=f"Switch {ip_address} already exists in fabric {existing_fabric_name}")
 
 
-def update_sw(db_session: Session, fabric_name: str, version: str):
+def build_success_response():
     """
     # Summary
 
-    Update the switch software information associated with SwitchOverview.
-    """
-    instance = SwitchOverviewSw()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    # This initializes the table if it doesn't exist.
-    instance.initialize_db_table()
-    instance.version = version
-    instance.add()
-
+    Build a 200 response body for a successful operation.
 
-def update_sync(db_session: Session, fabric_name: str, sync: str):
-    """
-    # Summary
+    ## Notes
 
-    Update the switch sync status information associated with SwitchOverview.
     """
-    instance = SwitchOverviewSync()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    # This initializes the table if it doesn't exist.
-    instance.initialize_db_table()
-    instance.sync = sync
-    instance.add()
+    return {"status": "Success"}
 
 
 @router.post("/{fabric_name}/inventory/discover")
-def v1_inventory_discover_post(*, session: Session = Depends(get_session), fabric_name: str, switch_discovery_body: SwitchDiscoverBodyModel):
+def v1_inventory_discover_post(
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabric_name: str,
+    switch_discovery_body: SwitchDiscoverBodyModel,
+):
     """
     # Summary
 
@@ -118,35 +95,29 @@ def v1_inventory_discover_post(*, session: Session = Depends(get_session), fabri
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/inventory/discover
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
-    fabric_id = db_fabric.id
-    # Get all switches in the fabric
-    db_switches = session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricId == fabric_id)).all()
-    # Raise an error if any switches in the discovery body already exist in the fabric
-    for db_switch in db_switches:
-        if db_switch.serialNumber in [discovery_body.serialNumber for discovery_body in switch_discovery_body.switches]:
-            raise HTTPException(status_code=500, detail=f"Switch {db_switch.serialNumber} already exists in fabric {fabric_name}")
-        if db_switch.ipAddress in [discovery_body.ipaddr for discovery_body in switch_discovery_body.switches]:
-            raise HTTPException(status_code=500, detail=f"Switch {db_switch.ipAddress} already exists in fabric {fabric_name}")
-    # Add all switches in the discovery body to the fabric
-    for discovery_body in switch_discovery_body.switches:
-        db_switch = build_db_switch(discovery_body, db_fabric)
-        # For discovered switches, set their initial role to spine
-        db_switch.switchRoleEnum = "spine"
-        db_switch.switchRole = "spine"
-        db_switch.ccStatus = "In-Sync"
-        db_switch.operStatus = "Healthy"
-        db_switch.fabricId = fabric_id
-        session.add(db_switch)
+    validate_discovery_conflicts(session, switch_discovery_body)
+
+    # For discovered switches, set their initial role to spine
+    template = build_switch_row_template(db_fabric)
+    template["switchRoleEnum"] = "spine"
+    template["switchRole"] = "spine"
+    template["ccStatus"] = "In-Sync"
+    template["operStatus"] = "Healthy"
+
+    # Add all switches in the discovery body to the fabric with one executemany
+    rows = [build_switch_row(discovery_body, template) for discovery_body in switch_discovery_body.switches]
+    try:
+        insert_switch_rows(session, rows)
+    except IntegrityError as error:
+        # A concurrent request added one of the switches after
+        # validate_discovery_conflicts() ran.  Report it the same way.
+        session.rollback()
+        validate_discovery_conflicts(session, switch_discovery_body)
+        raise HTTPException(status_code=500, detail="Switch already exists in the inventory") from error
     session.commit()
-    # Update the switch overview tables
-    for discovery_body in switch_discovery_body.switches:
-        update_health(session, fabric_name=fabric_name, health="Healthy")
-        update_hw(session, fabric_name=fabric_name, model=discovery_body.platform)
-        update_role(session, fabric_name=fabric_name, role="spine")
-        update_sw(session, fabric_name=fabric_name, version=discovery_body.version)
-        update_sync(session, fabric_name=fabric_name, sync="in_sync")
+    resource_versions.bump(session.get_bind(), ("inventory", fabric_name))
     response = build_success_response()
     return response
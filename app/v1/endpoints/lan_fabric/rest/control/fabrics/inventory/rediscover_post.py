@@ -3,9 +3,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
+from ........common.versions import resource_versions
 from ........db import get_session
-from .......models.fabric import FabricDbModelV1
 from .......models.inventory import SwitchDbModel
+from ..fabric_resolver import FabricResolver, get_fabric_resolver
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -25,7 +26,13 @@ def build_success_response():
 
 
 @router.post("/{fabric_name}/inventory/rediscover/{serial_number}")
-def v1_inventory_rediscover_post(*, session: Session = Depends(get_session), fabric_name: str, serial_number: str):
+def v1_inventory_rediscover_post(
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabric_name: str,
+    serial_number: str,
+):
     """
     # Summary
 
@@ -41,7 +48,7 @@ def v1_inventory_rediscover_post(*, session: Session = Depends(get_session), fab
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/inventory/rediscover/{serial_number}
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
     fabric_id = db_fabric.id
@@ -51,4 +58,5 @@ def v1_inventory_rediscover_post(*, session: Session = Depends(get_session), fab
     db_switch.status = "ok"
     session.add(db_switch)
     session.commit()
+    resource_versions.bump(session.get_bind(), ("inventory", fabric_name))
     return build_success_response()
@@ -2,13 +2,13 @@
 import copy
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Header, Query, Request
+from sqlmodel import Session
 
 from ........db import get_session
-from .......models.fabric import FabricDbModelV1
-from .......models.inventory import SwitchDbModel, SwitchResponseModel
-from .common import build_response_switch
+from .......models.inventory import SwitchQueryModel, SwitchResponseModel
+from ..fabric_resolver import FabricResolver, get_fabric_resolver
+from .common import build_fabric_switches_response
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -32,7 +32,17 @@ def build_success_response():
     "/{fabric_name}/inventory/switchesByFabric",
     response_model=List[SwitchResponseModel],
 )
-def v1_inventory_switches_by_fabric_get(*, session: Session = Depends(get_session), fabric_name: str):
+def v1_inventory_switches_by_fabric_get(
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabric_name: str,
+    request: Request,
+    query: SwitchQueryModel = Depends(),
+    stream: bool = Query(default=False, description="Stream the JSON array in chunks."),
+    accept: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+):
     """
     # Summary
 
@@ -47,12 +57,9 @@ def v1_inventory_switches_by_fabric_get(*, session: Session = Depends(get_sessio
     ### Path
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/inventory/switchesByFabric
+
+    ## Notes
+
+    -   See build_fabric_switches_response().
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
-    if not db_fabric:
-        raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
-    fabric_id = db_fabric.id
-    db_switches = session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricId == fabric_id)).all()
-    if len(db_switches) == 0:
-        return []
-    return [build_response_switch(db_switch) for db_switch in db_switches]
+    return build_fabric_switches_response(session, resolver, fabric_name, request.url, query, accept=accept, stream=stream, if_none_match=if_none_match)
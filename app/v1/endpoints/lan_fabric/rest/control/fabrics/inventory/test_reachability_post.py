@@ -6,8 +6,8 @@ from sqlmodel import Session, select
 
 from ........common.functions.utilities import random_switch_serial_number, random_unicast_mac_address
 from ........db import get_session
-from .......models.fabric import FabricDbModelV1
 from .......models.inventory import SwitchDbModel
+from ..fabric_resolver import FabricResolver, get_fabric_resolver
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
@@ -282,7 +282,11 @@ def build_response_not_reachable(ip_address: str) -> TestReachabilityResponseMod
 
 @router.post("/{fabric_name}/inventory/test-reachability")
 def v1_inventory_test_reachability_post(
-    *, session: Session = Depends(get_session), fabric_name: str, test_reachability_body: TestReachabilityRequestBodyModel
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabric_name: str,
+    test_reachability_body: TestReachabilityRequestBodyModel,
 ) -> list[TestReachabilityResponseModel]:
     """
     # Summary
@@ -299,7 +303,7 @@ def v1_inventory_test_reachability_post(
 
     /appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{fabric_name}/inventory/test-reachability
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).first()
+    db_fabric = resolver.resolve(fabric_name)
     if not db_fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
     db_switch = session.exec(select(SwitchDbModel).where(SwitchDbModel.ipAddress == test_reachability_body.seedIP)).first()
@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
+from .......common.versions import not_modified_response, resource_versions
 from .......db import get_session
+from ..fabrics.fabric_resolver import FabricResolver, get_fabric_resolver
 from .models.switch_overview import SwitchOverviewResponse
 
 router = APIRouter(
@@ -18,14 +21,29 @@ router = APIRouter(
 def v1_switches_overview_get(
     fabric_name: str,
     session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    if_none_match: str | None = Header(default=None),
 ):
     """
     # Summary
 
     GET request handler
+
+    ## Notes
+
+    -   The ETag is derived from the fabric's inventory generation in
+        resource_versions.  fabric_name is resolved first, so a deleted
+        fabric is never answered with 304.  A request whose If-None-Match
+        matches is then answered with 304 Not Modified without querying
+        the switches (nor the fabric, if it is cached).
     """
+    if not resolver.resolve(fabric_name):
+        raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
+    etag = resource_versions.current_etag(session.get_bind(), ("inventory", fabric_name), "overview")
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
     response = SwitchOverviewResponse()
     response.fabric = fabric_name
     response.session = session
     response.refresh()
-    return response.response_dict()
+    return JSONResponse(content=response.response_dict(), headers={"ETag": etag})
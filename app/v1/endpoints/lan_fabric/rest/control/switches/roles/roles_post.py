@@ -1,13 +1,14 @@
 #!/usr/bin/env python
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session, select
 
 from ........common.enums.switch import SwitchRoleEnum, SwitchRoleFriendlyEnum
 from ........common.functions.utilities import switch_role_external_to_db
+from ........common.versions import resource_versions
 from ........db import get_session
 from .......models.inventory import SwitchDbModel
-from ...switches.models.switch_overview import SwitchOverviewRoles
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/switches",
@@ -52,25 +53,6 @@ def build_400_response(success_list, failure_list):
     }
 
 
-def update_sw_overview_role(session: Session, fabric_name: str, current_role: str, new_role: str):
-    """
-    # Summary
-
-    Update the switch roles portion of the overview table.
-
-    current_role should be in external format e.g. "border gateway", not "border_gateway".
-    new_role should be in external format e.g. "border gateway", not "border_gateway".
-    """
-    instance = SwitchOverviewRoles()
-    instance.session = session
-    instance.fabric = fabric_name
-    if current_role != "":
-        instance.role = current_role
-        instance.remove()
-    instance.role = new_role
-    instance.add()
-
-
 @router.post("/roles")
 def v1_roles_post(*, session: Session = Depends(get_session), switch_roles: list[SwitchRoleUpdate]):
     """
@@ -81,6 +63,7 @@ def v1_roles_post(*, session: Session = Depends(get_session), switch_roles: list
     success_list = []
     failure_list = []
     result_code = 200
+    fabric_names = set()
     for switch_role in switch_roles:
         db_switch = session.exec(select(SwitchDbModel).where(SwitchDbModel.serialNumber == switch_role.serialNumber)).first()
         if not db_switch:
@@ -94,14 +77,17 @@ def v1_roles_post(*, session: Session = Depends(get_session), switch_roles: list
             db_switch.switchRoleEnum = SwitchRoleEnum[switch_role_external_to_db(switch_role.role)].value
             db_switch.switchRole = SwitchRoleFriendlyEnum[switch_role_external_to_db(switch_role.role)].value
             session.add(db_switch)
-            # TODO: We might create inconsistencies if we update the overview for one
-            # switch, but the next switch in this request results in a 400 error.
-            # We should consider updating the overview table only if all switches in the
-            # request are valid (i.e. after session.commit() below).
-            update_sw_overview_role(session, db_switch.fabricName, current_role, new_role)
+            fabric_names.add(db_switch.fabricName)
             success_list.append(switch_role.serialNumber)
     if result_code == 400:
         detail = build_400_response(success_list, failure_list)
         raise HTTPException(status_code=result_code, detail=detail)
-    session.commit()
+    # The roles are committed only if every switch in the request is valid.
+    try:
+        session.commit()
+    except StaleDataError as error:
+        # A concurrent request removed one of the switches after it was read.
+        session.rollback()
+        raise HTTPException(status_code=400, detail=build_400_response([], success_list)) from error
+    resource_versions.bump(session.get_bind(), *[("inventory", fabric_name) for fabric_name in sorted(fabric_names)])
     return build_200_response(success_list)
@@ -1,93 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
+from .......common.versions import resource_versions
 from .......db import get_session
-from ......models.fabric import FabricDbModelV1
 from ......models.inventory import SwitchDbModel
 from ..fabrics.common import build_404_response
-from ..switches.models.switch_overview import SwitchOverviewHealth, SwitchOverviewHw, SwitchOverviewRoles, SwitchOverviewSw, SwitchOverviewSync
+from ..fabrics.fabric_resolver import FabricRef, FabricResolver, get_fabric_resolver
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics",
 )
 
 
-def update_health(db_session: Session, fabric_name: str, health: str) -> None:
-    """
-    # Summary
-
-    Update the switch health information associated with SwitchOverview.
-    """
-    if health == "":
-        return
-    instance = SwitchOverviewHealth()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    instance.health = health
-    instance.remove()
-
-
-def update_hw(db_session: Session, fabric_name: str, model: str) -> None:
-    """
-    # Summary
-
-    Update the switch hardware information associated with SwitchOverview.
-    """
-    if model == "":
-        return
-    instance = SwitchOverviewHw()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    instance.model = model
-    instance.remove()
-
-
-def update_role(db_session: Session, fabric_name: str, role: str) -> None:
-    """
-    # Summary
-
-    Update the switch role information associated with SwitchOverview.
-    """
-    if role == "":
-        return
-    instance = SwitchOverviewRoles()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    instance.role = role
-    instance.remove()
-
-
-def update_sw(db_session: Session, fabric_name: str, release: str) -> None:
-    """
-    # Summary
-
-    Update the switch software information associated with SwitchOverview.
-    """
-    if release == "":
-        return
-    instance = SwitchOverviewSw()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    instance.version = release
-    instance.remove()
-
-
-def update_sync(db_session: Session, fabric_name: str, sync: str) -> None:
-    """
-    # Summary
-
-    Update the switch sync information associated with SwitchOverview.
-    """
-    if sync == "":
-        return
-    instance = SwitchOverviewSync()
-    instance.session = db_session
-    instance.fabric = fabric_name
-    instance.sync = sync.lower().replace("-", "_")
-    instance.remove()
-
-
-def remove_switch_from_fabric(session: Session, db_fabric: FabricDbModelV1, serial_number: str) -> bool:
+def remove_switch_from_fabric(session: Session, db_fabric: FabricRef, serial_number: str) -> bool:
     """
     # Summary
 
@@ -98,7 +23,7 @@ def remove_switch_from_fabric(session: Session, db_fabric: FabricDbModelV1, seri
 
     session: Session
         The database session.
-    db_fabric: FabricDbModelV1
+    db_fabric: FabricRef
         The fabric from which to remove the switch.
     serial_number: str
         The serial number of the switch to remove.
@@ -119,23 +44,9 @@ def remove_switch_from_fabric(session: Session, db_fabric: FabricDbModelV1, seri
     if db_switch is None:
         return False
 
-    fabric_name = db_fabric.FABRIC_NAME
-
-    if fabric_name is None:
+    if db_fabric.FABRIC_NAME is None:
         return False
 
-    health = db_switch.operStatus
-    model = db_switch.model
-    release = db_switch.release
-    role = db_switch.switchRole
-    sync = db_switch.ccStatus
-
-    update_health(session, fabric_name, health)
-    update_hw(session, fabric_name, model)
-    update_role(session, fabric_name, role)
-    update_sw(session, fabric_name, release)
-    update_sync(session, fabric_name, sync)
-
     session.delete(db_switch)
     return True
 
@@ -146,7 +57,13 @@ description += "switch serial numbers, from the fabric specified by fabricName."
 
 
 @router.delete("/{fabricName}/switches/{serialNumbers}", description=description, summary=description)
-def v1_remove_switches_from_fabric(*, session: Session = Depends(get_session), fabricName: str, serialNumbers: str) -> str:
+def v1_remove_switches_from_fabric(
+    *,
+    session: Session = Depends(get_session),
+    resolver: FabricResolver = Depends(get_fabric_resolver),
+    fabricName: str,
+    serialNumbers: str,
+) -> str:
     """
     # Summary
 
@@ -167,7 +84,7 @@ def v1_remove_switches_from_fabric(*, session: Session = Depends(get_session), f
     -   The switch(es)=FOX2109PGCS have been removed from the fabric=F1
     -   The switch(es)=FOX2109PGD1,FOX2109PGCS,FOX2109PGD0,FDO211218HH have been removed from the fabric=F1
     """
-    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabricName)).first()
+    db_fabric = resolver.resolve(fabricName)
     if not db_fabric:
         path = f"{router.prefix}/{fabricName}/switches/{serialNumbers}"
         raise HTTPException(status_code=404, detail=build_404_response(path))
@@ -179,6 +96,7 @@ def v1_remove_switches_from_fabric(*, session: Session = Depends(get_session), f
 
     if True in commit:
         session.commit()
+        resource_versions.bump(session.get_bind(), ("inventory", fabricName))
     # NDFC response
     # The switch(es)=FOX2109PGCS have been removed from the fabric=F1
     # The switch(es)=FOX2109PGD1,FOX2109PGCS,FOX2109PGD0,FDO211218HH have been removed from the fabric=F1
@@ -3,13 +3,14 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy.orm.exc import StaleDataError
 from sqlmodel import Session, select
 
 from ......common.enums.switch import SwitchRoleEnum
 from ......common.functions.utilities import switch_role_external_to_db
+from ......common.versions import resource_versions
 from ......db import get_session
 from .....models.inventory import SwitchDbModel
-from ..control.switches.models.switch_overview import SwitchOverviewRoles
 
 router = APIRouter(
     prefix="/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/topology/role",
@@ -75,25 +76,6 @@ def http_exception_400_invalid_switch(switch_db_id: int) -> HTTPException:
     return HTTPException(status_code=400, detail=f"Invalid switchDbId. switchDbId={switch_db_id}")
 
 
-def update_sw_overview_role(session: Session, fabric_name: str, current_role: str, new_role: str):
-    """
-    # Summary
-
-    Update the switch roles portion of the overview table.
-    """
-    instance = SwitchOverviewRoles()
-    instance.session = session
-    instance.fabric = fabric_name
-    if current_role != "":
-        instance.role = current_role
-        instance.remove()
-    instance = SwitchOverviewRoles()
-    instance.session = session
-    instance.fabric = fabric_name
-    instance.role = new_role
-    instance.add()
-
-
 @router.put(
     "/{switch_db_id}",
     response_model=InternalRoleResponseModel,
@@ -128,12 +110,17 @@ def v1_internal_role_put(
     if current_role == new_role:
         return build_success_response(db_switch)
 
-    update_sw_overview_role(session, db_switch.fabricName, current_role, new_role)
-
+    fabric_name = db_switch.fabricName
     db_switch.switchRole = new_role
     db_switch.switchRoleEnum = SwitchRoleEnum[role_key].value
     session.add(db_switch)
-    session.commit()
+    try:
+        session.commit()
+    except StaleDataError as error:
+        # A concurrent request removed the switch after it was read.
+        session.rollback()
+        raise http_exception_400_invalid_switch(switch_db_id) from error
+    resource_versions.bump(session.get_bind(), ("inventory", fabric_name))
     session.refresh(db_switch)
     response = build_success_response(db_switch)
     return response
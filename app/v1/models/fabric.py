@@ -2,11 +2,18 @@
 # TODO: If SQLModel is ever fixed, remove the mypy directive below.
 # https://github.com/fastapi/sqlmodel/discussions/732
 # mypy: disable-error-code=call-arg
+import functools
+import json
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from pydantic import ConfigDict
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, func, insert, inspect, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import Update
 from sqlmodel import Field, SQLModel
+from sqlmodel.main import get_column_from_field
 
 from ...common.functions.utilities import get_datetime
 from ...common.validators.fabric import BgpValue
@@ -1604,15 +1611,47 @@ class FabricBase(SQLModel):
     VRF_VLAN_RANGE: str | None = Field(default="2000-2299", description=Descriptions().vrf_vlan_range)
 
 
-class FabricDbModelV1(FabricBase, table=True):
+# The FabricBase fields stored as columns of FabricDbModelV1.  All other
+# FabricBase fields are stored in FabricDbModelV1.nvPairsJson.
+FABRIC_HOT_FIELDS = ("BGP_AS", "FABRIC_NAME", "FABRIC_TYPE", "FF")
+
+
+class FabricDbModelV1(SQLModel, table=True):
     """
     # Summary
 
     Define the fabric table in the database.
+
+    Only the fields that handlers select, filter or join on are columns.
+    The remaining FabricBase fields (~300) are stored together in
+    nvPairsJson, a compact JSON object, so that reading or writing a
+    fabric moves one narrow row.  nvPairsJson is decoded only when the
+    full nvPairs are needed, by nv_pairs().
+
+    ## Methods
+
+    - from_fabric: Return a FabricDbModelV1 built from a FabricBase model.
+    - nv_pairs: Return all FabricBase fields, as in a fabric response.
+    - update_nv_pairs: Update FabricBase fields, columns and nvPairsJson alike.
+    - update_statement: Return an UPDATE ... RETURNING that does what
+      update_nv_pairs does, in the database.
+
+    ## Example Usage
+
+    ```python
+    db_fabric = FabricDbModelV1.from_fabric(FabricCreate(BGP_AS="65001"))
+    db_fabric.update_nv_pairs({"FABRIC_NAME": "f1", "REPLICATION_MODE": "Ingress"})
+    print(db_fabric.nv_pairs()["REPLICATION_MODE"])
+    ```
     """
 
     model_config = ConfigDict(use_enum_values=True)
     id: int | None = Field(default=None, primary_key=True)
+    BGP_AS: str = Field(index=True)
+    FABRIC_NAME: str | None = Field(default=None, unique=True, index=True)
+    FABRIC_TYPE: str | None = Field(default="Switch_Fabric")
+    FF: FFEnum = Field(default="Easy_Fabric")
+    nvPairsJson: str = Field(default_factory=lambda: fabric_nv_pairs_json(fabric_nv_pairs_defaults()))
     created_at: datetime | None = Field(default_factory=get_datetime)
 
     updated_at: datetime | None = Field(
@@ -1620,6 +1659,138 @@ class FabricDbModelV1(FabricBase, table=True):
         sa_column_kwargs={"onupdate": get_datetime},
     )
 
+    @classmethod
+    def from_fabric(cls, fabric: "FabricBase") -> "FabricDbModelV1":
+        """
+        Return a FabricDbModelV1 built from fabric, a validated FabricBase model.
+        """
+        values = fabric.model_dump(mode="json")
+        db_fabric = cls(**{field: values[field] for field in FABRIC_HOT_FIELDS})
+        db_fabric.nvPairsJson = fabric_nv_pairs_json(values)
+        return db_fabric
+
+    def nv_pairs(self) -> dict[str, Any]:
+        """
+        Return all FabricBase fields, in FabricBase order, with the values of
+        the columns taking precedence over nvPairsJson.
+        """
+        values = json.loads(self.nvPairsJson)
+        for field in FABRIC_HOT_FIELDS:
+            values[field] = getattr(self, field)
+        return {field: values.get(field) for field in FabricBase.model_fields}
+
+    def update_nv_pairs(self, values: dict[str, Any]) -> None:
+        """
+        Update FabricBase fields from values.  Keys that are not FabricBase
+        fields are ignored.
+        """
+        nv_pairs = json.loads(self.nvPairsJson)
+        for key, value in values.items():
+            if key in FABRIC_HOT_FIELDS:
+                setattr(self, key, value)
+            elif key in FabricBase.model_fields:
+                nv_pairs[key] = value
+        self.nvPairsJson = fabric_nv_pairs_json(nv_pairs)
+
+    @classmethod
+    def update_statement(cls, condition: Any, values: dict[str, Any]) -> Update | None:
+        """
+        Return an UPDATE of the fabrics matching condition that sets the
+        FabricBase fields in values, and returns the updated rows, or None
+        if values holds no FabricBase fields.
+
+        Columns are set directly.  The other fields are set in nvPairsJson
+        with json_set(), so the stored JSON is neither read nor rewritten
+        by the caller.  Keys that are not FabricBase fields are ignored,
+        as in update_nv_pairs().
+        """
+        columns: dict[str, Any] = {key: value for key, value in values.items() if key in FABRIC_HOT_FIELDS}
+        paths: list[Any] = []
+        for key, value in values.items():
+            if key in FabricBase.model_fields and key not in FABRIC_HOT_FIELDS:
+                paths.extend([f'$."{key}"', func.json(json.dumps(value, separators=(",", ":")))])
+        if paths:
+            columns["nvPairsJson"] = func.json_set(cls.nvPairsJson, *paths)
+        if not columns:
+            return None
+        return update(cls).where(condition).values(**columns).returning(*cls.__table__.columns)
+
+
+def fabric_nv_pairs_json(values: dict[str, Any]) -> str:
+    """
+    # Summary
+
+    Return the compact JSON stored in FabricDbModelV1.nvPairsJson for the
+    FabricBase fields in values that are not FABRIC_HOT_FIELDS.
+    """
+    nv_pairs = {key: value for key, value in values.items() if key not in FABRIC_HOT_FIELDS}
+    return json.dumps(nv_pairs, separators=(",", ":"))
+
+
+@functools.cache
+def fabric_nv_pairs_defaults() -> dict[str, Any]:
+    """
+    # Summary
+
+    Return the default value of each FabricBase field, as validated by
+    NvPairs.  BGP_AS has no default, and is returned as None.
+    """
+    defaults = NvPairs(BGP_AS="1").model_dump(mode="json")
+    defaults["BGP_AS"] = None
+    return defaults
+
+
+def migrate_fabric_table(db_engine: Engine) -> int | None:
+    """
+    # Summary
+
+    Migrate a fabric table created before nvPairsJson existed, with one
+    column per FabricBase field, to the FabricDbModelV1 layout, and return
+    the number of fabrics migrated.
+
+    Return None if the table does not exist, or already has the
+    FabricDbModelV1 layout.
+
+    ## Notes
+
+    -   The fabrics keep their ids, so the switches that reference them are
+        unchanged.  FabricBase fields missing from the old table get their
+        default value.
+    -   The table is inspected, read, dropped, recreated and refilled in
+        one transaction, begun with BEGIN IMMEDIATE, since pysqlite does not
+        begin a transaction before DDL.  Taking the write lock first also
+        means that of several processes started on the same database, only
+        the first migrates it.
+    """
+    table_name = FabricDbModelV1.__tablename__
+    with db_engine.connect() as connection:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        inspector = inspect(connection)
+        if not inspector.has_table(table_name):
+            return None
+        old_columns = {column["name"] for column in inspector.get_columns(table_name)}
+        if "nvPairsJson" in old_columns:
+            return None
+        # The old columns are read with the types FabricBase gave them, so
+        # that e.g. enums, which were stored by name, are decoded.
+        fields = [field for field in FabricBase.model_fields if field in old_columns]
+        columns = [Column(field, get_column_from_field(FabricBase.model_fields[field]).type) for field in fields]
+        old_table = Table(table_name, MetaData(), Column("id", Integer, primary_key=True), Column("created_at", DateTime), Column("updated_at", DateTime), *columns)
+        rows = connection.execute(select(old_table)).mappings().all()
+        db_rows = []
+        for row in rows:
+            values = dict(fabric_nv_pairs_defaults())
+            values.update({field: row[field].value if isinstance(row[field], Enum) else row[field] for field in fields})
+            db_row = {field: values[field] for field in FABRIC_HOT_FIELDS}
+            db_row.update(id=row["id"], nvPairsJson=fabric_nv_pairs_json(values), created_at=row["created_at"], updated_at=row["updated_at"])
+            db_rows.append(db_row)
+        old_table.drop(connection)
+        FabricDbModelV1.__table__.create(connection)
+        if db_rows:
+            connection.execute(insert(FabricDbModelV1.__table__), db_rows)
+        connection.commit()
+    return len(db_rows)
+
 
 class FabricCreate(FabricBase):
     """
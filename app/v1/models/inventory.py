@@ -4,6 +4,7 @@
 from typing import List
 
 from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from ...common.enums.switch import SwitchUnmanageableCauseEnum
@@ -160,6 +161,18 @@ class SwitchDbModel(SwitchBase, table=True):
 
     model_config = ConfigDict(use_enum_values=True)
 
+    # Listings select the switches of one fabric, optionally filtered on one
+    # of the columns below, in switchDbID order.  switchDbID is the rowid, so
+    # SQLite appends it to each index and no sort is needed.
+    __table_args__ = (
+        Index("ix_switchdbmodel_fabricId", "fabricId"),
+        Index("ix_switchdbmodel_fabricId_switchRole", "fabricId", "switchRole"),
+        Index("ix_switchdbmodel_fabricId_model", "fabricId", "model"),
+        Index("ix_switchdbmodel_fabricId_release", "fabricId", "release"),
+        Index("ix_switchdbmodel_fabricId_ccStatus", "fabricId", "ccStatus"),
+        Index("ix_switchdbmodel_fabricId_operStatus", "fabricId", "operStatus"),
+    )
+
     hostName: str = Field(index=True)
     ipAddress: str = Field(index=True, unique=True)
     switchDbID: int | None = Field(default=None, primary_key=True)
@@ -218,3 +231,26 @@ class SwitchDiscoverBodyModel(BaseModel):
         """
 
         use_enum_values = True
+
+
+class SwitchQueryModel(BaseModel):
+    """
+    Query parameters that page, filter and project a listing of the
+    switches in a fabric.
+
+    - limit, after: Return at most limit switches whose switchDbID is
+      greater than after (keyset pagination).
+    - role, model, release, ccStatus, operStatus: Return only switches
+      whose switchRole, model, release, ccStatus and operStatus match.
+    - fields: A comma-separated list of SwitchResponseModel fields to
+      return.  All fields are returned if not set.
+    """
+
+    limit: int | None = Field(default=None, ge=1)
+    after: int | None = Field(default=None, ge=0)
+    role: str | None = None
+    model: str | None = None
+    release: str | None = None
+    ccStatus: str | None = None
+    operStatus: str | None = None
+    fields: str | None = None
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .....db import get_session
+from .....common.versions import resource_versions
+from .....db import get_async_session
 from ....models.fabric import FabricDbModelV2
 
 router = APIRouter(
@@ -10,7 +11,7 @@ router = APIRouter(
 
 
 @router.delete("/{fabric_name}", status_code=204)
-async def v2_delete_fabric(*, session: Session = Depends(get_session), fabric_name: str):
+async def v2_delete_fabric(*, session: AsyncSession = Depends(get_async_session), fabric_name: str):
     """
     # Summary
 
@@ -28,10 +29,11 @@ async def v2_delete_fabric(*, session: Session = Depends(get_session), fabric_na
     }
     ```
     """
-    fabric = session.get(FabricDbModelV2, fabric_name)
+    fabric = await session.get(FabricDbModelV2, fabric_name)
     if not fabric:
         detail = {"code": 404, "description": "", "message": f"Fabric {fabric_name} not found"}
         raise HTTPException(status_code=404, detail=detail)
-    session.delete(fabric)
-    session.commit()
+    await session.delete(fabric)
+    await session.commit()
+    resource_versions.bump(session.bind.sync_engine, ("fabric_v2", fabric_name), ("fabrics_v2", ""))
     return {}
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .....db import get_session
+from .....common.versions import not_modified_response, resource_versions
+from .....db import get_async_session
 from ....models.fabric import FabricDbModelV2, FabricResponseModel
 from .common import FabricLocationModel, FabricManagementModel
 
@@ -43,14 +44,29 @@ def build_response(fabric: FabricDbModelV2) -> FabricResponseModel:
     "/{fabric_name}",
     response_model=FabricResponseModel,
 )
-def v2_fabric_get(*, session: Session = Depends(get_session), fabric_name: str):
+async def v2_fabric_get(
+    *,
+    session: AsyncSession = Depends(get_async_session),
+    fabric_name: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+):
     """
     # Summary
 
     GET request handler with fabric_name as path parameter.
+
+    ## Notes
+
+    -   The ETag is derived from the fabric's generation in
+        resource_versions.  A request whose If-None-Match matches is
+        answered with 304 Not Modified without querying the database.
     """
-    fabric = session.get(FabricDbModelV2, fabric_name)
+    etag = resource_versions.current_etag(session.bind.sync_engine, ("fabric_v2", fabric_name))
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+    fabric = await session.get(FabricDbModelV2, fabric_name)
     if not fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
-    response = build_response(fabric)
-    return response.model_dump()
+    response.headers["ETag"] = etag
+    return build_response(fabric).model_dump()
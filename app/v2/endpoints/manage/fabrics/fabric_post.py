@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .....db import get_session
+from .....common.versions import resource_versions
+from .....db import get_async_session
 from ....models.fabric import FabricDbModelV2, FabricResponseModel
 from .common import FabricLocationModel, FabricManagementModel
 
@@ -63,13 +64,13 @@ def build_db_fabric(fabric):
 
 
 @router.post("/fabrics", response_model=FabricResponseModel)
-async def v2_fabric_post(*, session: Session = Depends(get_session), fabric: FabricResponseModel):
+async def v2_fabric_post(*, session: AsyncSession = Depends(get_async_session), fabric: FabricResponseModel):
     """
     # Summary
 
     POST request handler
     """
-    db_fabric = session.get(FabricDbModelV2, fabric.name)
+    db_fabric = await session.get(FabricDbModelV2, fabric.name)
     if db_fabric:
         status_code = 500
         msg = f"[Fabric {db_fabric.name} is already present in the cluster "
@@ -83,9 +84,9 @@ async def v2_fabric_post(*, session: Session = Depends(get_session), fabric: Fab
     db_fabric = build_db_fabric(fabric)
     session.add(db_fabric)
     try:
-        session.commit()
+        await session.commit()
     except Exception as error:
-        session.rollback()
+        await session.rollback()
         status_code = 500
         msg = f"Unknown error. Detail: {error}"
         error_response = {}
@@ -93,7 +94,8 @@ async def v2_fabric_post(*, session: Session = Depends(get_session), fabric: Fab
         error_response["description"] = ""
         error_response["message"] = msg
         raise HTTPException(status_code=status_code, detail=error_response) from error
-    session.refresh(db_fabric)
+    resource_versions.bump(session.bind.sync_engine, ("fabric_v2", fabric.name), ("fabrics_v2", ""))
+    await session.refresh(db_fabric)
     if db_fabric is None:
         raise HTTPException(status_code=500, detail="Failed to create fabric")
     return build_response(db_fabric)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .....db import get_session
+from .....common.versions import resource_versions
+from .....db import get_async_session
 from ....models.fabric import FabricDbModelV2, FabricResponseModel
 from .common import FabricLocationModel, FabricManagementModel
 
@@ -67,9 +68,9 @@ def build_db_fabric(fabric):
     "/{fabric_name}",
     response_model=FabricResponseModel,
 )
-def v2_fabric_put(
+async def v2_fabric_put(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     fabric_name: str,
     fabric: FabricResponseModel,
 ):
@@ -84,7 +85,7 @@ def v2_fabric_put(
         nested keys under management to the model, e.g.
         .netflowSettings, .leafTorVpcPortChannelIdRange, etc.
     """
-    db_fabric = session.get(FabricDbModelV2, fabric_name)
+    db_fabric = await session.get(FabricDbModelV2, fabric_name)
     if not db_fabric:
         raise HTTPException(status_code=404, detail=f"Fabric {fabric_name} not found")
     fabric_data = fabric.model_dump(exclude_unset=True)
@@ -98,7 +99,8 @@ def v2_fabric_put(
             setattr(db_fabric, key, value)
 
     session.add(db_fabric)
-    session.commit()
-    session.refresh(db_fabric)
+    await session.commit()
+    await session.refresh(db_fabric)
+    resource_versions.bump(session.bind.sync_engine, ("fabric_v2", fabric_name), ("fabric_v2", db_fabric.name), ("fabrics_v2", ""))
     response = build_response(db_fabric)
     return response
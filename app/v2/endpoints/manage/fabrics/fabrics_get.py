@@ -1,10 +1,12 @@
 import copy
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from .....db import get_session
+from .....common.versions import not_modified_response, resource_versions
+from .....db import get_async_session
 from ....models.fabric import FabricDbModelV2, FabricResponseModel
 from .common import FabricLocationModel, FabricManagementModel
 
@@ -46,19 +48,30 @@ def build_response(fabric: FabricDbModelV2) -> FabricResponseModel:
     "/fabrics",
     response_model=List[dict[Any, Any]],
 )
-def v2_fabrics_get(
+async def v2_fabrics_get(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
-) -> List[dict[Any, Any]]:
+    http_response: Response,
+    if_none_match: str | None = Header(default=None),
+) -> List[dict[Any, Any]] | Response:
     """
     # Summary
 
     Endpoint handler for GET /api/v1/manage/fabrics
+
+    ## Notes
+
+    -   The ETag is derived from the generation of the fabric list in
+        resource_versions.  A request whose If-None-Match matches is
+        answered with 304 Not Modified without querying the database.
     """
+    etag = resource_versions.current_etag(session.bind.sync_engine, ("fabrics_v2", ""), f"{offset}:{limit}")
+    if resource_versions.not_modified(if_none_match, etag):
+        return not_modified_response(etag)
     try:
-        fabrics = session.exec(select(FabricDbModelV2).offset(offset).limit(limit)).all()
+        fabrics = (await session.exec(select(FabricDbModelV2).offset(offset).limit(limit))).all()
     except Exception as error:
         raise HTTPException(status_code=500, detail=str(error)) from error
     response = []
@@ -69,6 +82,7 @@ def v2_fabrics_get(
             response.append(copy.deepcopy(response_fabric))
     except Exception as error:
         raise HTTPException(status_code=500, detail=str(error)) from error
+    http_response.headers["ETag"] = etag
     try:
         return response
     except Exception as error:
@@ -1,15 +1,27 @@
 #!/usr/bin/env python
 
+import functools
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Iterator
 
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 
-from ...app.db import get_session
+from ...app.common.query_stats import QueryStats, collect_queries, count_queries
+from ...app.db import batch_session, build_async_engine, check_batch_open, get_async_session, get_session
 from ...app.main import app
 
+FABRICS_PATH = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics"
+SWITCHES_PATH = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/switches"
+
 
 def get_timestamp_from_tz_aware_datetime_string(date_str):
     """
@@ -87,6 +99,118 @@ def timestamps_within_delta(ts1, ts2, delta=900000):
     return dt2 - dt1 <= timedelta(microseconds=delta)
 
 
+def discover_body(switches: list[tuple[str, str, str, str]]) -> dict:
+    """
+    # Summary
+
+    Return a discover request body for switches, a list of
+    (serialNumber, ipaddr, platform, version) tuples.
+    """
+    items = []
+    for serial_number, ip_address, platform, version in switches:
+        items.append(
+            {
+                "deviceIndex": f"{serial_number}({serial_number})",
+                "serialNumber": serial_number,
+                "sysName": serial_number,
+                "platform": platform,
+                "version": version,
+                "ipaddr": ip_address,
+            }
+        )
+    return {"seedIP": items[0]["ipaddr"], "username": "admin", "password": "password", "preserveConfig": False, "switches": items}
+
+
+def create_fabric_with_switches(client: TestClient, fabric_name: str = "F1"):
+    """
+    # Summary
+
+    Create fabric_name and discover three switches into it.
+    """
+    response = client.post(f"{FABRICS_PATH}/{fabric_name}/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+    switches = [
+        ("FOX0001AAAA", "10.1.1.1", "N9K-C93180YC-EX", "10.2(5)"),
+        ("FOX0002AAAA", "10.1.1.2", "N9K-C93180YC-EX", "10.2(5)"),
+        ("FOX0003AAAA", "10.1.1.3", "N9K-C9336C-FX2", "10.3(1)"),
+    ]
+    response = client.post(f"{FABRICS_PATH}/{fabric_name}/inventory/discover", json=discover_body(switches))
+    assert response.status_code == 200
+
+
+@contextmanager
+def count_statements(db_engine: Engine) -> Iterator[list[str]]:
+    """
+    # Summary
+
+    Yield a list that collects the SQL statements executed on db_engine
+    within the with block.
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=unused-argument,too-many-arguments
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """
+    # Summary
+
+    Yield the QueryStats of the with block, and fail if it executed more
+    than max_queries queries, listing the statements it executed.
+
+    Queries are counted in every thread, so requests sent through a
+    TestClient are counted.
+
+    ## Example
+
+    ```python
+    with assert_max_queries(2):
+        client.get(f"{FABRICS_PATH}/F1")
+    ```
+    """
+    with collect_queries() as stats:
+        yield stats
+    statements = "\n".join(f"{count} x {statement}" for statement, count in sorted(stats.statements.items(), key=lambda item: item[1], reverse=True))
+    assert stats.queries <= max_queries, f"Expected at most {max_queries} queries, got {stats.queries}:\n{statements}"
+
+
+@functools.cache
+def schema_template() -> sqlite3.Connection:
+    """
+    # Summary
+
+    Return an in-memory database holding the empty schema of every table,
+    built with SQLModel.metadata.create_all() once per process.
+
+    Each pytest-xdist worker is a process of its own, so each builds its
+    own template, and no file or lock is shared between workers.
+    """
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    engine = create_engine("sqlite://", creator=lambda: template, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    return template
+
+
+def clone_schema(db_engine: Engine) -> None:
+    """
+    # Summary
+
+    Copy the schema_template() database over the database of db_engine
+    with the SQLite backup API.  This is ~15x faster than create_all(),
+    which emits a CREATE statement, and reflects, every table and index.
+    """
+    with db_engine.connect() as connection:
+        schema_template().backup(connection.connection.dbapi_connection)
+
+
 @pytest.fixture(name="session")
 def session_fixture():
     """
@@ -94,9 +218,14 @@ def session_fixture():
 
     Return a SQLModel Session() instance that interacts with an in-memory
     database.
+
+    The database is a clone of schema_template(), so the schema is built
+    once per process rather than once per test.  Its queries are counted,
+    as those of build_engine(), by count_queries().
     """
     engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
-    SQLModel.metadata.create_all(engine)
+    clone_schema(engine)
+    count_queries(engine)
     with Session(engine) as session:
         yield session
 
@@ -110,12 +239,25 @@ def client_fixture(session: Session):
 
     After the calling test case completes, execution continues
     after the yield statement to clear the SQLModel Session.
+
+    Handlers that use get_async_session share the in-memory database
+    of session.  Requests within a /mock/batch use the batch's session,
+    and requests outside an open batch are refused, as they are with
+    get_session.
     """
+    async_engine = build_async_engine(session.get_bind())
+
+    def get_session_override(request: Request):
+        check_batch_open(request, session.get_bind())
+        return batch_session.get() or session
 
-    def get_session_override():
-        return session
+    async def get_async_session_override(request: Request):
+        check_batch_open(request, session.get_bind())
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
 
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
 
     client = TestClient(app)
     yield client
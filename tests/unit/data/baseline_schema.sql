@@ -0,0 +1,444 @@
+BEGIN TRANSACTION;
+CREATE TABLE fabricdbmodelv1 (
+	abstract_anycast_rp VARCHAR, 
+	abstract_bgp_neighbor VARCHAR, 
+	abstract_bgp_rr VARCHAR, 
+	abstract_bgp VARCHAR, 
+	abstract_dhcp VARCHAR, 
+	abstract_extra_config_bootstrap VARCHAR, 
+	abstract_extra_config_leaf VARCHAR, 
+	abstract_extra_config_spine VARCHAR, 
+	abstract_extra_config_tor VARCHAR, 
+	abstract_feature_leaf VARCHAR, 
+	abstract_feature_spine VARCHAR, 
+	abstract_isis VARCHAR, 
+	abstract_isis_interface VARCHAR, 
+	abstract_loopback_interface VARCHAR, 
+	abstract_multicast VARCHAR, 
+	abstract_ospf VARCHAR, 
+	abstract_ospf_interface VARCHAR, 
+	abstract_pim_interface VARCHAR, 
+	abstract_route_map VARCHAR, 
+	abstract_routed_host VARCHAR, 
+	abstract_trunk_host VARCHAR, 
+	abstract_vlan_interface VARCHAR, 
+	abstract_vpc_domain VARCHAR, 
+	default_network VARCHAR, 
+	default_pvlan_sec_network VARCHAR, 
+	default_vrf VARCHAR, 
+	temp_anycast_gateway VARCHAR(15), 
+	temp_vpc_domain_mgmt VARCHAR(15), 
+	temp_vpc_peer_link VARCHAR(20), 
+	vrf_extension_template VARCHAR, 
+	"enableRealTimeBackup" BOOLEAN, 
+	"enableScheduledBackup" BOOLEAN, 
+	"scheduledTime" VARCHAR, 
+	"AAA_REMOTE_IP_ENABLED" BOOLEAN, 
+	"AAA_SERVER_CONF" VARCHAR, 
+	"ACTIVE_MIGRATION" BOOLEAN, 
+	"ADVERTISE_PIP_BGP" BOOLEAN, 
+	"AGENT_INTF" VARCHAR(4), 
+	"ANYCAST_BGW_ADVERTISE_PIP" BOOLEAN, 
+	"ANYCAST_GW_MAC" VARCHAR, 
+	"ANYCAST_LB_ID" INTEGER, 
+	"ANYCAST_RP_IP_RANGE" VARCHAR, 
+	"ANYCAST_RP_IP_RANGE_INTERNAL" VARCHAR, 
+	"AUTO_SYMMETRIC_DEFAULT_VRF" BOOLEAN, 
+	"AUTO_SYMMETRIC_VRF_LITE" BOOLEAN, 
+	"AUTO_VRFLITE_IFC_DEFAULT_VRF" BOOLEAN, 
+	"BFD_AUTH_ENABLE" BOOLEAN, 
+	"BFD_AUTH_KEY_ID" INTEGER, 
+	"BFD_AUTH_KEY" VARCHAR(40), 
+	"BFD_ENABLE" BOOLEAN, 
+	"BFD_IBGP_ENABLE" BOOLEAN, 
+	"BFD_OSPF_ENABLE" BOOLEAN, 
+	"BFD_ISIS_ENABLE" BOOLEAN, 
+	"BFD_PIM_ENABLE" BOOLEAN, 
+	"BGP_AS" VARCHAR NOT NULL, 
+	"BGP_AS_PREV" VARCHAR, 
+	"BGP_AUTH_ENABLE" BOOLEAN, 
+	"BGP_AUTH_KEY_TYPE" VARCHAR(5), 
+	"BGP_AUTH_KEY" VARCHAR(256), 
+	"BGP_LB_ID" INTEGER, 
+	"BOOTSTRAP_CONF" VARCHAR, 
+	"BOOTSTRAP_ENABLE_PREV" BOOLEAN, 
+	"BOOTSTRAP_ENABLE" BOOLEAN, 
+	"BOOTSTRAP_MULTISUBNET_INTERNAL" VARCHAR, 
+	"BOOTSTRAP_MULTISUBNET" VARCHAR, 
+	"BRFIELD_DEBUG_FLAG" VARCHAR(7), 
+	"BROWNFIELD_NETWORK_NAME_FORMAT" VARCHAR, 
+	"BROWNFIELD_SKIP_OVERLAY_NETWORK_ATTACHMENTS" BOOLEAN, 
+	"CDP_ENABLE" BOOLEAN, 
+	"COPP_POLICY" VARCHAR(8), 
+	"DCI_SUBNET_RANGE" VARCHAR, 
+	"DCI_SUBNET_TARGET_MASK" INTEGER, 
+	"DEAFULT_QUEUING_POLICY_CLOUDSCALE" VARCHAR, 
+	"DEAFULT_QUEUING_POLICY_OTHER" VARCHAR, 
+	"DEAFULT_QUEUING_POLICY_R_SERIES" VARCHAR, 
+	"DEFAULT_VRF_REDIS_BGP_RMAP" VARCHAR, 
+	"DEPLOYMENT_FREEZE" BOOLEAN, 
+	"DHCP_ENABLE" BOOLEAN, 
+	"DHCP_END" VARCHAR, 
+	"DHCP_END_INTERNAL" VARCHAR, 
+	"DHCP_IPV6_ENABLE_INTERNAL" VARCHAR, 
+	"DHCP_IPV6_ENABLE" VARCHAR(6), 
+	"DHCP_START" VARCHAR, 
+	"DHCP_START_INTERNAL" VARCHAR, 
+	"DNS_SERVER_IP_LIST" VARCHAR, 
+	"DNS_SERVER_VRF" VARCHAR, 
+	"ENABLE_AAA" BOOLEAN, 
+	"ENABLE_AGENT" BOOLEAN, 
+	"ENABLE_DEFAULT_QUEUING_POLICY" BOOLEAN, 
+	"ENABLE_EVPN" BOOLEAN, 
+	"ENABLE_FABRIC_VPC_DOMAIN_ID" BOOLEAN, 
+	"ENABLE_FABRIC_VPC_DOMAIN_ID_PREV" BOOLEAN, 
+	"ENABLE_MACSEC" BOOLEAN, 
+	"ENABLE_NETFLOW" BOOLEAN, 
+	"ENABLE_NETFLOW_PREV" BOOLEAN, 
+	"ENABLE_NGOAM" BOOLEAN, 
+	"ENABLE_NXAPI_HTTP" BOOLEAN, 
+	"ENABLE_NXAPI" BOOLEAN, 
+	"ENABLE_PBR" BOOLEAN, 
+	"ENABLE_PVLAN_PREV" BOOLEAN, 
+	"ENABLE_PVLAN" BOOLEAN, 
+	"ENABLE_TENANT_DHCP" BOOLEAN, 
+	"ENABLE_TRM" BOOLEAN, 
+	"ENABLE_VPC_PEER_LINK_NATIVE_VLAN" BOOLEAN, 
+	"EXTRA_CONF_INTRA_LINKS" VARCHAR, 
+	"EXTRA_CONF_LEAF" VARCHAR, 
+	"EXTRA_CONF_SPINE" VARCHAR, 
+	"EXTRA_CONF_TOR" VARCHAR, 
+	"FABRIC_INTERFACE_TYPE" VARCHAR(10), 
+	"FABRIC_NAME" VARCHAR(32), 
+	"FABRIC_MTU" INTEGER, 
+	"FABRIC_MTU_PREV" INTEGER, 
+	"FABRIC_TYPE" VARCHAR, 
+	"FABRIC_VPC_DOMAIN_ID" INTEGER, 
+	"FABRIC_VPC_DOMAIN_ID_PREV" INTEGER, 
+	"FABRIC_VPC_QOS" BOOLEAN, 
+	"FABRIC_VPC_QOS_POLICY_NAME" VARCHAR, 
+	"FEATURE_PTP" BOOLEAN, 
+	"FEATURE_PTP_INTERNAL" BOOLEAN, 
+	"FF" VARCHAR(11) NOT NULL, 
+	"GRFIELD_DEBUG_FLAG" VARCHAR(7), 
+	"HD_TIME" INTEGER, 
+	"HOST_INTF_ADMIN_STATE" BOOLEAN, 
+	"IBGP_PEER_TEMPLATE" VARCHAR, 
+	"IBGP_PEER_TEMPLATE_LEAF" VARCHAR, 
+	"INBAND_DHCP_SERVERS" VARCHAR, 
+	"INBAND_MGMT_PREV" BOOLEAN, 
+	"INBAND_MGMT" BOOLEAN, 
+	"ISIS_AUTH_ENABLE" BOOLEAN, 
+	"ISIS_AUTH_KEY" VARCHAR(255), 
+	"ISIS_AUTH_KEYCHAIN_KEY_ID" INTEGER, 
+	"ISIS_AUTH_KEYCHAIN_NAME" VARCHAR(63), 
+	"ISIS_LEVEL" VARCHAR(7), 
+	"ISIS_OVERLOAD_ELAPSE_TIME" INTEGER, 
+	"ISIS_OVERLOAD_ENABLE" BOOLEAN, 
+	"ISIS_P2P_ENABLE" BOOLEAN, 
+	"L2_HOST_INTF_MTU_PREV" INTEGER, 
+	"L2_HOST_INTF_MTU" INTEGER, 
+	"L2_SEGMENT_ID_RANGE" VARCHAR, 
+	"L3_PARTITION_ID_RANGE" VARCHAR, 
+	"L3VNI_MCAST_GROUP" VARCHAR, 
+	"LINK_STATE_ROUTING_TAG_PREV" VARCHAR, 
+	"LINK_STATE_ROUTING_TAG" VARCHAR(20), 
+	"LINK_STATE_ROUTING" VARCHAR(4), 
+	"LOOPBACK0_IP_RANGE" VARCHAR, 
+	"LOOPBACK0_IPV6_RANGE" VARCHAR, 
+	"LOOPBACK1_IP_RANGE" VARCHAR, 
+	"LOOPBACK1_IPV6_RANGE" VARCHAR, 
+	"MACSEC_ALGORITHM" VARCHAR(12), 
+	"MACSEC_CIPHER_SUITE" VARCHAR(15), 
+	"MACSEC_FALLBACK_ALGORITHM" VARCHAR(12), 
+	"MACSEC_FALLBACK_KEY_STRING" VARCHAR(130), 
+	"MACSEC_KEY_STRING" VARCHAR(130), 
+	"MACSEC_REPORT_TIMER" INTEGER, 
+	"MGMT_GW_INTERNAL" VARCHAR, 
+	"MGMT_GW" VARCHAR, 
+	"MGMT_PREFIX_INTERNAL" INTEGER, 
+	"MGMT_PREFIX" INTEGER, 
+	"MGMT_V6PREFIX_INTERNAL" INTEGER, 
+	"MGMT_V6PREFIX" INTEGER, 
+	"MPLS_HANDOFF" BOOLEAN, 
+	"MPLS_LB_ID" INTEGER, 
+	"MPLS_LOOPBACK_IP_RANGE" VARCHAR, 
+	"MSO_CONNECTIVITY_DEPLOYED" VARCHAR, 
+	"MSO_CONTROLER_ID" VARCHAR, 
+	"MSO_SITE_GROUP_NAME" VARCHAR, 
+	"MSO_SITE_ID" VARCHAR, 
+	"MST_INSTANCE_RANGE" VARCHAR, 
+	"MULTICAST_GROUP_SUBNET" VARCHAR, 
+	"NETFLOW_EXPORTER_LIST" VARCHAR, 
+	"NETFLOW_MONITOR_LIST" VARCHAR, 
+	"NETFLOW_RECORD_LIST" VARCHAR, 
+	network_extension_template VARCHAR, 
+	"NETWORK_VLAN_RANGE" VARCHAR, 
+	"NTP_SERVER_IP_LIST" VARCHAR, 
+	"NTP_SERVER_VRF" VARCHAR, 
+	"NVE_LB_ID" INTEGER, 
+	"OSPF_AREA_ID" VARCHAR, 
+	"OSPF_AUTH_ENABLE" BOOLEAN, 
+	"OSPF_AUTH_KEY" VARCHAR(256), 
+	"OSPF_AUTH_KEY_ID" INTEGER, 
+	"OVERLAY_MODE_PREV" VARCHAR(14), 
+	"OVERLAY_MODE" VARCHAR(14), 
+	"PHANTOM_RP_LB_ID1" VARCHAR, 
+	"PHANTOM_RP_LB_ID2" VARCHAR, 
+	"PHANTOM_RP_LB_ID3" VARCHAR, 
+	"PHANTOM_RP_LB_ID4" VARCHAR, 
+	"PIM_HELLO_AUTH_ENABLE" BOOLEAN, 
+	"PIM_HELLO_AUTH_KEY" VARCHAR(256), 
+	"PM_ENABLE_PREV" BOOLEAN, 
+	"PM_ENABLE" BOOLEAN, 
+	"POWER_REDUNDANCY_MODE" VARCHAR(15), 
+	"PREMSO_PARENT_FABRIC" VARCHAR, 
+	"PTP_DOMAIN_ID" INTEGER, 
+	"PTP_LB_ID" INTEGER, 
+	"REPLICATION_MODE" VARCHAR(9), 
+	"ROUTER_ID_RANGE" VARCHAR, 
+	"ROUTE_MAP_SEQUENCE_NUMBER_RANGE" VARCHAR, 
+	"RP_COUNT" VARCHAR(4), 
+	"RP_LB_ID" INTEGER, 
+	"RP_MODE" VARCHAR(5), 
+	"RR_COUNT" VARCHAR(4), 
+	"SEED_SWITCH_CORE_INTERFACES" VARCHAR, 
+	"SERVICE_NETWORK_VLAN_RANGE" VARCHAR, 
+	"SITE_ID" VARCHAR(15), 
+	"SNMP_SERVER_HOST_TRAP" BOOLEAN, 
+	"SPINE_COUNT" INTEGER, 
+	"SPINE_SWITCH_CORE_INTERFACES" VARCHAR, 
+	"SSPINE_COUNT" INTEGER, 
+	"SSPINE_ADD_DEL_DEBUG_FLAG" VARCHAR(7), 
+	"STATIC_UNDERLAY_IP_ALLOC" BOOLEAN, 
+	"STP_BRIDGE_PRIORITY" VARCHAR(10), 
+	"STP_ROOT_OPTION" VARCHAR(10), 
+	"SPT_VLAN_RANGE" VARCHAR, 
+	"STRICT_CC_MODE" BOOLEAN, 
+	"SUBINTERFACE_RANGE" VARCHAR, 
+	"SUBNET_RANGE" VARCHAR, 
+	"SUBNET_TARGET_MASK" INTEGER, 
+	"SYSLOG_SERVER_IP_LIST" VARCHAR, 
+	"SYSLOG_SERVER_VRF" VARCHAR, 
+	"SYSLOG_SEV" VARCHAR, 
+	"TCAM_ALLOCATION" BOOLEAN, 
+	"UNDERLAY_IS_V6" BOOLEAN, 
+	"UNNUM_BOOTSTRAP_LB_ID" INTEGER, 
+	"UNNUM_DHCP_END" VARCHAR, 
+	"UNNUM_DHCP_END_INTERNAL" VARCHAR, 
+	"UNNUM_DHCP_START" VARCHAR, 
+	"UNNUM_DHCP_START_INTERNAL" VARCHAR, 
+	"USE_LINK_LOCAL" BOOLEAN, 
+	"V6_SUBNET_RANGE" VARCHAR, 
+	"V6_SUBNET_TARGET_MASK" INTEGER, 
+	"VPC_AUTO_RECOVERY_TIME" INTEGER, 
+	"VPC_DELAY_RESTORE_TIME" INTEGER, 
+	"VPC_DELAY_RESTORE" INTEGER, 
+	"VPC_DOMAIN_ID_RANGE" VARCHAR, 
+	"VPC_ENABLE_IPv6_ND_SYNC" BOOLEAN, 
+	"VPC_PEER_KEEP_ALIVE_OPTION" VARCHAR(10), 
+	"VPC_PEER_LINK_PO" VARCHAR, 
+	"VPC_PEER_LINK_VLAN" VARCHAR, 
+	"VRF_LITE_AUTOCONFIG" VARCHAR(22), 
+	"VRF_VLAN_RANGE" VARCHAR, 
+	id INTEGER NOT NULL, 
+	created_at DATETIME, 
+	updated_at DATETIME, 
+	PRIMARY KEY (id)
+);
+INSERT INTO "fabricdbmodelv1" VALUES('anycast_rp','evpn_bgp_rr_neighbor','evpn_bgp_rr','base_bgp','base_dhcp','extra_config_bootstrap_11_1','extra_config_leaf','extra_config_spine','extra_config_tor','base_feature_leaf_upg','base_feature_spine_upg','base_isis_level2','isis_interface','int_fabric_loopback_11_1','base_multicast_11_1','base_ospf','ospf_interface_11_1','pim_interface','route_map','int_routed_host','int_trunk_host','int_fabric_vlan_11_1','base_vpc_domain_11_1','Default_Network_Universal','Pvlan_Secondary_Network','Default_VRF_Universal','anycast_gateway','vpc_domain_mgmt','int_vpc_peer_link_po','Default_VRF_Extension_Universal',0,0,'',0,NULL,0,0,NULL,0,'2020.0000.00aa',10,'10.254.254.0/24',NULL,0,0,0,0,100,NULL,0,0,0,0,0,'65001',NULL,0,'Three',NULL,0,NULL,0,0,NULL,'#Scope_Start_IP, Scope_End_IP, Scope_Default_Gateway, Scope_Subnet_Prefix','Disable','Auto_Net_VNI$$VNI$$_VLAN$$VLAN_ID$$',0,0,'strict','10.33.0.0/16',30,'queuing_policy_default_8q_cloudscale','queuing_policy_default_other','queuing_policy_default_r_series','extcon-rmap-filter',0,0,NULL,NULL,NULL,'DHCPv4',NULL,NULL,NULL,NULL,0,0,0,1,0,0,0,0,0,1,1,1,0,0,0,1,0,0,NULL,NULL,NULL,NULL,'p2p','F1',9000,9216,'Switch_Fabric',1,1,0,'spine_qos_for_fabric_vpc_peering',0,0,'Easy_Fabric','Disable',180,0,NULL,NULL,NULL,0,0,0,NULL,127,NULL,'level_2',60,1,0,9216,9216,'30000-49000','50000-59000','239.1.1.0',NULL,'UNDERLAY','ospf','10.2.0.0/22','fd00::a02:0/119','10.3.0.0/22','fd00::a03:0/118','AES_128_CMAC','GCM_AES_XPN_256','AES_128_CMAC',NULL,NULL,5,NULL,NULL,NULL,24,NULL,64,0,101,'10.101.0.0/25',NULL,NULL,NULL,NULL,'0','239.1.1.0/25',NULL,NULL,NULL,'Default_Network_Extension_Universal','2300-2999',NULL,NULL,1,'0.0.0.0',0,NULL,127,'cli','cli',NULL,NULL,NULL,NULL,0,NULL,0,0,'ps_redundant',NULL,0,0,'Ingress',NULL,NULL,'Two',254,'asm','Two',NULL,'3000-3199',NULL,1,0,'',0,'Disable',0,'STPP_0','unmanaged','1-3967',0,'2-511','10.4.0.0/16',30,'','','',1,0,253,'','','','',0,'fd00::a04:0/112',126,360,60,150,'1-1000',1,'management','500','3600','Manual','2000-2299',1,'2026-10-18 01:31:38.741468','2026-10-18 01:31:38.741496');
+INSERT INTO "fabricdbmodelv1" VALUES('anycast_rp','evpn_bgp_rr_neighbor','evpn_bgp_rr','base_bgp','base_dhcp','extra_config_bootstrap_11_1','extra_config_leaf','extra_config_spine','extra_config_tor','base_feature_leaf_upg','base_feature_spine_upg','base_isis_level2','isis_interface','int_fabric_loopback_11_1','base_multicast_11_1','base_ospf','ospf_interface_11_1','pim_interface','route_map','int_routed_host','int_trunk_host','int_fabric_vlan_11_1','base_vpc_domain_11_1','Default_Network_Universal','Pvlan_Secondary_Network','Default_VRF_Universal','anycast_gateway','vpc_domain_mgmt','int_vpc_peer_link_po','Default_VRF_Extension_Universal',0,0,'',0,NULL,0,0,NULL,0,'2020.0000.00aa',10,'10.254.254.0/24',NULL,0,0,0,0,100,NULL,0,0,0,0,0,'65002',NULL,0,'Three',NULL,0,NULL,0,0,NULL,'#Scope_Start_IP, Scope_End_IP, Scope_Default_Gateway, Scope_Subnet_Prefix','Disable','Auto_Net_VNI$$VNI$$_VLAN$$VLAN_ID$$',0,0,'strict','10.33.0.0/16',30,'queuing_policy_default_8q_cloudscale','queuing_policy_default_other','queuing_policy_default_r_series','extcon-rmap-filter',0,0,NULL,NULL,NULL,'DHCPv4',NULL,NULL,NULL,NULL,0,0,0,1,0,0,0,0,0,1,1,1,0,0,0,1,0,0,NULL,NULL,NULL,NULL,'p2p','F2',9216,9216,'Switch_Fabric',1,1,0,'spine_qos_for_fabric_vpc_peering',0,0,'Easy_Fabric','Disable',180,0,NULL,NULL,NULL,0,0,0,NULL,127,NULL,'level_2',60,1,0,9216,9216,'30000-49000','50000-59000','239.1.1.0',NULL,'UNDERLAY','ospf','10.2.0.0/22','fd00::a02:0/119','10.3.0.0/22','fd00::a03:0/118','AES_128_CMAC','GCM_AES_XPN_256','AES_128_CMAC',NULL,NULL,5,NULL,NULL,NULL,24,NULL,64,0,101,'10.101.0.0/25',NULL,NULL,NULL,NULL,'0','239.1.1.0/25',NULL,NULL,NULL,'Default_Network_Extension_Universal','2300-2999',NULL,NULL,1,'0.0.0.0',0,NULL,127,'cli','cli',NULL,NULL,NULL,NULL,0,NULL,0,0,'ps_redundant',NULL,0,0,'Multicast',NULL,NULL,'Two',254,'asm','Two',NULL,'3000-3199',NULL,1,0,'',0,'Disable',0,'STPP_0','unmanaged','1-3967',0,'2-511','10.4.0.0/16',30,'','','',1,0,253,'','','','',0,'fd00::a04:0/112',126,360,60,150,'1-1000',1,'management','500','3600','Manual','2000-2299',2,'2026-10-18 01:31:38.814082','2026-10-18 01:31:38.814100');
+CREATE TABLE fabricdbmodelv2 (
+	"bgpAsn" VARCHAR NOT NULL, 
+	type VARCHAR NOT NULL, 
+	latitude FLOAT NOT NULL, 
+	longitude FLOAT NOT NULL, 
+	category VARCHAR NOT NULL, 
+	"licenseTier" VARCHAR NOT NULL, 
+	name VARCHAR NOT NULL, 
+	"securityDomain" VARCHAR NOT NULL, 
+	"telemetryCollectionType" VARCHAR NOT NULL, 
+	"telemetryStreamingProtocol" VARCHAR NOT NULL, 
+	"telemetrySourceInterface" VARCHAR, 
+	"telemetrySourceVrf" VARCHAR, 
+	PRIMARY KEY (name)
+);
+CREATE TABLE switchconfigdbmodel (
+	in_sync INTEGER NOT NULL, 
+	out_of_sync INTEGER NOT NULL, 
+	fabric VARCHAR NOT NULL, 
+	PRIMARY KEY (fabric)
+);
+INSERT INTO "switchconfigdbmodel" VALUES(1,0,'F1');
+INSERT INTO "switchconfigdbmodel" VALUES(0,0,'F2');
+CREATE TABLE switchdbmodel (
+	"activeSupSlot" INTEGER NOT NULL, 
+	"availPorts" INTEGER NOT NULL, 
+	"ccStatus" VARCHAR NOT NULL, 
+	"cfsSyslogStatus" INTEGER NOT NULL, 
+	"colDBId" INTEGER NOT NULL, 
+	"connUnitStatus" INTEGER NOT NULL, 
+	"consistencyState" BOOLEAN NOT NULL, 
+	contact VARCHAR, 
+	"cpuUsage" INTEGER NOT NULL, 
+	"deviceType" VARCHAR NOT NULL, 
+	"displayHdrs" VARCHAR, 
+	"displayValues" VARCHAR, 
+	domain VARCHAR, 
+	"domainID" INTEGER NOT NULL, 
+	"elementType" VARCHAR, 
+	"fabricId" INTEGER NOT NULL, 
+	"fabricName" VARCHAR NOT NULL, 
+	"fabricTechnology" VARCHAR NOT NULL, 
+	"fcoeEnabled" BOOLEAN NOT NULL, 
+	fex BOOLEAN NOT NULL, 
+	fid INTEGER NOT NULL, 
+	"freezeMode" VARCHAR, 
+	health INTEGER NOT NULL, 
+	"hostName" VARCHAR NOT NULL, 
+	"index" INTEGER NOT NULL, 
+	"intentedpeerName" VARCHAR NOT NULL, 
+	interfaces VARCHAR, 
+	"ipAddress" VARCHAR NOT NULL, 
+	"ipDomain" VARCHAR NOT NULL, 
+	"isEchSupport" BOOLEAN NOT NULL, 
+	"isLan" BOOLEAN NOT NULL, 
+	"isNonNexus" BOOLEAN NOT NULL, 
+	"isPmCollect" BOOLEAN NOT NULL, 
+	"isSharedBorder" BOOLEAN NOT NULL, 
+	"isTrapDelayed" BOOLEAN NOT NULL, 
+	"isVpcConfigured" BOOLEAN NOT NULL, 
+	is_smlic_enabled BOOLEAN NOT NULL, 
+	"keepAliveState" VARCHAR, 
+	"lastScanTime" INTEGER NOT NULL, 
+	"licenseDetail" VARCHAR, 
+	"licenseViolation" BOOLEAN NOT NULL, 
+	"linkName" VARCHAR, 
+	location VARCHAR, 
+	"logicalName" VARCHAR NOT NULL, 
+	managable BOOLEAN NOT NULL, 
+	mds BOOLEAN NOT NULL, 
+	membership VARCHAR, 
+	"memoryUsage" INTEGER NOT NULL, 
+	"mgmtAddress" VARCHAR, 
+	mode VARCHAR NOT NULL, 
+	model VARCHAR NOT NULL, 
+	"modelType" INTEGER NOT NULL, 
+	"moduleIndexOffset" INTEGER NOT NULL, 
+	modules VARCHAR, 
+	"monitorMode" VARCHAR, 
+	name VARCHAR, 
+	network VARCHAR, 
+	"nonMdsModel" VARCHAR, 
+	"npvEnabled" BOOLEAN NOT NULL, 
+	"numberOfPorts" INTEGER NOT NULL, 
+	"operMode" VARCHAR, 
+	"operStatus" VARCHAR NOT NULL, 
+	peer VARCHAR, 
+	"peerSerialNumber" VARCHAR, 
+	"peerSwitchDbId" INTEGER NOT NULL, 
+	"peerlinkState" VARCHAR, 
+	ports INTEGER NOT NULL, 
+	present BOOLEAN NOT NULL, 
+	"primaryIP" VARCHAR NOT NULL, 
+	"primarySwitchDbID" INTEGER NOT NULL, 
+	principal VARCHAR, 
+	"protoDiscSettings" VARCHAR, 
+	"recvIntf" VARCHAR, 
+	release VARCHAR NOT NULL, 
+	role VARCHAR, 
+	"sanAnalyticsCapable" BOOLEAN NOT NULL, 
+	scope VARCHAR, 
+	"secondaryIP" VARCHAR NOT NULL, 
+	"secondarySwitchDbID" INTEGER NOT NULL, 
+	"sendIntf" VARCHAR, 
+	"sharedBorder" BOOLEAN NOT NULL, 
+	"sourceInterface" VARCHAR NOT NULL, 
+	"sourceVrf" VARCHAR NOT NULL, 
+	"standbySupState" INTEGER NOT NULL, 
+	status VARCHAR NOT NULL, 
+	"swType" VARCHAR, 
+	"swUUID" VARCHAR NOT NULL, 
+	"swUUIDId" INTEGER, 
+	"swWwn" VARCHAR, 
+	"swWwnName" VARCHAR, 
+	"switchDbID" INTEGER NOT NULL, 
+	"switchRole" VARCHAR NOT NULL, 
+	"switchRoleEnum" VARCHAR NOT NULL, 
+	"sysDescr" VARCHAR NOT NULL, 
+	"systemMode" VARCHAR NOT NULL, 
+	uid INTEGER NOT NULL, 
+	"unmanagableCause" VARCHAR NOT NULL, 
+	"upTime" INTEGER NOT NULL, 
+	"upTimeNumber" INTEGER NOT NULL, 
+	"upTimeStr" VARCHAR NOT NULL, 
+	"usedPorts" INTEGER NOT NULL, 
+	username VARCHAR, 
+	"vdcId" INTEGER NOT NULL, 
+	"vdcMac" VARCHAR, 
+	"vdcName" VARCHAR NOT NULL, 
+	vendor VARCHAR NOT NULL, 
+	version VARCHAR, 
+	"vpcDomain" INTEGER NOT NULL, 
+	vrf VARCHAR NOT NULL, 
+	"vsanWwn" VARCHAR, 
+	"vsanWwnName" VARCHAR, 
+	"waitForSwitchModeChg" BOOLEAN NOT NULL, 
+	wwn VARCHAR, 
+	"serialNumber" VARCHAR NOT NULL, 
+	PRIMARY KEY ("switchDbID")
+);
+INSERT INTO "switchdbmodel" VALUES(1,48,'In-Sync',0,0,0,1,'',0,'Switch_Fabric','','','',0,'',1,'F1','Easy_Fabric',0,0,0,'',0,'leaf1',0,'','','10.1.1.1','',0,0,0,0,0,0,0,0,'',0,'',0,'','','leaf1',1,0,'',0,'','Normal','N9K-C93180YC-EX',0,9999,NULL,NULL,'leaf1',NULL,NULL,0,48,NULL,'Healthy','','',0,'',0,1,'',0,'','','','10.2(5)','',0,'','',0,'',0,'mgmt0','management',0,'','','DCNM-UUID-TEMP',99999,'','',1,'spine','spine','','Normal',0,'',0,0,'',0,'',0,'','','cisco','10.2(5)',0,'management','','',0,'','FOX0001AAAA');
+CREATE TABLE switchhealthdbmodel (
+	"Healthy" INTEGER NOT NULL, 
+	"Major" INTEGER NOT NULL, 
+	"Minor" INTEGER NOT NULL, 
+	fabric VARCHAR NOT NULL, 
+	PRIMARY KEY (fabric)
+);
+INSERT INTO "switchhealthdbmodel" VALUES(1,0,0,'F1');
+INSERT INTO "switchhealthdbmodel" VALUES(0,0,0,'F2');
+CREATE TABLE switchhwdbmodel (
+	count INTEGER NOT NULL, 
+	fabric VARCHAR NOT NULL, 
+	model VARCHAR NOT NULL, 
+	PRIMARY KEY (fabric, model)
+);
+INSERT INTO "switchhwdbmodel" VALUES(0,'F1','ignore');
+INSERT INTO "switchhwdbmodel" VALUES(0,'F2','ignore');
+INSERT INTO "switchhwdbmodel" VALUES(1,'F1','N9K-C93180YC-EX');
+CREATE TABLE switchrolesdbmodel (
+	access INTEGER NOT NULL, 
+	aggregation INTEGER NOT NULL, 
+	border INTEGER NOT NULL, 
+	border_gateway INTEGER NOT NULL, 
+	border_gateway_spine INTEGER NOT NULL, 
+	border_gateway_super_spine INTEGER NOT NULL, 
+	border_spine INTEGER NOT NULL, 
+	border_super_spine INTEGER NOT NULL, 
+	core_router INTEGER NOT NULL, 
+	edge_router INTEGER NOT NULL, 
+	leaf INTEGER NOT NULL, 
+	spine INTEGER NOT NULL, 
+	super_spine INTEGER NOT NULL, 
+	tor INTEGER NOT NULL, 
+	fabric VARCHAR NOT NULL, 
+	PRIMARY KEY (fabric)
+);
+INSERT INTO "switchrolesdbmodel" VALUES(0,0,0,0,0,0,0,0,0,0,0,1,0,0,'F1');
+INSERT INTO "switchrolesdbmodel" VALUES(0,0,0,0,0,0,0,0,0,0,0,0,0,0,'F2');
+CREATE TABLE switchswversionsdbmodel (
+	count INTEGER NOT NULL, 
+	fabric VARCHAR NOT NULL, 
+	version_name VARCHAR NOT NULL, 
+	PRIMARY KEY (fabric, version_name)
+);
+INSERT INTO "switchswversionsdbmodel" VALUES(0,'F1','ignore');
+INSERT INTO "switchswversionsdbmodel" VALUES(0,'F2','ignore');
+INSERT INTO "switchswversionsdbmodel" VALUES(1,'F1','10.2(5)');
+CREATE INDEX "ix_fabricdbmodelv1_BGP_AS" ON fabricdbmodelv1 ("BGP_AS");
+CREATE UNIQUE INDEX "ix_fabricdbmodelv1_FABRIC_NAME" ON fabricdbmodelv1 ("FABRIC_NAME");
+CREATE INDEX "ix_switchdbmodel_hostName" ON switchdbmodel ("hostName");
+CREATE UNIQUE INDEX "ix_switchdbmodel_serialNumber" ON switchdbmodel ("serialNumber");
+CREATE UNIQUE INDEX "ix_switchdbmodel_ipAddress" ON switchdbmodel ("ipAddress");
+COMMIT;
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# pylint: disable=redefined-outer-name
+# pylint: disable=invalid-name
+import asyncio
+import json
+import os
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from ...app.common.enums.db import DB_ECHO_ENV_VAR, DB_PROFILE_ENV_VAR, DbProfileEnum
+from ...app.db import build_async_engine, build_engine, create_db_and_tables, get_db_echo, get_db_profile, get_session
+from ...app.main import app
+from ...app.v1.models.fabric import migrate_fabric_table
+from .common import FABRICS_PATH, clone_schema, session_fixture
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def pragma(db_engine, name: str):
+    """
+    # Summary
+
+    Return the value of PRAGMA name on a connection from db_engine.
+    """
+    with db_engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_db_profile_100(monkeypatch):
+    """
+    # Summary
+
+    Verify the default profile is file, with echo enabled.
+    """
+    monkeypatch.delenv(DB_PROFILE_ENV_VAR, raising=False)
+    monkeypatch.delenv(DB_ECHO_ENV_VAR, raising=False)
+    assert get_db_profile() == DbProfileEnum.file
+    assert get_db_echo(DbProfileEnum.file) is True
+    assert get_db_echo(DbProfileEnum.wal) is False
+
+
+def test_db_profile_110(monkeypatch):
+    """
+    # Summary
+
+    Verify NDFC_MOCK_DB_PROFILE selects the profile, and that an invalid
+    value raises ValueError.
+    """
+    monkeypatch.setenv(DB_PROFILE_ENV_VAR, "WAL")
+    assert get_db_profile() == DbProfileEnum.wal
+    monkeypatch.setenv(DB_PROFILE_ENV_VAR, "foo")
+    with pytest.raises(ValueError, match="Invalid NDFC_MOCK_DB_PROFILE"):
+        get_db_profile()
+
+
+def test_db_profile_120(monkeypatch):
+    """
+    # Summary
+
+    Verify NDFC_MOCK_DB_ECHO overrides the per-profile echo default.
+    """
+    monkeypatch.setenv(DB_ECHO_ENV_VAR, "false")
+    assert get_db_echo(DbProfileEnum.file) is False
+    monkeypatch.setenv(DB_ECHO_ENV_VAR, "1")
+    assert get_db_echo(DbProfileEnum.memory) is True
+
+
+def test_db_profile_200(tmp_path):
+    """
+    # Summary
+
+    Verify the wal profile applies its pragmas on connect.
+    """
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=str(tmp_path / "wal.db"))
+    assert pragma(db_engine, "journal_mode") == "wal"
+    assert pragma(db_engine, "synchronous") == 1
+    assert pragma(db_engine, "busy_timeout") == 5000
+    assert pragma(db_engine, "cache_size") == -65536
+    db_engine.dispose()
+
+
+def test_db_profile_210():
+    """
+    # Summary
+
+    Verify the memory profile has a single connection, and that a
+    connection of its async engine waits for it while the sync engine has
+    it checked out, and then sees the sync engine's committed writes.
+    """
+    db_engine = build_engine(DbProfileEnum.memory, echo=False)
+    db_async_engine = build_async_engine(db_engine)
+    assert isinstance(db_engine.pool, QueuePool)
+    assert db_engine.pool.size() == 1
+    assert pragma(db_engine, "synchronous") == 0
+
+    async def async_select():
+        async with db_async_engine.connect() as connection:
+            return (await connection.execute(text("SELECT x FROM t"))).scalar()
+
+    async def run():
+        connection = db_engine.connect()
+        connection.execute(text("CREATE TABLE t (x INTEGER)"))
+        connection.execute(text("INSERT INTO t VALUES (1)"))
+        task = asyncio.create_task(async_select())
+        await asyncio.sleep(0.2)
+        waited = not task.done()
+        connection.commit()
+        connection.close()
+        return waited, await task
+
+    try:
+        assert asyncio.run(run()) == (True, 1)
+    finally:
+        asyncio.run(db_async_engine.dispose())
+        db_engine.dispose()
+
+
+def test_db_profile_220():
+    """
+    # Summary
+
+    Verify connections from the shared profile see the same database,
+    and that a connection never reads another's uncommitted writes: it
+    fails with "database table is locked" instead.
+    """
+    db_engine = build_engine(DbProfileEnum.shared, echo=False, shared_cache_name="test_db_profile_220")
+    with db_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t (x INTEGER)"))
+        connection.execute(text("INSERT INTO t VALUES (1)"))
+    with db_engine.connect() as connection_1, db_engine.connect() as connection_2:
+        assert connection_1.execute(text("SELECT x FROM t")).scalar() == 1
+        assert connection_2.execute(text("SELECT x FROM t")).scalar() == 1
+        connection_1.rollback()
+        connection_2.rollback()
+        connection_1.execute(text("UPDATE t SET x = 2"))
+        with pytest.raises(OperationalError, match="locked"):
+            connection_2.execute(text("SELECT x FROM t"))
+        connection_2.rollback()
+        connection_1.rollback()
+        assert connection_2.execute(text("SELECT x FROM t")).scalar() == 1
+    assert pragma(db_engine, "read_uncommitted") == 0
+    db_engine.dispose()
+
+
+def test_db_schema_template_100(session: Session):
+    """
+    # Summary
+
+    Verify the session fixture's database, a clone of schema_template(),
+    has the schema create_all() builds, and that clones are independent.
+    """
+    schema = "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY name"
+    db_engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(db_engine)
+    with db_engine.connect() as connection:
+        expected = connection.execute(text(schema)).all()
+    assert len(expected) > 10
+    assert session.exec(text(schema)).all() == expected
+
+    insert = "INSERT INTO fabricdbmodelv2 "
+    insert += "(name, bgpAsn, type, latitude, longitude, category, licenseTier, securityDomain, telemetryCollectionType, telemetryStreamingProtocol) "
+    insert += "VALUES ('F1', '65001', 'vxlanIbgp', 0, 0, 'fabric', 'essentials', 'all', 'inBand', 'ipv4')"
+    session.exec(text(insert))
+    session.commit()
+    clone = create_engine("sqlite://", poolclass=StaticPool)
+    clone_schema(clone)
+    with clone.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM fabricdbmodelv2")).scalar() == 0
+
+
+def test_db_migration_100(tmp_path):
+    """
+    # Summary
+
+    Verify create_db_and_tables() migrates a database created before the
+    nvPairsJson fabric layout, and that its fabrics and switches are then
+    returned exactly as they were.
+
+    baseline_schema.sql and baseline_fabrics.json were captured from the
+    application before the fabric table layout changed.
+    """
+    file_name = str(tmp_path / "baseline.db")
+    with open(os.path.join(DATA_DIR, "baseline_schema.sql"), encoding="utf-8") as file:
+        connection = sqlite3.connect(file_name)
+        connection.executescript(file.read())
+        connection.close()
+    with open(os.path.join(DATA_DIR, "baseline_fabrics.json"), encoding="utf-8") as file:
+        baseline_fabrics = json.load(file)
+
+    db_engine = build_engine(DbProfileEnum.file, echo=False, file_name=file_name)
+    create_db_and_tables(db_engine)
+    assert migrate_fabric_table(db_engine) is None
+
+    def get_session_override():
+        with Session(db_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        assert client.get(f"{FABRICS_PATH}/").json() == baseline_fabrics
+        switches = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json()
+        assert [switch["serialNumber"] for switch in switches] == ["FOX0001AAAA"]
+        response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001", "FABRIC_MTU": "9216"})
+        assert response.status_code == 200
+        assert client.get(f"{FABRICS_PATH}/F1").json()["nvPairs"]["REPLICATION_MODE"] == "Ingress"
+        assert client.post(f"{FABRICS_PATH}/F3/Easy_Fabric", json={"BGP_AS": "65003"}).status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
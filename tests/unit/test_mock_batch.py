@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+# pylint: disable=too-many-locals
+import contextvars
+import sqlite3
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from ...app.common.enums.db import DbProfileEnum
+from ...app.db import batch_session, build_engine, check_batch_open, get_session
+from ...app.main import app
+from ...app.v1.models.fabric import FabricDbModelV1
+from ...app.v1.models.inventory import SwitchDbModel
+from .common import FABRICS_PATH, SWITCHES_PATH, client_fixture, discover_body, session_fixture
+
+SWITCHES = [
+    ("FOX0001AAAA", "10.1.1.1", "N9K-C93180YC-EX", "10.2(5)"),
+    ("FOX0002AAAA", "10.1.1.2", "N9K-C93180YC-EX", "10.2(5)"),
+]
+
+
+def setup_requests(fabric_name: str = "F1") -> list[dict]:
+    """
+    # Summary
+
+    Return batch requests that create fabric_name, discover SWITCHES into
+    it, and change the role of the second switch.
+    """
+    return [
+        {"method": "POST", "path": f"{FABRICS_PATH}/{fabric_name}/Easy_Fabric", "body": {"BGP_AS": "65001"}},
+        {"method": "POST", "path": f"{FABRICS_PATH}/{fabric_name}/inventory/discover", "body": discover_body(SWITCHES)},
+        {"method": "POST", "path": f"{SWITCHES_PATH}/roles", "body": [{"serialNumber": "FOX0002AAAA", "role": "leaf"}]},
+    ]
+
+
+def test_mock_batch_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify a batch runs its requests in order, that each request sees the
+    changes of the requests before it, and that the batch is committed.
+    """
+    requests = setup_requests()
+    requests.append({"method": "GET", "path": f"{FABRICS_PATH}/F1/inventory/switchesByFabric?fields=serialNumber,switchRole"})
+    requests.append({"method": "GET", "path": f"{SWITCHES_PATH}/F1/overview"})
+    response = client.post("/mock/batch", json={"requests": requests})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["committed"] is True
+    assert [result["status"] for result in data["results"]] == [200] * 5
+    assert data["results"][0]["body"]["nvPairs"]["FABRIC_NAME"] == "F1"
+    assert data["results"][3]["body"] == [{"serialNumber": "FOX0001AAAA", "switchRole": "spine"}, {"serialNumber": "FOX0002AAAA", "switchRole": "leaf"}]
+    assert data["results"][4]["body"]["switchRoles"]["leaf"] == 1
+
+    assert session.exec(select(FabricDbModelV1.FABRIC_NAME)).all() == ["F1"]
+    assert len(session.exec(select(SwitchDbModel)).all()) == 2
+    assert client.get(f"{SWITCHES_PATH}/F1/overview").json() == data["results"][4]["body"]
+
+
+def test_mock_batch_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify that in an atomic batch, a failed request rolls back the whole
+    batch, including the in-process caches, and that the requests after
+    it are skipped.
+    """
+    requests = setup_requests()
+    requests.insert(2, {"method": "POST", "path": f"{FABRICS_PATH}/F2/inventory/discover", "body": discover_body(SWITCHES)})
+    response = client.post("/mock/batch", json={"requests": requests})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["committed"] is False
+    assert [result["status"] for result in data["results"]] == [200, 200, 404, None]
+    assert data["results"][2]["body"] == {"detail": "Fabric F2 not found"}
+
+    assert session.exec(select(FabricDbModelV1)).all() == []
+    assert session.exec(select(SwitchDbModel)).all() == []
+    assert client.get(f"{FABRICS_PATH}/F1").status_code == 404
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").status_code == 404
+
+
+def test_mock_batch_120(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify that in a non-atomic batch, only the changes of a failed request
+    are rolled back.
+    """
+    requests = setup_requests()
+    requests.insert(2, {"method": "POST", "path": f"{FABRICS_PATH}/F1/inventory/discover", "body": discover_body(SWITCHES[:1])})
+    response = client.post("/mock/batch", json={"requests": requests, "atomic": False})
+    data = response.json()
+    assert data["committed"] is True
+    assert [result["status"] for result in data["results"]] == [200, 200, 500, 200]
+    assert session.exec(select(SwitchDbModel.serialNumber).order_by(SwitchDbModel.serialNumber)).all() == ["FOX0001AAAA", "FOX0002AAAA"]
+    assert client.get(f"{SWITCHES_PATH}/F1/overview").json()["switchRoles"]["leaf"] == 1
+
+
+def test_mock_batch_130(client: TestClient):
+    """
+    # Summary
+
+    Verify requests served from the async engine, and nested batches, are
+    refused, and that an empty batch is invalid.
+    """
+    requests = [
+        {"method": "GET", "path": "/api/v1/manage/fabrics"},
+        {"method": "POST", "path": "/mock/batch", "body": {"requests": [{"method": "GET", "path": "/mock/caches"}]}},
+        {"method": "GET", "path": "/mock/caches"},
+    ]
+    response = client.post("/mock/batch", json={"requests": requests, "atomic": False})
+    data = response.json()
+    assert [result["status"] for result in data["results"]] == [400, 400, 200]
+    assert data["results"][0]["body"] == {"detail": "GET /api/v1/manage/fabrics is not supported in a batch."}
+    assert data["results"][1]["body"] == {"detail": "/mock/batch cannot be nested."}
+
+    assert client.post("/mock/batch", json={"requests": []}).status_code == 422
+
+
+def test_mock_batch_200(tmp_path):
+    """
+    # Summary
+
+    Verify a batch against a WAL database is one transaction: other
+    connections see none of its changes until it is committed, and a
+    rolled back batch leaves nothing behind.
+    """
+    file_name = str(tmp_path / "batch.db")
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=file_name)
+    SQLModel.metadata.create_all(db_engine)
+    observed: list[int] = []
+
+    def get_session_override():
+        session = batch_session.get()
+        if session is not None:
+            # A request of the batch.  Count the fabrics seen from outside it.
+            with sqlite3.connect(file_name) as connection:
+                observed.append(connection.execute("SELECT count(*) FROM fabricdbmodelv1").fetchone()[0])
+            yield session
+            return
+        with Session(db_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        requests = setup_requests()
+        requests.append({"method": "POST", "path": f"{FABRICS_PATH}/F2/Easy_Fabric", "body": {"BGP_AS": "65002"}})
+        response = client.post("/mock/batch", json={"requests": requests})
+        assert response.json()["committed"] is True
+        assert observed == [0, 0, 0, 0]
+        assert len(client.get(f"{FABRICS_PATH}/").json()) == 2
+        assert len(client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json()) == 2
+
+        requests = setup_requests("F3")
+        requests.append({"method": "DELETE", "path": f"{FABRICS_PATH}/F9"})
+        response = client.post("/mock/batch", json={"requests": requests})
+        assert [result["status"] for result in response.json()["results"]] == [200, 500, None, None]
+        assert client.get(f"{FABRICS_PATH}/F3").status_code == 404
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
+
+
+def test_mock_batch_210(tmp_path):
+    """
+    # Summary
+
+    Verify a GET from outside a batch, sent after a request of the batch
+    bumped the fabric's inventory version but before the batch committed,
+    does not leave an ETag that answers 304 for the state before the batch.
+    """
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=str(tmp_path / "batch.db"))
+    SQLModel.metadata.create_all(db_engine)
+    path = f"{FABRICS_PATH}/F1/inventory/switchesByFabric"
+    outside: list = []
+
+    def get_session_override():
+        session = batch_session.get()
+        if session is None:
+            with Session(db_engine) as session:
+                yield session
+            return
+        if len(outside) == 0 and session.exec(select(SwitchDbModel)).first() is not None:
+            # The discover of the batch is done, but not committed.  Send
+            # the GET in an empty context, i.e. outside the batch.
+            outside.append(contextvars.Context().run(client.get, path))
+        yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        assert client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}).status_code == 200
+        requests = [
+            {"method": "POST", "path": f"{FABRICS_PATH}/F1/inventory/discover", "body": discover_body(SWITCHES)},
+            {"method": "GET", "path": f"{SWITCHES_PATH}/F1/overview"},
+        ]
+        response = client.post("/mock/batch", json={"requests": requests})
+        assert response.json()["committed"] is True
+        assert len(outside) == 1
+        assert outside[0].json() == []
+
+        response = client.get(path, headers={"If-None-Match": outside[0].headers["ETag"]})
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
+
+
+def run_batch_with_outside_requests(db_engine: Engine) -> tuple:
+    """
+    # Summary
+
+    Run a batch against db_engine that is rolled back, and, while it is
+    open, send a POST, a GET and a second batch from outside it.  Return
+    the response of the batch, those of the requests sent while it was
+    open, and that of the POST sent again after it ended.
+    """
+    outside: list = []
+
+    def get_session_override(request: Request):
+        session = batch_session.get()
+        if session is None:
+            check_batch_open(request, db_engine)
+            with Session(db_engine) as session:
+                yield session
+            return
+        if len(outside) == 0:
+            # The first request of the batch.  Send the requests in an
+            # empty context, i.e. outside the batch.
+            context = contextvars.Context()
+            outside.append(context.run(client.post, f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "65002"}))
+            outside.append(context.run(client.get, f"{FABRICS_PATH}/"))
+            outside.append(context.run(client.post, "/mock/batch", json={"requests": setup_requests("F3")}))
+        yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        requests = [
+            {"method": "POST", "path": f"{FABRICS_PATH}/F1/Easy_Fabric", "body": {"BGP_AS": "65001"}},
+            {"method": "POST", "path": f"{FABRICS_PATH}/F9/inventory/discover", "body": discover_body(SWITCHES)},
+        ]
+        response = client.post("/mock/batch", json={"requests": requests})
+        assert client.get(f"{FABRICS_PATH}/F1").status_code == 404
+        after = client.post(f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "65002"})
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
+    return response, outside, after
+
+
+def test_mock_batch_220(tmp_path):
+    """
+    # Summary
+
+    Verify that, with the wal profile, while a batch that is then rolled
+    back is open, a POST and a second batch from outside it are refused
+    with 503, and a GET from outside it sees the database as it was before
+    the batch.  Verify the POST succeeds once the batch has ended.
+    """
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=str(tmp_path / "batch.db"))
+    SQLModel.metadata.create_all(db_engine)
+    response, outside, after = run_batch_with_outside_requests(db_engine)
+    assert response.json()["committed"] is False
+    assert [result["status"] for result in response.json()["results"]] == [200, 404]
+    assert [item.status_code for item in outside] == [503, 200, 503]
+    assert outside[0].headers["Retry-After"] == "1"
+    assert outside[0].json() == {"detail": "A /mock/batch is in progress.  Retry after it ends."}
+    assert outside[1].json() == []
+    assert after.status_code == 200
+
+
+def test_mock_batch_230():
+    """
+    # Summary
+
+    Verify that, with the memory profile, whose only connection the batch
+    holds, every request from outside an open batch is refused with 503,
+    rather than run within the batch's transaction.  Verify the POST
+    succeeds once the batch has been rolled back.
+    """
+    db_engine = build_engine(DbProfileEnum.memory, echo=False)
+    SQLModel.metadata.create_all(db_engine)
+    response, outside, after = run_batch_with_outside_requests(db_engine)
+    assert response.json()["committed"] is False
+    assert [item.status_code for item in outside] == [503, 503, 503]
+    assert after.status_code == 200
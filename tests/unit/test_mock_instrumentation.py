@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import asyncio
+import gc
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from ...app.common.enums.db import DbProfileEnum
+from ...app.common.instrumentation import NO_HEADERS, InstrumentationMiddleware, opt_in_headers
+from ...app.common.metrics import metrics_registry
+from ...app.common.query_stats import collect_queries, query_stats_registry
+from ...app.db import build_engine
+
+# The most InstrumentationMiddleware may add to a request that opts in to
+# nothing.  It measured about 6 us when this was written, against 47 us
+# for the separate timing, metrics and query stats middlewares it replaced.
+# The budget leaves room for a busy machine.
+OVERHEAD_BUDGET = 15e-6
+
+BENCHMARK_SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/benchmark",
+    "headers": [(b"host", b"testserver"), (b"accept", b"*/*"), (b"accept-encoding", b"gzip, deflate"), (b"user-agent", b"benchmark")],
+    "route": SimpleNamespace(path="/benchmark"),
+}
+
+
+@pytest.fixture(name="registries")
+def registries_fixture():
+    """
+    # Summary
+
+    Reset metrics_registry and query_stats_registry before and after the test.
+    """
+    metrics_registry.clear()
+    query_stats_registry.clear()
+    yield
+    metrics_registry.clear()
+    query_stats_registry.clear()
+
+
+async def benchmark_app(scope, receive, send):
+    """
+    # Summary
+
+    An ASGI app that returns an empty JSON object, and does nothing else.
+    """
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def seconds_per_request(apps: list, requests: int = 500, repeats: int = 40) -> list[float]:
+    """
+    # Summary
+
+    Return, for each of apps, the fastest, of repeats runs, mean time it
+    takes to handle one of requests requests to BENCHMARK_SCOPE.
+
+    The apps take turns within each run, so that a busy moment of the
+    machine slows every app, and, as in timeit, garbage collection is
+    disabled meanwhile.
+    """
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def run() -> list[float]:
+        best = [float("inf")] * len(apps)
+        for _ in range(repeats):
+            for index, app in enumerate(apps):
+                start = time.perf_counter()
+                for _ in range(requests):
+                    await app(dict(BENCHMARK_SCOPE), receive, send)
+                best[index] = min(best[index], (time.perf_counter() - start) / requests)
+        return best
+
+    gc.disable()
+    try:
+        return asyncio.run(run())
+    finally:
+        gc.enable()
+
+
+def test_mock_instrumentation_100(registries):
+    """
+    # Summary
+
+    Verify InstrumentationMiddleware adds at most OVERHEAD_BUDGET to a
+    request that opts in to nothing, and that it recorded the requests.
+    """
+    bare, instrumented = seconds_per_request([benchmark_app, InstrumentationMiddleware(benchmark_app)])
+    overhead = instrumented - bare
+    assert overhead < OVERHEAD_BUDGET, f"InstrumentationMiddleware adds {overhead * 1e6:.1f} us per request, over the {OVERHEAD_BUDGET * 1e6:.0f} us budget"
+    assert query_stats_registry.stats()["GET /benchmark"]["requests"] == 40 * 500
+
+
+def test_mock_instrumentation_110():
+    """
+    # Summary
+
+    Verify opt_in_headers() returns only the opt-in headers whose value is
+    not "0", and no set for a request without any.
+    """
+    assert opt_in_headers(BENCHMARK_SCOPE) is NO_HEADERS
+    scope = {"headers": [(b"x-mock-profile", b"0"), (b"x-mock-query-stats", b"1"), (b"x-mock-server-timing", b"yes")]}
+    assert opt_in_headers(scope) == {b"x-mock-query-stats", b"x-mock-server-timing"}
+
+
+def test_mock_instrumentation_200():
+    """
+    # Summary
+
+    Verify the queries of the engines built by build_engine() are counted,
+    and those of any other engine are not, so that the query listeners
+    run only for the mock's own statements.
+    """
+    db_engine = build_engine(DbProfileEnum.memory, echo=False)
+    other_engine = create_engine("sqlite://")
+    with collect_queries() as stats:
+        for engine in (db_engine, other_engine):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+    assert stats.queries == 1
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from ...app.common.journal import JOURNAL_QUEUE_SIZE, JOURNAL_REDACTED, JournalRecorder, decode_body, journal_recorder
+from .common import FABRICS_PATH, client_fixture, session_fixture
+
+
+@pytest.fixture(name="journal")
+def journal_fixture(tmp_path):
+    """
+    # Summary
+
+    Record to a journal in a temporary directory, then stop recording and
+    restore journal_recorder's defaults.
+    """
+    defaults = JournalRecorder()
+    journal_recorder.path = str(tmp_path / "journal" / "session.jsonl")
+    journal_recorder.written = journal_recorder.dropped = journal_recorder.rotations = 0
+    yield journal_recorder
+    journal_recorder.stop()
+    journal_recorder.path = defaults.path
+    journal_recorder.sample_rate = defaults.sample_rate
+    journal_recorder.max_bytes = defaults.max_bytes
+    journal_recorder.backup_count = defaults.backup_count
+
+
+def read_journal(path: str) -> list[dict]:
+    """
+    # Summary
+
+    Return the entries of the journal at path.
+    """
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_mock_journal_100(session: Session, client: TestClient, journal):
+    """
+    # Summary
+
+    Verify each request is recorded with its method, path, query, route,
+    body, status, latency and response size, that passwords are
+    redacted, and that requests to the mock's own endpoints are not
+    recorded.
+    """
+    journal.start()
+    assert client.post("/login", json={"domain": "local", "userName": "admin", "userPasswd": "secret"}).status_code == 200
+    assert client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}).status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1", params={"detail": "true"}).status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F2").status_code == 404
+    assert client.get("/mock/caches").status_code == 200
+    status = client.post("/mock/journal/flush").json()
+    assert status["written"] == 4
+    assert status["dropped"] == 0
+
+    login, create, get, missing = read_journal(journal.path)
+    assert login["body"]["userPasswd"] == JOURNAL_REDACTED
+    assert login["body"]["userName"] == "admin"
+    assert create["method"] == "POST"
+    assert create["path"] == f"{FABRICS_PATH}/F1/Easy_Fabric"
+    assert create["route"] == f"{FABRICS_PATH}/{{fabric_name}}/{{template_name}}"
+    assert create["body"] == {"BGP_AS": "65001"}
+    assert create["content_type"] == "application/json"
+    assert create["status"] == 200
+    assert create["latency_ms"] > 0
+    assert create["response_bytes"] > 0
+    assert get["query"] == "detail=true"
+    assert get["body"] is None
+    assert missing["status"] == 404
+    assert login["time"] <= create["time"] <= get["time"]
+
+
+def test_mock_journal_110(session: Session, client: TestClient, journal, tmp_path):
+    """
+    # Summary
+
+    Verify the journal is rotated before it grows past max_bytes, and
+    that at most backup_count rotated journals are kept.
+    """
+    journal.max_bytes = 1000
+    journal.backup_count = 2
+    journal.start()
+    for index in range(20):
+        client.get(f"{FABRICS_PATH}/F{index}")
+        # Non-ASCII bodies are longer in bytes than in characters.
+        journal.record({"path": "/ünïcödé", "body": "é" * 200, "content_type": "text/plain"})
+    client.get(f"{FABRICS_PATH}/F19")
+    journal.flush()
+
+    directory = tmp_path / "journal"
+    assert sorted(path.name for path in directory.iterdir()) == ["session.jsonl", "session.jsonl.1", "session.jsonl.2"]
+    assert journal.rotations > 2
+    for path in directory.iterdir():
+        assert path.stat().st_size <= 1000
+        assert read_journal(str(path))
+    assert read_journal(journal.path)[-1]["path"] == f"{FABRICS_PATH}/F19"
+
+
+def test_mock_journal_120(session: Session, client: TestClient, journal):
+    """
+    # Summary
+
+    Verify nothing is recorded with a sample rate of 0, or before the
+    recorder is started, and that the recorder is disabled by default.
+    """
+    assert JournalRecorder().path is None
+    client.get(f"{FABRICS_PATH}/F1")
+    assert client.get("/mock/journal").json()["enabled"] is False
+
+    journal.sample_rate = 0.0
+    journal.start()
+    client.get(f"{FABRICS_PATH}/F1")
+    journal.stop()
+    assert read_journal(journal.path) == []
+    assert journal.written == 0
+
+
+def test_mock_journal_200():
+    """
+    # Summary
+
+    Verify decode_body() decodes JSON and text bodies, and that record()
+    drops entries, without blocking, once the queue is full.
+    """
+    assert decode_body(b"", "application/json") is None
+    assert decode_body(b'{"password": "x", "a": 1}', "application/json") == {"password": JOURNAL_REDACTED, "a": 1}
+    assert decode_body(b"[1, 2]", "application/json") == [1, 2]
+    assert decode_body(b"not json", "application/json") == "not json"
+    assert decode_body(b"a=1", "application/x-www-form-urlencoded") == "a=1"
+
+    recorder = JournalRecorder()
+    for _ in range(JOURNAL_QUEUE_SIZE + 3):
+        recorder.record({})
+    assert recorder.dropped == 3
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: recorder.record({}), range(4000)))
+    assert recorder.dropped == 4003
+    with pytest.raises(ValueError):
+        recorder.sample_rate = 2.0
+        recorder.validate_properties()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from ...app.common.query_stats import N_PLUS_ONE_THRESHOLD, QueryStats, collect_queries, query_stats_registry
+from .common import FABRICS_PATH, SWITCHES_PATH, assert_max_queries, client_fixture, discover_body, session_fixture
+
+DISCOVER_ROUTE = f"POST {FABRICS_PATH}/{{fabric_name}}/inventory/discover"
+ROLES_ROUTE = f"POST {SWITCHES_PATH}/roles"
+
+
+@pytest.fixture(name="metrics")
+def metrics_fixture():
+    """
+    # Summary
+
+    Reset query_stats_registry before and after the test.
+    """
+    query_stats_registry.clear()
+    yield query_stats_registry
+    query_stats_registry.clear()
+
+
+def build_switches(count: int, start: int = 1) -> list[tuple[str, str, str, str]]:
+    """
+    # Summary
+
+    Return count (serialNumber, ipaddr, platform, version) tuples.
+    """
+    return [(f"FOX{index:04d}AAAA", f"10.1.{index // 250}.{index % 250 + 1}", "N9K-C93180YC-EX", "10.2(5)") for index in range(start, start + count)]
+
+
+def test_mock_metrics_100(session: Session, client: TestClient, metrics):
+    """
+    # Summary
+
+    Verify the number of queries of discover does not depend on the
+    number of switches discovered, and that the read paths of a fabric
+    issue one query each.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+
+    with assert_max_queries(8):
+        response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=discover_body(build_switches(1)))
+    assert response.status_code == 200
+    with assert_max_queries(8) as stats:
+        response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=discover_body(build_switches(50, start=2)))
+    assert response.status_code == 200
+    assert stats.commits == 1
+    assert stats.rows >= 50
+
+    client.get(f"{FABRICS_PATH}/F1")
+    with assert_max_queries(1):
+        assert client.get(f"{FABRICS_PATH}/F1").status_code == 200
+    with assert_max_queries(1):
+        assert len(client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json()) == 51
+    with assert_max_queries(1):
+        assert client.get(f"{SWITCHES_PATH}/F1/overview").status_code == 200
+
+    totals = metrics.stats()[DISCOVER_ROUTE]
+    assert totals["requests"] == 2
+    assert totals["max_queries"] <= 8
+    assert totals["n_plus_one"] == {}
+
+
+def test_mock_metrics_110(session: Session, client: TestClient, metrics):
+    """
+    # Summary
+
+    Verify GET /mock/metrics reports the statements a roles POST repeats
+    for each switch as n_plus_one, and DELETE /mock/metrics resets the
+    counters.
+    """
+    switches = build_switches(N_PLUS_ONE_THRESHOLD * 2)
+    assert client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}).status_code == 200
+    assert client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=discover_body(switches)).status_code == 200
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": switch[0], "role": "spine"} for switch in switches])
+    assert response.status_code == 200
+
+    data = client.get("/mock/metrics").json()["queries"]
+    assert data[ROLES_ROUTE]["requests"] == 1
+    assert data[ROLES_ROUTE]["n_plus_one"]
+    assert set(data[ROLES_ROUTE]["n_plus_one"].values()) == {len(switches)}
+    assert data[DISCOVER_ROUTE]["n_plus_one"] == {}
+
+    assert client.delete("/mock/metrics").status_code == 200
+    assert ROLES_ROUTE not in client.get("/mock/metrics").json()["queries"]
+
+
+def test_mock_metrics_120(session: Session, client: TestClient, metrics):
+    """
+    # Summary
+
+    Verify the X-Mock-Queries, X-Mock-Rows and X-Mock-Commits response
+    headers are returned only to requests with an X-Mock-Query-Stats
+    header, and that requests matching no route are recorded as unmatched.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert "x-mock-queries" not in response.headers
+
+    response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=discover_body(build_switches(3)), headers={"X-Mock-Query-Stats": "1"})
+    assert response.status_code == 200
+    assert 0 < int(response.headers["x-mock-queries"]) <= 8
+    assert int(response.headers["x-mock-rows"]) >= 3
+    assert response.headers["x-mock-commits"] == "1"
+
+    response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", headers={"X-Mock-Query-Stats": "0"})
+    assert "x-mock-queries" not in response.headers
+
+    assert client.get("/no/such/path").status_code == 404
+    assert metrics.stats()["GET unmatched"]["queries"] == 0
+
+
+def test_mock_metrics_200():
+    """
+    # Summary
+
+    Verify QueryStats.repeated() returns the statements executed at least
+    threshold times, most frequent first, and that collect_queries()
+    stops recording when the with block exits.
+    """
+    stats = QueryStats()
+    for _ in range(6):
+        stats.record_query("SELECT a", -1)
+    for _ in range(5):
+        stats.record_query("UPDATE b", 1)
+    stats.record_query("DELETE c", 0)
+    assert stats.as_dict() == {"queries": 12, "rows": 5, "commits": 0}
+    assert list(stats.repeated()) == ["SELECT a", "UPDATE b"]
+    assert stats.repeated(threshold=6) == {"SELECT a": 6}
+
+    with collect_queries() as collected:
+        pass
+    assert collected.queries == 0
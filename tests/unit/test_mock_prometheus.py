@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from ...app.common.metrics import LATENCY_BUCKETS, Histogram, escape_label, metrics_registry
+from .common import FABRICS_PATH, client_fixture, create_fabric_with_switches, session_fixture
+
+DISCOVER_LABELS = f'method="POST",route="{FABRICS_PATH}/{{fabric_name}}/inventory/discover"'
+SWITCHES_LABELS = f'method="GET",route="{FABRICS_PATH}/{{fabric_name}}/inventory/switchesByFabric"'
+
+
+@pytest.fixture(name="metrics")
+def metrics_fixture():
+    """
+    # Summary
+
+    Reset metrics_registry before and after the test.
+    """
+    metrics_registry.clear()
+    yield metrics_registry
+    metrics_registry.clear()
+
+
+def parse_samples(text: str) -> dict[str, float]:
+    """
+    # Summary
+
+    Return the samples of a Prometheus text exposition, by name and labels.
+    """
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_mock_prometheus_100(session: Session, client: TestClient, metrics):
+    """
+    # Summary
+
+    Verify GET /metrics returns, in the Prometheus text format, the
+    request count, query count, and latency, database time,
+    serialization time and response size histograms of each route, and
+    that the serialization time is recorded only for requests whose
+    phases are timed.
+    """
+    create_fabric_with_switches(client)
+    for _ in range(3):
+        assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", headers={"X-Mock-Server-Timing": "1"}).status_code == 200
+    assert client.get("/no/such/path").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE ndfc_mock_http_request_duration_seconds histogram" in response.text
+    samples = parse_samples(response.text)
+
+    # The /metrics request itself is in flight.
+    assert samples["ndfc_mock_http_requests_in_flight"] == 1
+    assert samples[f'ndfc_mock_http_requests_total{{{SWITCHES_LABELS},status="200"}}'] == 3
+    assert samples['ndfc_mock_http_requests_total{method="GET",route="unmatched",status="404"}'] == 1
+    assert samples[f"ndfc_mock_db_queries_total{{{SWITCHES_LABELS}}}"] == 3
+
+    assert samples[f"ndfc_mock_http_request_duration_seconds_count{{{SWITCHES_LABELS}}}"] == 3
+    assert samples[f'ndfc_mock_http_request_duration_seconds_bucket{{{SWITCHES_LABELS},le="+Inf"}}'] == 3
+    buckets = [samples[f'ndfc_mock_http_request_duration_seconds_bucket{{{SWITCHES_LABELS},le="{bound}"}}'] for bound in LATENCY_BUCKETS]
+    assert buckets == sorted(buckets)
+    assert samples[f"ndfc_mock_http_request_duration_seconds_sum{{{SWITCHES_LABELS}}}"] > 0
+    assert samples[f"ndfc_mock_http_request_db_seconds_sum{{{DISCOVER_LABELS}}}"] > 0
+    assert samples[f"ndfc_mock_http_response_serialize_seconds_count{{{DISCOVER_LABELS}}}"] == 0
+    assert samples[f"ndfc_mock_http_response_serialize_seconds_count{{{SWITCHES_LABELS}}}"] == 3
+    assert samples[f"ndfc_mock_http_response_serialize_seconds_sum{{{SWITCHES_LABELS}}}"] > 0
+    assert samples[f"ndfc_mock_http_response_size_bytes_sum{{{SWITCHES_LABELS}}}"] == 3 * len(client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").content)
+
+    assert client.delete("/metrics").status_code == 200
+    assert "switchesByFabric" not in client.get("/metrics").text
+
+
+def test_mock_prometheus_200():
+    """
+    # Summary
+
+    Verify Histogram renders cumulative buckets, with upper bounds
+    inclusive, and that label values are escaped.
+    """
+    histogram = Histogram((1.0, 2.0))
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.samples("h", 'a="b"') == [
+        'h_bucket{a="b",le="1.0"} 2',
+        'h_bucket{a="b",le="2.0"} 3',
+        'h_bucket{a="b",le="+Inf"} 4',
+        'h_sum{a="b"} 6.0',
+        'h_count{a="b"} 4',
+    ]
+    assert escape_label('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
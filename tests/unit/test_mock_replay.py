@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import asyncio
+import json
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from ...app.main import app
+from ...app.mock.replay import JournalReplayer, compare_to_baseline, percentile, read_journal
+from .common import FABRICS_PATH, client_fixture, session_fixture
+
+FABRIC_ROUTE = f"{FABRICS_PATH}/{{fabric_name}}"
+
+
+def build_entry(method: str, path: str, route: str, status: int, time: str = "2025-03-01T12:00:00+00:00", body=None, query: str = "") -> dict:
+    """
+    # Summary
+
+    Return a journal entry.
+    """
+    return {"time": time, "method": method, "path": path, "query": query, "route": route, "content_type": "application/json", "body": body, "status": status}
+
+
+def replay(replayer: JournalReplayer, entries: list[dict]) -> tuple[list[dict], float]:
+    """
+    # Summary
+
+    Replay entries in-process, against app.
+    """
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://mock") as client:
+            return await replayer.run(client, entries)
+
+    return asyncio.run(run())
+
+
+def test_mock_replay_100(session: Session, client: TestClient, tmp_path):
+    """
+    # Summary
+
+    Verify a journal is replayed in-process, in order, and summarized by
+    route, with a replayed status that differs from the recorded one
+    counted as an error.
+    """
+    entries = [
+        build_entry("POST", f"{FABRICS_PATH}/F1/Easy_Fabric", f"{FABRICS_PATH}/{{fabric_name}}/{{template_name}}", 200, body={"BGP_AS": "65001"}),
+        *[build_entry("GET", f"{FABRICS_PATH}/F1", FABRIC_ROUTE, 200, query="detail=true") for _ in range(3)],
+        build_entry("GET", f"{FABRICS_PATH}/F2", FABRIC_ROUTE, 200),
+        build_entry("GET", "/no/such/path", "unmatched", 404),
+    ]
+    path = tmp_path / "session.jsonl"
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+    samples, elapsed = replay(JournalReplayer(), read_journal([str(path)]))
+    assert [sample["status"] for sample in samples] == [200, 200, 200, 200, 404, 404]
+    results = JournalReplayer.summarize(samples, elapsed)
+    assert results["summary"]["requests"] == 6
+    assert results["summary"]["errors"] == 1
+    assert results["summary"]["throughput_rps"] > 0
+    fabric = results["routes"][f"GET {FABRIC_ROUTE}"]
+    assert fabric["requests"] == 4
+    assert fabric["errors"] == 1
+    assert fabric["error_rate"] == 0.25
+    assert 0 < fabric["p50"] <= fabric["p95"] <= fabric["p99"] <= fabric["max_ms"]
+    assert results["routes"]["GET /no/such/path"]["errors"] == 0
+
+
+def test_mock_replay_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify requests are sent at their recorded offsets divided by
+    speedup, and with at most concurrency in flight.
+    """
+    times = ["2025-03-01T12:00:00+00:00", "2025-03-01T12:00:01+00:00", "2025-03-01T12:00:02+00:00"]
+    entries = [build_entry("GET", f"{FABRICS_PATH}/F1", FABRIC_ROUTE, 404, time=time) for time in times]
+    replayer = JournalReplayer()
+    replayer.speedup = 10.0
+    replayer.concurrency = 2
+    assert replayer.offsets(entries) == [0.0, 0.1, 0.2]
+    samples, elapsed = replay(replayer, entries)
+    assert elapsed >= 0.2
+    assert all(sample["status"] == 404 for sample in samples)
+
+    replayer.speedup = 0.0
+    assert replayer.offsets(entries) == [0.0, 0.0, 0.0]
+
+
+def test_mock_replay_200():
+    """
+    # Summary
+
+    Verify percentile() uses the nearest rank, and compare_to_baseline()
+    reports latency growth beyond the threshold and floor, error rate
+    growth, and throughput loss, but not percentiles from too few
+    requests.
+    """
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+    def results(requests: int, p50: float, p95: float, error_rate: float, throughput: float) -> dict:
+        route = {"requests": requests, "error_rate": error_rate, "p50": p50, "p95": p95, "p99": p95}
+        return {"summary": {"throughput_rps": throughput}, "routes": {"GET /r": route, "GET /new": route}}
+
+    baseline = results(100, 1.0, 2.0, 0.0, 100.0)
+    baseline["routes"].pop("GET /new")
+    assert compare_to_baseline(results(100, 1.1, 2.0, 0.0, 95.0), baseline) == []
+    # 50% slower, but by less than the 0.5 ms floor.
+    assert compare_to_baseline(results(100, 1.4, 2.0, 0.0, 100.0), baseline) == []
+    assert compare_to_baseline(results(100, 2.0, 2.0, 0.0, 100.0), baseline) == ["GET /r: p50 1.000ms -> 2.000ms"]
+    # p95 of 100 requests is compared, p99 is not.
+    assert compare_to_baseline(results(100, 1.0, 9.0, 0.0, 100.0), baseline) == ["GET /r: p95 2.000ms -> 9.000ms"]
+    assert compare_to_baseline(results(10, 1.0, 9.0, 0.0, 100.0), baseline) == []
+    assert compare_to_baseline(results(100, 1.0, 2.0, 0.1, 70.0), baseline) == ["GET /r: error_rate 0.00% -> 10.00%", "throughput 100.0 -> 70.0 requests/s"]
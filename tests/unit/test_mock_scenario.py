@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import time
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, select
+
+from ...app.common.enums.db import DbProfileEnum
+from ...app.db import build_engine
+from ...app.mock.scenario import Scenario, load_scenario, read_scenario_file, seed_scenario_file
+from ...app.v1.endpoints.lan_fabric.rest.control.switches.models.switch_overview import SwitchOverviewResponse
+from ...app.v1.models.fabric import FabricDbModelV1
+from ...app.v1.models.inventory import SwitchDbModel
+from .common import FABRICS_PATH, SWITCHES_PATH, client_fixture, create_fabric_with_switches, discover_body, session_fixture
+
+V2_FABRIC = {
+    "name": "V2F1",
+    "category": "fabric",
+    "licenseTier": "essentials",
+    "location": {"latitude": 37.33939, "longitude": -121.89496},
+    "management": {"bgpAsn": 65002, "type": "vxlanIbgp"},
+    "telemetryCollectionType": "inBand",
+    "telemetryStreamingProtocol": "ipv6",
+}
+
+SCENARIO = {
+    "fabrics": [
+        {
+            "name": "F1",
+            "nvPairs": {"BGP_AS": "65001", "REPLICATION_MODE": "Ingress"},
+            "switches": [
+                {"serialNumber": "FOX0001AAAA", "ipAddress": "10.1.1.1", "hostName": "leaf1", "role": "leaf"},
+                {"serialNumber": "FOX0002AAAA", "ipAddress": "10.1.1.2", "role": "border gateway", "operStatus": "Major", "ccStatus": "Out-of-Sync"},
+                {"serialNumber": "FOX0003AAAA", "ipAddress": "10.1.1.3", "model": "N9K-C9336C-FX2", "release": "10.3(1)"},
+            ],
+        },
+        {"name": "F2", "template": "Easy_Fabric", "nvPairs": {"BGP_AS": "65002"}},
+    ],
+    "fabrics_v2": [V2_FABRIC],
+}
+
+
+def test_mock_scenario_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify a scenario is loaded as the equivalent requests would have
+    created it: fabrics, switches with their roles and health, overview
+    and v2 fabrics.
+    """
+    response = client.post("/mock/scenario", json=SCENARIO)
+    assert response.status_code == 200
+    assert response.json() == {"fabrics": 2, "fabrics_v2": 1, "switches": 3}
+
+    fabric = client.get(f"{FABRICS_PATH}/F1").json()
+    assert fabric["nvPairs"]["BGP_AS"] == "65001"
+    assert fabric["nvPairs"]["REPLICATION_MODE"] == "Ingress"
+    assert fabric["nvPairs"]["FABRIC_NAME"] == "F1"
+    assert client.get(f"{FABRICS_PATH}/F2/inventory/switchesByFabric").json() == []
+
+    fields = "serialNumber,hostName,switchRole,switchRoleEnum,operStatus,ccStatus,model,release"
+    switches = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric?fields={fields}").json()
+    assert switches == [
+        {
+            "serialNumber": "FOX0001AAAA",
+            "hostName": "leaf1",
+            "switchRole": "leaf",
+            "switchRoleEnum": "leaf",
+            "operStatus": "Healthy",
+            "ccStatus": "In-Sync",
+            "model": "N9K-C93180YC-EX",
+            "release": "10.2(5)",
+        },
+        {
+            "serialNumber": "FOX0002AAAA",
+            "hostName": "FOX0002AAAA",
+            "switchRole": "border gateway",
+            "switchRoleEnum": "borderGateway",
+            "operStatus": "Major",
+            "ccStatus": "Out-of-Sync",
+            "model": "N9K-C93180YC-EX",
+            "release": "10.2(5)",
+        },
+        {
+            "serialNumber": "FOX0003AAAA",
+            "hostName": "FOX0003AAAA",
+            "switchRole": "spine",
+            "switchRoleEnum": "spine",
+            "operStatus": "Healthy",
+            "ccStatus": "In-Sync",
+            "model": "N9K-C9336C-FX2",
+            "release": "10.3(1)",
+        },
+    ]
+
+    overview = client.get(f"{SWITCHES_PATH}/F1/overview").json()
+    assert overview["switchConfig"] == {"in_sync": 2, "out_of_sync": 1}
+    assert overview["switchHealth"] == {"Healthy": 2, "Major": 1, "Minor": 0}
+    assert overview["switchHWVersions"] == {"N9K-C93180YC-EX": 2, "N9K-C9336C-FX2": 1}
+    assert overview["switchSWVersions"] == {"10.2(5)": 2, "10.3(1)": 1}
+    assert {role: count for role, count in overview["switchRoles"].items() if count} == {"leaf": 1, "border gateway": 1, "spine": 1}
+
+    # Later changes through the API apply on top of the loaded switches.
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0003AAAA", "role": "leaf"}])
+    assert response.status_code == 200
+    assert client.get(f"{SWITCHES_PATH}/F1/overview").json()["switchRoles"]["leaf"] == 2
+    response = client.post(f"{FABRICS_PATH}/F2/inventory/discover", json=discover_body([("FOX0009AAAA", "10.2.1.1", "N9K-C93180YC-EX", "10.2(5)")]))
+    assert response.status_code == 200
+    assert client.get(f"{SWITCHES_PATH}/F2/overview").json()["switchRoles"]["spine"] == 1
+
+    response = client.get(f"/api/v1/manage/fabrics/{V2_FABRIC['name']}")
+    assert response.status_code == 200
+    assert response.json()["management"] == {"bgpAsn": "65002", "type": "vxlanIbgp"}
+
+
+def test_mock_scenario_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify a scenario that conflicts with the database returns 409, and
+    that nothing of it is loaded.
+    """
+    create_fabric_with_switches(client)
+    response = client.post("/mock/scenario", json=SCENARIO)
+    assert response.status_code == 409
+    assert response.json() == {"detail": "Fabrics already exist: F1"}
+
+    # FOX0002AAAA is in F1.
+    scenario = {"fabrics": [{"name": "F3", "nvPairs": {"BGP_AS": "65003"}, "switches": [{"serialNumber": "FOX0002AAAA", "ipAddress": "10.3.1.1"}]}]}
+    response = client.post("/mock/scenario", json=scenario)
+    assert response.status_code == 409
+    assert "serialNumber" in response.json()["detail"]
+    assert session.exec(select(FabricDbModelV1.FABRIC_NAME)).all() == ["F1"]
+    assert len(session.exec(select(SwitchDbModel)).all()) == 3
+    assert client.get(f"{FABRICS_PATH}/F3").status_code == 404
+
+
+def test_mock_scenario_120(client: TestClient):
+    """
+    # Summary
+
+    Verify invalid scenarios are refused with 422.
+    """
+    switch = {"serialNumber": "FOX0001AAAA", "ipAddress": "10.1.1.1"}
+    invalid = [
+        {"fabrics": [{"name": "F1", "nvPairs": {}}]},
+        {"fabrics": [{"name": "F1", "nvPairs": {"BGP_AS": "65001"}, "switches": [{**switch, "role": "router"}]}]},
+        {"fabrics": [{"name": "F1", "nvPairs": {"BGP_AS": "65001"}, "switches": [{**switch, "operStatus": "Sick"}]}]},
+        {"fabrics": [{"name": "F1", "nvPairs": {"BGP_AS": "65001"}, "switches": [switch, {**switch, "ipAddress": "10.1.1.2"}]}]},
+        {"fabrics": [{"name": "F1", "nvPairs": {"BGP_AS": "65001"}}, {"name": "F1", "nvPairs": {"BGP_AS": "65002"}}]},
+    ]
+    for scenario in invalid:
+        assert client.post("/mock/scenario", json=scenario).status_code == 422
+    assert client.get(f"{FABRICS_PATH}/").json() == []
+
+
+def test_mock_scenario_130(tmp_path):
+    """
+    # Summary
+
+    Verify a YAML scenario file is seeded into an empty database at
+    startup, and is not loaded again into a database that holds fabrics.
+    """
+    path = tmp_path / "scenario.yaml"
+    path.write_text(
+        """
+fabrics:
+  - name: F1
+    nvPairs:
+      BGP_AS: "65001"
+    switches:
+      - {serialNumber: FOX0001AAAA, ipAddress: 10.1.1.1, role: leaf}
+      - {serialNumber: FOX0002AAAA, ipAddress: 10.1.1.2, operStatus: Minor}
+""",
+        encoding="utf-8",
+    )
+    assert [switch.role for switch in read_scenario_file(str(path)).fabrics[0].switches] == ["leaf", "spine"]
+
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=str(tmp_path / "scenario.db"))
+    SQLModel.metadata.create_all(db_engine)
+    try:
+        assert seed_scenario_file(db_engine, str(path)) == {"fabrics": 1, "fabrics_v2": 0, "switches": 2}
+        assert seed_scenario_file(db_engine, str(path)) is None
+        with Session(db_engine) as session:
+            assert len(session.exec(select(SwitchDbModel)).all()) == 2
+            overview = SwitchOverviewResponse()
+            overview.session = session
+            overview.fabric = "F1"
+            overview.refresh()
+            assert overview.response_dict()["switchHealth"] == {"Healthy": 1, "Major": 0, "Minor": 1}
+    finally:
+        db_engine.dispose()
+
+
+def test_mock_scenario_200(session: Session):
+    """
+    # Summary
+
+    Verify 100 fabrics x 500 switches are loaded in seconds, with the
+    expected overview.
+    """
+    roles = ["leaf", "spine", "border gateway"]
+    fabrics = []
+    for fabric_index in range(100):
+        switches = [
+            {
+                "serialNumber": f"FOX{fabric_index:03d}{index:04d}",
+                "ipAddress": f"10.{fabric_index}.{index // 250}.{index % 250 + 1}",
+                "role": roles[index % 3],
+                "operStatus": ("Healthy", "Minor")[index % 2],
+            }
+            for index in range(500)
+        ]
+        fabrics.append({"name": f"F{fabric_index}", "nvPairs": {"BGP_AS": f"{65000 + fabric_index}"}, "switches": switches})
+    start = time.perf_counter()
+    counts = load_scenario(session, Scenario.model_validate({"fabrics": fabrics}))
+    elapsed = time.perf_counter() - start
+    print(f"Loaded {counts} in {elapsed:.2f}s")
+    assert counts == {"fabrics": 100, "fabrics_v2": 0, "switches": 50000}
+    assert elapsed < 30
+
+    overview = SwitchOverviewResponse()
+    overview.session = session
+    overview.fabric = "F99"
+    overview.refresh()
+    data = overview.response_dict()
+    assert data["switchHealth"] == {"Healthy": 250, "Major": 0, "Minor": 250}
+    assert {role: count for role, count in data["switchRoles"].items() if count} == {"leaf": 167, "spine": 167, "border gateway": 166}
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import pstats
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from ...app.common import metrics
+from ...app.common.enums.mock import SERVER_TIMING_ENV_VAR
+from ...app.common.instrumentation import NO_HEADERS, InstrumentationMiddleware
+from ...app.common.metrics import RequestTimings
+from ...app.common.profiler import request_profiler
+from .common import FABRICS_PATH, client_fixture, session_fixture
+
+
+@pytest.fixture(name="profiles")
+def profiles_fixture(tmp_path):
+    """
+    # Summary
+
+    Point request_profiler at a temporary directory.
+    """
+    directory = request_profiler.directory
+    request_profiler.directory = str(tmp_path / "profiles")
+    yield request_profiler
+    request_profiler.directory = directory
+
+
+def parse_server_timing(value: str) -> dict[str, float]:
+    """
+    # Summary
+
+    Return the durations, in milliseconds, of a Server-Timing header, by name.
+    """
+    durations = {}
+    for metric in value.split(", "):
+        name, duration = metric.split(";dur=")
+        durations[name] = float(duration)
+    return durations
+
+
+def test_mock_server_timing_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify a response to a request with an X-Mock-Server-Timing header
+    has a Server-Timing header with the validate, db, build and serialize
+    phases, whose sum is within the total, that a request failing
+    validation has only the validate and db phases, and that requests
+    without the header, or with X-Mock-Server-Timing: 0, get none.
+    """
+    headers = {"X-Mock-Server-Timing": "1"}
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}, headers=headers)
+    assert response.status_code == 200
+    durations = parse_server_timing(response.headers["server-timing"])
+    assert list(durations) == ["validate", "db", "build", "serialize", "total"]
+    assert durations["db"] > 0
+    assert durations["validate"] + durations["db"] + durations["build"] + durations["serialize"] <= durations["total"] + 0.005
+
+    response = client.post(f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "not an ASN"}, headers=headers)
+    assert response.status_code == 422
+    assert list(parse_server_timing(response.headers["server-timing"])) == ["validate", "db", "total"]
+    assert "x-mock-profile" not in response.headers
+
+    assert "server-timing" not in client.get(f"{FABRICS_PATH}/F1").headers
+    assert "server-timing" not in client.get(f"{FABRICS_PATH}/F1", headers={"X-Mock-Server-Timing": "0"}).headers
+
+
+def test_mock_server_timing_110(session: Session, client: TestClient, profiles):
+    """
+    # Summary
+
+    Verify a request with an X-Mock-Profile header is profiled, including
+    its sync endpoint function, which runs in the threadpool, and that
+    the profile is listed, and returned as a report or a pstats file.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}, headers={"X-Mock-Profile": "1"})
+    assert response.status_code == 200
+    name = response.headers["x-mock-profile"]
+    assert name.endswith("-POST-cisco_ndfc_api_v1_lan_fabric_rest_control_fabrics_fabric_name_template_name")
+
+    assert [profile["name"] for profile in client.get("/mock/profiles").json()] == [name]
+    stats = pstats.Stats(profiles.path(name))
+    assert "v1_fabric_post" in {function_name for _, _, function_name in stats.stats}
+
+    response = client.get(f"/mock/profiles/{name}", params={"sort": "tottime", "limit": 5})
+    assert response.status_code == 200
+    assert "Ordered by: internal time" in response.text
+    response = client.get(f"/mock/profiles/{name}", params={"output": "pstats"})
+    with open(profiles.path(name), "rb") as file:
+        assert response.content == file.read()
+
+    assert client.get("/mock/profiles/missing").status_code == 404
+    response = client.get(f"{FABRICS_PATH}/F1", headers={"X-Mock-Profile": "0"})
+    assert "x-mock-profile" not in response.headers
+    assert len(client.get("/mock/profiles").json()) == 1
+
+
+def test_mock_server_timing_120(session: Session, client: TestClient, profiles, monkeypatch):
+    """
+    # Summary
+
+    Verify that, as from Python 3.12, where cProfile raises ValueError if
+    another profile is active, a profiled request to a sync endpoint
+    function does not enable a second profile for the threadpool thread,
+    and that the endpoint function is in the request's profile on 3.12+.
+    """
+
+    def profile():
+        raise ValueError("Another profiling tool is already active")
+
+    monkeypatch.setattr(metrics, "cProfile", SimpleNamespace(Profile=profile))
+    monkeypatch.setattr(metrics, "PROFILE_THREADS", False)
+
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"}, headers={"X-Mock-Profile": "1"})
+    assert response.status_code == 200
+    stats = pstats.Stats(profiles.path(response.headers["x-mock-profile"]))
+    if sys.version_info >= (3, 12):
+        assert "v1_fabric_post" in {function_name for _, _, function_name in stats.stats}
+
+
+def test_mock_server_timing_200():
+    """
+    # Summary
+
+    Verify RequestTimings.phases() splits the endpoint function's time
+    into db and build, and the time after it into serialize.
+    """
+    timings = RequestTimings(10.0)
+    assert list(timings.phases(0.0)) == ["validate", "db"]
+    timings.handler_start = 10.5
+    timings.handler_end = 12.0
+    timings.response_start = 12.25
+    assert timings.phases(1.0) == {"validate": 0.5, "db": 1.0, "build": 0.5, "serialize": 0.25}
+
+
+def test_mock_server_timing_210(monkeypatch):
+    """
+    # Summary
+
+    Verify NDFC_MOCK_SERVER_TIMING selects the requests whose phases are
+    timed, that with off the endpoint functions are not wrapped, and that
+    an unknown choice raises ValueError.
+    """
+
+    def endpoint():
+        return {}
+
+    opt_in = frozenset({b"x-mock-server-timing"})
+    monkeypatch.setenv(SERVER_TIMING_ENV_VAR, "header")
+    middleware = InstrumentationMiddleware(endpoint)
+    assert middleware.timed(opt_in) and not middleware.timed(NO_HEADERS)
+
+    monkeypatch.setenv(SERVER_TIMING_ENV_VAR, "ALL")
+    assert InstrumentationMiddleware(endpoint).timed(NO_HEADERS)
+
+    monkeypatch.setenv(SERVER_TIMING_ENV_VAR, "off")
+    assert not InstrumentationMiddleware(endpoint).timed(opt_in)
+    app = FastAPI()
+    app.get("/endpoint")(endpoint)
+    metrics.instrument_endpoints(app)
+    assert [route.dependant.call for route in app.routes if route.path == "/endpoint"] == [endpoint]
+
+    monkeypatch.setenv(SERVER_TIMING_ENV_VAR, "sometimes")
+    with pytest.raises(ValueError, match="Invalid NDFC_MOCK_SERVER_TIMING: sometimes"):
+        metrics.get_server_timing()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, select
+
+from ...app.common.enums.db import DbProfileEnum
+from ...app.db import batch_session, build_engine, get_session
+from ...app.main import app
+from ...app.mock.snapshots import SNAPSHOT_BUSY_TIMEOUT, SnapshotStore, snapshot_store
+from ...app.v1.models.fabric import FabricDbModelV1
+from .common import FABRICS_PATH, SWITCHES_PATH, client_fixture, create_fabric_with_switches, session_fixture
+
+
+@pytest.fixture(name="snapshots")
+def snapshots_fixture(tmp_path):
+    """
+    # Summary
+
+    Point snapshot_store at a temporary directory, and discard its
+    snapshots after the test.
+    """
+    directory = snapshot_store.directory
+    snapshot_store.directory = str(tmp_path / "snapshots")
+    yield snapshot_store
+    snapshot_store.clear()
+    snapshot_store.directory = directory
+    snapshot_store.busy_timeout = SNAPSHOT_BUSY_TIMEOUT
+
+
+def test_mock_snapshots_100(session: Session, client: TestClient, snapshots):
+    """
+    # Summary
+
+    Verify a memory snapshot restores the database, and that responses
+    cached before the restore are not served after it.
+    """
+    create_fabric_with_switches(client)
+    response = client.post("/mock/snapshots/baseline")
+    assert response.status_code == 200
+    assert response.json()["storage"] == "memory"
+    baseline_fabric = client.get(f"{FABRICS_PATH}/F1")
+    assert baseline_fabric.status_code == 200
+    baseline_switches = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json()
+    baseline_overview = client.get(f"{SWITCHES_PATH}/F1/overview").json()
+
+    assert client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0001AAAA", "role": "leaf"}]).status_code == 200
+    assert client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65009"}).status_code == 200
+    assert client.post(f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "65002"}).status_code == 200
+    modified_etag = client.get(f"{FABRICS_PATH}/F1").headers["ETag"]
+
+    response = client.post("/mock/snapshots/baseline/restore")
+    assert response.status_code == 200
+    assert session.exec(select(FabricDbModelV1.FABRIC_NAME)).all() == ["F1"]
+    assert client.get(f"{FABRICS_PATH}/F2").status_code == 404
+    response = client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": modified_etag})
+    assert response.status_code == 200
+    assert response.json() == baseline_fabric.json()
+    # The restored fabric is the one the baseline ETag described.
+    assert client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": baseline_fabric.headers["ETag"]}).status_code == 304
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json() == baseline_switches
+    assert client.get(f"{SWITCHES_PATH}/F1/overview").json() == baseline_overview
+
+    # The snapshot is unchanged by the restore, and can be restored again.
+    assert client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65009"}).status_code == 200
+    assert client.post("/mock/snapshots/baseline/restore").status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1").json()["nvPairs"]["BGP_AS"] == "65001"
+
+    assert [snapshot["name"] for snapshot in client.get("/mock/snapshots").json()] == ["baseline"]
+    assert client.delete("/mock/snapshots/baseline").status_code == 200
+    assert client.post("/mock/snapshots/baseline/restore").status_code == 404
+    assert client.delete("/mock/snapshots/baseline").status_code == 404
+    assert client.post("/mock/snapshots/..%2Fescape").status_code in (404, 422)
+    assert client.post("/mock/snapshots/bad name").status_code == 422
+
+
+def test_mock_snapshots_110(session: Session, client: TestClient, snapshots, tmp_path):
+    """
+    # Summary
+
+    Verify a disk snapshot is written to the snapshot directory, is found
+    by another SnapshotStore (e.g. after a restart), and restores the
+    database.
+    """
+    create_fabric_with_switches(client)
+    response = client.post("/mock/snapshots/baseline", params={"storage": "disk"})
+    assert response.status_code == 200
+    assert response.json()["storage"] == "disk"
+    path = tmp_path / "snapshots" / "baseline.sqlite3"
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT FABRIC_NAME FROM fabricdbmodelv1").fetchall() == [("F1",)]
+
+    other = SnapshotStore()
+    other.directory = str(tmp_path / "snapshots")
+    assert [(snapshot["name"], snapshot["storage"]) for snapshot in other.list()] == [("baseline", "disk")]
+
+    assert client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0001AAAA", "role": "leaf"}]).status_code == 200
+    assert client.post("/mock/snapshots/baseline/restore").status_code == 200
+    assert client.get(f"{SWITCHES_PATH}/F1/overview").json()["switchRoles"]["leaf"] == 0
+
+    # A memory snapshot of the same name replaces the disk snapshot.
+    assert client.post("/mock/snapshots/baseline").status_code == 200
+    assert not path.exists()
+    assert [snapshot["storage"] for snapshot in client.get("/mock/snapshots").json()] == ["memory"]
+
+
+def test_mock_snapshots_200(tmp_path, snapshots):
+    """
+    # Summary
+
+    Verify a restore into a WAL database is atomic for other connections,
+    and that it is refused within a /mock/batch.
+    """
+    file_name = str(tmp_path / "live.db")
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=file_name)
+    SQLModel.metadata.create_all(db_engine)
+
+    def get_session_override():
+        session = batch_session.get()
+        if session is not None:
+            yield session
+            return
+        with Session(db_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        create_fabric_with_switches(client)
+        assert client.post("/mock/snapshots/baseline").status_code == 200
+        for name in ("F2", "F3"):
+            assert client.post(f"{FABRICS_PATH}/{name}/Easy_Fabric", json={"BGP_AS": "65002"}).status_code == 200
+
+        # A reader holding a snapshot of the live database keeps seeing it
+        # until its transaction ends, then sees the restored state.
+        reader = sqlite3.connect(file_name)
+        reader.execute("BEGIN")
+        assert reader.execute("SELECT count(*) FROM fabricdbmodelv1").fetchone()[0] == 3
+        assert client.post("/mock/snapshots/baseline/restore").status_code == 200
+        assert reader.execute("SELECT count(*) FROM fabricdbmodelv1").fetchone()[0] == 3
+        reader.execute("COMMIT")
+        assert reader.execute("SELECT FABRIC_NAME FROM fabricdbmodelv1").fetchall() == [("F1",)]
+        assert reader.execute("SELECT count(*) FROM switchdbmodel").fetchone()[0] == 3
+        reader.close()
+        assert [fabric["nvPairs"]["FABRIC_NAME"] for fabric in client.get(f"{FABRICS_PATH}/").json()] == ["F1"]
+
+        response = client.post("/mock/batch", json={"requests": [{"method": "POST", "path": "/mock/snapshots/baseline/restore"}]})
+        assert response.json()["results"][0]["status"] == 409
+
+        # A writer that keeps the database locked makes the restore give up.
+        writer = sqlite3.connect(file_name, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            snapshots.busy_timeout = 0.2
+            assert client.post("/mock/snapshots/baseline/restore").status_code == 503
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# pylint: disable=unused-import
+# Some fixtures are imported from common.py
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import json
+import random
+import re
+
+import pytest
+from sqlmodel import Session, func, select
+
+from ...app.common.functions.utilities import unique_switch_serial_numbers, unique_unicast_mac_addresses
+from ...app.mock.scenario import load_scenario, read_scenario_file
+from ...app.mock.topology import TopologyGenerator
+from ...app.v1.endpoints.lan_fabric.rest.control.switches.models.switch_overview import SwitchOverviewResponse
+from ...app.v1.models.inventory import SwitchDbModel
+from .common import session_fixture
+
+
+def build_generator(seed: int = 7, fabric_count: int = 2, switches_per_fabric: int = 10000) -> TopologyGenerator:
+    """
+    # Summary
+
+    Return a TopologyGenerator for a scale topology.
+    """
+    generator = TopologyGenerator()
+    generator.seed = seed
+    generator.fabric_count = fabric_count
+    generator.switches_per_fabric = switches_per_fabric
+    generator.spines_per_fabric = 8
+    generator.border_gateways_per_fabric = 4
+    return generator
+
+
+def test_mock_topology_100():
+    """
+    # Summary
+
+    Verify the unique_* utilities return distinct, well formed values, the
+    same values for the same seed, and refuse counts beyond their space.
+    """
+    serial_numbers = unique_switch_serial_numbers(50000, random.Random(1))
+    assert len(set(serial_numbers)) == 50000
+    assert all(re.fullmatch(r"FOX\d{4}[A-Z]{4}", serial_number) for serial_number in serial_numbers)
+    assert unique_switch_serial_numbers(100, random.Random(1)) == serial_numbers[:100]
+
+    mac_addresses = unique_unicast_mac_addresses(50000, random.Random(1))
+    assert len(set(mac_addresses)) == 50000
+    assert all(re.fullmatch(r"00:AA:BB(:[0-9A-F]{2}){3}", mac_address) for mac_address in mac_addresses)
+
+    with pytest.raises(ValueError):
+        unique_unicast_mac_addresses(2**24 + 1, random.Random(1))
+
+
+def test_mock_topology_110():
+    """
+    # Summary
+
+    Verify a generated topology is deterministic for a seed, has the
+    requested roles, and that its serial numbers, MAC addresses and IP
+    addresses are distinct across fabrics.
+    """
+    content = build_generator().build()
+    assert json.dumps(content) == json.dumps(build_generator().build())
+    assert json.dumps(content) != json.dumps(build_generator(seed=8).build())
+
+    switches = [switch for fabric in content["fabrics"] for switch in fabric["switches"]]
+    assert len(switches) == 20000
+    for field in ("serialNumber", "macAddress", "ipAddress", "hostName"):
+        assert len({switch[field] for switch in switches}) == 20000
+    roles = [switch["role"] for switch in content["fabrics"][1]["switches"]]
+    assert (roles.count("spine"), roles.count("border gateway"), roles.count("leaf")) == (8, 4, 9988)
+    assert content["fabrics"][1]["switches"][0]["hostName"] == "SCALE2-spine1"
+    assert len({switch["model"] for switch in switches}) > 3
+    assert len({switch["release"] for switch in switches}) == 3
+
+    generator = build_generator(switches_per_fabric=10)
+    generator.spines_per_fabric = 11
+    with pytest.raises(ValueError):
+        generator.build()
+    generator = build_generator()
+    generator.management_network = "10.1.0.0/24"
+    with pytest.raises(ValueError):
+        generator.build()
+
+
+def test_mock_topology_120(session: Session, tmp_path):
+    """
+    # Summary
+
+    Verify a generated topology loads into the database, with overviews
+    that match it, and round-trips through a scenario file.
+    """
+    generator = build_generator(fabric_count=3, switches_per_fabric=500)
+    content = generator.build()
+    path = tmp_path / "topology.json"
+    path.write_text(json.dumps(content), encoding="utf-8")
+    assert read_scenario_file(str(path)) == generator.scenario()
+
+    assert load_scenario(session, generator.scenario()) == {"fabrics": 3, "fabrics_v2": 0, "switches": 1500}
+    assert session.exec(select(func.count()).select_from(SwitchDbModel).where(SwitchDbModel.vdcMac.like("00:AA:BB:%"))).one() == 1500
+
+    switches = content["fabrics"][2]["switches"]
+    overview = SwitchOverviewResponse()
+    overview.session = session
+    overview.fabric = "SCALE3"
+    overview.refresh()
+    data = overview.response_dict()
+    assert data["switchRoles"]["border gateway"] == 4
+    assert sum(data["switchHealth"].values()) == 500
+    assert data["switchHealth"]["Healthy"] == sum(1 for switch in switches if switch["operStatus"] == "Healthy")
+    assert data["switchHWVersions"] == {model: sum(1 for switch in switches if switch["model"] == model) for model in data["switchHWVersions"]}
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# Also, fixtures need to use *args to match the signature of the function they are mocking
+# pylint: disable=unused-import
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+# pylint: disable=unused-argument
+# pylint: disable=invalid-name
+import gzip
+import json
+import os
+import shutil
+
+import pytest
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from ....app.common.functions.conditional import accepts_media_type, etag_matches, select_encoding
+from ....app.v1.endpoints.configtemplate.rest.config.templates.common import TEMPLATES_DIR, TemplateRegistry
+from ....app.v1.models.configtemplate_easy_fabric import V1ConfigtemplateEasyFabricResponseModel
+from ..common import client_fixture, session_fixture
+
+TEMPLATES_PATH = "/appcenter/cisco/ndfc/api/v1/configtemplate/rest/config/templates"
+
+
+def expected_body() -> bytes:
+    """
+    # Summary
+
+    Return the Easy_Fabric response body as FastAPI builds it from response_model.
+    """
+    with open(os.path.join(TEMPLATES_DIR, "Easy_Fabric.json"), "r", encoding="utf-8") as template:
+        model = V1ConfigtemplateEasyFabricResponseModel(**json.load(template))
+    return JSONResponse(content=jsonable_encoder(model)).body
+
+
+def test_v1_configtemplate_get_100(client: TestClient):
+    """
+    # Summary
+
+    Verify the identity and gzip bodies match the body FastAPI produces
+    from response_model, and that each carries its own ETag.
+    """
+    response_identity = client.get(f"{TEMPLATES_PATH}/Easy_Fabric", headers={"Accept-Encoding": "identity"})
+    response_gzip = client.get(f"{TEMPLATES_PATH}/Easy_Fabric", headers={"Accept-Encoding": "gzip"})
+
+    assert response_identity.status_code == 200
+    assert response_identity.headers.get("content-encoding") is None
+    assert response_identity.content == expected_body()
+    assert response_gzip.headers["content-encoding"] == "gzip"
+    assert response_gzip.content == expected_body()
+    assert response_identity.headers["etag"] != response_gzip.headers["etag"]
+    assert response_gzip.headers["vary"] == "Accept-Encoding"
+
+
+def test_v1_configtemplate_get_110(client: TestClient):
+    """
+    # Summary
+
+    Verify a matching If-None-Match returns 304 with no body.
+    """
+    response = client.get(f"{TEMPLATES_PATH}/Easy_Fabric", headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+
+    response = client.get(f"{TEMPLATES_PATH}/Easy_Fabric", headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{etag}"})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = client.get(f"{TEMPLATES_PATH}/Easy_Fabric", headers={"Accept-Encoding": "gzip", "If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
+def test_v1_configtemplate_get_200(client: TestClient):
+    """
+    # Summary
+
+    Verify a 404 is returned for unknown templates and for names that
+    could address files outside the templates directory.
+    """
+    response = client.get(f"{TEMPLATES_PATH}/foo")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Template foo not found."
+
+    response = client.get(f"{TEMPLATES_PATH}/..%2F..%2Fmain")
+    assert response.status_code == 404
+
+
+def test_v1_configtemplate_registry_100(tmp_path):
+    """
+    # Summary
+
+    Verify TemplateRegistry loads a template once, and reloads it when the
+    file's mtime changes.
+    """
+    shutil.copy(os.path.join(TEMPLATES_DIR, "Easy_Fabric.json"), tmp_path / "Easy_Fabric.json")
+    registry = TemplateRegistry()
+    registry.templates_dir = str(tmp_path)
+
+    entry = registry.get("Easy_Fabric")
+    assert registry.get("Easy_Fabric") is entry
+    assert registry.loads == 1
+    assert gzip.decompress(entry.bodies["gzip"]) == entry.body
+
+    path = tmp_path / "Easy_Fabric.json"
+    content = json.loads(path.read_text(encoding="utf-8"))
+    content["description"] = "Updated"
+    path.write_text(json.dumps(content), encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, entry.mtime_ns + 1_000_000_000))
+
+    updated = registry.get("Easy_Fabric")
+    assert updated is not entry
+    assert updated.model.description == "Updated"
+    assert updated.etags[None] != entry.etags[None]
+    assert registry.loads == 2
+
+    with pytest.raises(HTTPException):
+        registry.get("../Easy_Fabric")
+
+
+def test_v1_configtemplate_conditional_100():
+    """
+    # Summary
+
+    Verify etag_matches(), select_encoding() and accepts_media_type().
+    """
+    assert etag_matches('"a", W/"b"', '"b"') is True
+    assert etag_matches("*", '"b"') is True
+    assert etag_matches(None, '"b"') is False
+    assert etag_matches('"a"', '"b"') is False
+    assert select_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert select_encoding("gzip;q=0, deflate", ["gzip"]) is None
+    assert select_encoding(None, ["gzip"]) is None
+    assert accepts_media_type("application/json, application/x-ndjson;q=0.9", "application/x-ndjson") is True
+    assert accepts_media_type("application/x-ndjson;q=0", "application/x-ndjson") is False
+    assert accepts_media_type("*/*", "application/x-ndjson") is False
@@ -13,13 +13,15 @@ import json
 from time import sleep
 
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from ....app.common.functions.utilities import random_switch_serial_number
+from ....app.v1.endpoints.lan_fabric.rest.control.fabrics.fabric_resolver import FabricRef, FabricResolver
 from ....app.v1.endpoints.lan_fabric.rest.control.fabrics.inventory.common import build_db_switch
-from ....app.v1.models.fabric import FabricDbModelV1
+from ....app.v1.models.fabric import FABRIC_HOT_FIELDS, FabricCreate, FabricDbModelV1, NvPairs
 from ....app.v1.models.inventory import SwitchDbModel, SwitchDiscoverBodyModel, SwitchDiscoverItem
-from ..common import client_fixture, convert_db_date_to_timestamp, convert_model_date_to_timestamp, session_fixture, timestamps_within_delta
+from .. import common
+from ..common import FABRICS_PATH, client_fixture, convert_db_date_to_timestamp, convert_model_date_to_timestamp, session_fixture, timestamps_within_delta
 
 
 def test_v1_fabric_post_100(client: TestClient):
@@ -246,6 +248,73 @@ def test_v1_fabric_put_110(session: Session, client: TestClient):
     assert data["nvPairs"]["REPLICATION_MODE"] == "Ingress"
 
 
+def test_v1_fabric_put_120(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify PUT writes the fabric with one UPDATE ... RETURNING, and that the
+    result matches update_nv_pairs() applied to the stored fabric.
+
+    1. Columns and nvPairsJson fields, of several types, are updated
+    2. The response matches a subsequent GET
+    3. A PUT without fields does not write the fabric
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+    expected = FabricDbModelV1.from_fabric(FabricCreate(BGP_AS="65001", FABRIC_NAME="F1"))
+    values = {
+        "BGP_AS": "65111",
+        "REPLICATION_MODE": "Ingress",
+        "ENABLE_NETFLOW": True,
+        "AAA_SERVER_CONF": 'line 1\nline "2"',
+        "EXTRA_CONF_LEAF": None,
+        "STP_BRIDGE_PRIORITY": 4096,
+    }
+    expected.update_nv_pairs(values)
+
+    with common.count_statements(session.get_bind()) as statements:
+        response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json=values)
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE fabricdbmodelv1 SET")
+    assert "RETURNING" in statements[0]
+    assert response.json()["nvPairs"] == NvPairs.model_validate(expected.nv_pairs()).model_dump(mode="json")
+    assert client.get(f"{FABRICS_PATH}/F1").content == response.content
+
+    updated_at = session.exec(select(FabricDbModelV1.updated_at)).one()
+    with common.count_statements(session.get_bind()) as statements:
+        response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={})
+    assert response.status_code == 200
+    assert not [statement for statement in statements if statement.startswith("UPDATE")]
+    assert session.exec(select(FabricDbModelV1.updated_at)).one() == updated_at
+
+    assert client.put(f"{FABRICS_PATH}/F2/Easy_Fabric", json=values).status_code == 404
+
+
+def test_v1_fabric_db_model_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify FabricDbModelV1 stores only FABRIC_HOT_FIELDS as columns, the
+    other nvPairs in nvPairsJson, and that the response nvPairs are those
+    of the validated request body.
+    """
+    body = {"BGP_AS": "65001", "REPLICATION_MODE": "Ingress", "RP_COUNT": 4}
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json=body)
+    assert response.status_code == 200
+
+    assert set(FabricDbModelV1.__table__.columns.keys()) == {"id", *FABRIC_HOT_FIELDS, "nvPairsJson", "created_at", "updated_at"}
+    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == "F1")).one()
+    stored = json.loads(db_fabric.nvPairsJson)
+    assert stored["REPLICATION_MODE"] == "Ingress"
+    assert not set(stored) & set(FABRIC_HOT_FIELDS)
+
+    expected = NvPairs.model_validate(FabricCreate(FABRIC_NAME="F1", **body).model_dump()).model_dump(mode="json")
+    assert response.json()["nvPairs"] == expected
+    assert client.get(f"{FABRICS_PATH}/F1").json()["nvPairs"] == expected
+    assert FabricDbModelV1(FABRIC_NAME="F2", BGP_AS="65002").nv_pairs() == NvPairs(FABRIC_NAME="F2", BGP_AS="65002").model_dump(mode="json")
+
+
 def test_v1_fabric_delete_100(session: Session, client: TestClient):
     """
     # Summary
@@ -330,3 +399,139 @@ def test_v1_fabric_delete_120(session: Session, client: TestClient):
     # Verify that the fabric was not deleted
     response = client.get(f"/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics/{db_fabric.FABRIC_NAME}")
     assert response.status_code == 200
+
+
+def test_v1_fabric_resolver_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify handlers resolve a fabric name from fabric_cache after the first
+    request, and that /mock/caches reports the queries saved.
+    """
+    common.create_fabric_with_switches(client)
+    client.delete("/mock/caches")
+    before = client.get("/mock/caches").json()["fabrics"]
+
+    for _ in range(3):
+        response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric")
+        assert response.status_code == 200
+    response = client.get(f"{FABRICS_PATH}/F1")
+    assert response.status_code == 200
+    assert response.json()["nvPairs"]["FABRIC_NAME"] == "F1"
+
+    # GET /fabrics/F1 is served through fabric_response_cache rather than
+    # fabric_cache.
+    after = client.get("/mock/caches").json()["fabrics"]
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
+    assert after["requests"] - before["requests"] == 3
+    assert after["queries_saved"] - before["queries_saved"] == 2
+    assert after["entries"] >= 1
+    assert FabricResolver(session).resolve("F1") == FabricRef(1, "F1", "Switch_Fabric", "Easy_Fabric")
+    assert FabricResolver(session).resolve("F2") is None
+
+
+def test_v1_fabric_resolver_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify fabric PUT and DELETE invalidate the cached fabric.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").status_code == 200
+
+    response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"FABRIC_TYPE": "External"})
+    assert response.status_code == 200
+    assert FabricResolver(session).resolve("F1").FABRIC_TYPE == "External"
+
+    response = client.delete(f"{FABRICS_PATH}/F1")
+    assert response.status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").status_code == 404
+    assert session.get(FabricDbModelV1, 1) is None
+
+
+def test_v1_fabric_response_cache_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify GET /fabrics and GET /fabrics/{fabric_name} are served from
+    fabric_response_cache, which PUT updates and DELETE invalidates, and that
+    /mock/caches reports the hit rate.
+    """
+    for fabric_name, bgp_as in (("F1", "65001"), ("F2", "65002")):
+        response = client.post(f"{FABRICS_PATH}/{fabric_name}/Easy_Fabric", json={"BGP_AS": bgp_as})
+        assert response.status_code == 200
+    client.delete("/mock/caches")
+    before = client.get("/mock/caches").json()["fabric_responses"]
+
+    first = client.get(f"{FABRICS_PATH}/")
+    second = client.get(f"{FABRICS_PATH}/")
+    fabric = client.get(f"{FABRICS_PATH}/F1")
+    assert first.content == second.content
+    assert [item["nvPairs"]["FABRIC_NAME"] for item in second.json()] == ["F1", "F2"]
+    assert fabric.json() == second.json()[0]
+
+    response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"REPLICATION_MODE": "Ingress"})
+    assert response.status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1").json()["nvPairs"]["REPLICATION_MODE"] == "Ingress"
+    response = client.delete(f"{FABRICS_PATH}/F2")
+    assert response.status_code == 200
+    assert [item["nvPairs"]["FABRIC_NAME"] for item in client.get(f"{FABRICS_PATH}/").json()] == ["F1"]
+
+    after = client.get("/mock/caches").json()["fabric_responses"]
+    # misses: F1 and F2 on the first list.
+    # hits: F1 and F2 on the second list, F1 by name, F1 after the PUT (which
+    # caches its response), and F1 on the last list.
+    assert after["misses"] - before["misses"] == 2
+    assert after["hits"] - before["hits"] == 5
+    assert after["invalidations"] - before["invalidations"] == 1
+    assert after["hit_rate"] > 0
+
+
+def test_v1_fabric_conditional_get_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify GET /fabrics/{fabric_name} and GET /fabrics return an ETag and
+    Last-Modified, answer a matching If-None-Match with 304 without
+    querying the database, and return a new ETag after the fabric is
+    modified.
+    """
+    for fabric_name, bgp_as in (("F1", "65001"), ("F2", "65002")):
+        response = client.post(f"{FABRICS_PATH}/{fabric_name}/Easy_Fabric", json={"BGP_AS": bgp_as})
+        assert response.status_code == 200
+
+    response = client.get(f"{FABRICS_PATH}/F1")
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"].endswith(" GMT")
+    fabrics_etag = client.get(f"{FABRICS_PATH}/").headers["ETag"]
+    assert fabrics_etag != etag
+
+    with common.count_statements(session.get_bind()) as statements:
+        response = client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        response = client.get(f"{FABRICS_PATH}/", headers={"If-None-Match": fabrics_etag})
+        assert response.status_code == 304
+    assert not statements
+    assert client.get(f"{FABRICS_PATH}/", params={"limit": 1}, headers={"If-None-Match": fabrics_etag}).status_code == 200
+
+    response = client.put(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"REPLICATION_MODE": "Ingress"})
+    assert response.status_code == 200
+    response = client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["nvPairs"]["REPLICATION_MODE"] == "Ingress"
+    assert client.get(f"{FABRICS_PATH}/", headers={"If-None-Match": fabrics_etag}).status_code == 200
+
+    # After /mock/caches is cleared, the ETag, derived from updated_at, is
+    # the same, and is matched after querying the database.
+    etag = response.headers["ETag"]
+    client.delete("/mock/caches")
+    assert client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": etag}).status_code == 304
+
+    response = client.delete(f"{FABRICS_PATH}/F1")
+    assert response.status_code == 200
+    assert client.get(f"{FABRICS_PATH}/F1", headers={"If-None-Match": etag}).status_code == 404
@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# Also, fixtures need to use *args to match the signature of the function they are mocking
+# pylint: disable=unused-import
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+# pylint: disable=unused-argument
+# pylint: disable=invalid-name
+
+import asyncio
+import json
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.testclient import TestClient
+from fastapi.utils import create_model_field
+from sqlmodel import Session, select
+
+from ....app.v1.endpoints.lan_fabric.rest.control.fabrics.fabric_resolver import fabric_cache
+from ....app.v1.endpoints.lan_fabric.rest.control.fabrics.inventory import common as inventory_common
+from ....app.v1.models.fabric import FabricDbModelV1
+from ....app.v1.models.inventory import SwitchDbModel, SwitchDiscoverItem, SwitchResponseModel
+from ..common import FABRICS_PATH, SWITCHES_PATH, client_fixture, count_statements, create_fabric_with_switches, discover_body, session_fixture
+
+
+def test_v1_inventory_discover_post_100(session: Session):
+    """
+    # Summary
+
+    Verify a row built by build_switch_row() matches the SwitchDbModel
+    built by build_db_switch() for the same discovered switch.
+    """
+    db_fabric = FabricDbModelV1(FABRIC_NAME="F1", BGP_AS="65001")
+    session.add(db_fabric)
+    session.commit()
+    discover_item = SwitchDiscoverItem(deviceIndex="leaf1(FOX0001AAAA)", serialNumber="FOX0001AAAA", sysName="leaf1", platform="N9K-C9396PX", version="9.3(3)", ipaddr="10.1.1.1")
+
+    session.add(inventory_common.build_db_switch(discover_item, db_fabric))
+    session.commit()
+    db_switch = session.exec(select(SwitchDbModel)).one()
+    row = inventory_common.build_switch_row(discover_item, inventory_common.build_switch_row_template(db_fabric))
+
+    expected = db_switch.model_dump(exclude={"switchDbID"})
+    assert row == expected
+
+
+def test_v1_inventory_discover_post_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify discovered switches are persisted with the discovery defaults.
+    """
+    create_fabric_with_switches(client)
+
+    db_switches = session.exec(select(SwitchDbModel).order_by(SwitchDbModel.serialNumber)).all()
+
+    assert [db_switch.serialNumber for db_switch in db_switches] == ["FOX0001AAAA", "FOX0002AAAA", "FOX0003AAAA"]
+    assert {db_switch.switchRole for db_switch in db_switches} == {"spine"}
+    assert {db_switch.ccStatus for db_switch in db_switches} == {"In-Sync"}
+    assert {db_switch.operStatus for db_switch in db_switches} == {"Healthy"}
+    assert {db_switch.systemMode for db_switch in db_switches} == {"Normal"}
+    assert db_switches[2].model == "N9K-C9336C-FX2"
+    assert db_switches[2].release == "10.3(1)"
+
+
+def test_v1_inventory_discover_post_200(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify a 500 is returned, and nothing is added, when a switch in the
+    request already exists in the inventory, including in another fabric.
+    """
+    create_fabric_with_switches(client, "F1")
+    response = client.post(f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "65002"})
+    assert response.status_code == 200
+
+    body = discover_body([("FOX0009AAAA", "10.2.1.1", "N9K-C9336C-FX2", "10.3(1)"), ("FOX0002AAAA", "10.2.1.2", "N9K-C9336C-FX2", "10.3(1)")])
+    response = client.post(f"{FABRICS_PATH}/F2/inventory/discover", json=body)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Switch FOX0002AAAA already exists in fabric F1"
+
+    body = discover_body([("FOX0009AAAA", "10.1.1.3", "N9K-C9336C-FX2", "10.3(1)")])
+    response = client.post(f"{FABRICS_PATH}/F2/inventory/discover", json=body)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Switch 10.1.1.3 already exists in fabric F1"
+
+    assert session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricName == "F2")).all() == []
+
+
+def test_v1_inventory_discover_post_210(client: TestClient):
+    """
+    # Summary
+
+    Verify a 500 is returned when a serial number or IP address is repeated
+    within the request.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+
+    body = discover_body([("FOX0001AAAA", "10.1.1.1", "N9K-C9336C-FX2", "10.3(1)"), ("FOX0001AAAA", "10.1.1.2", "N9K-C9336C-FX2", "10.3(1)")])
+    response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=body)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Switch FOX0001AAAA is duplicated in the discovery request"
+
+    body = discover_body([("FOX0001AAAA", "10.1.1.1", "N9K-C9336C-FX2", "10.3(1)"), ("FOX0002AAAA", "10.1.1.1", "N9K-C9336C-FX2", "10.3(1)")])
+    response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=body)
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Switch 10.1.1.1 is duplicated in the discovery request"
+
+
+def test_v1_inventory_discover_post_220(client: TestClient):
+    """
+    # Summary
+
+    Verify a 404 is returned for a fabric that does not exist.
+    """
+    body = discover_body([("FOX0001AAAA", "10.1.1.1", "N9K-C9336C-FX2", "10.3(1)")])
+    response = client.post(f"{FABRICS_PATH}/F1/inventory/discover", json=body)
+    assert response.status_code == 404
+
+
+def validated_switches_body(session: Session, fabric_id: int) -> bytes:
+    """
+    # Summary
+
+    Return the body FastAPI produces from build_response_switch() with
+    response_model=List[SwitchResponseModel].
+    """
+    db_switches = session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricId == fabric_id)).all()
+    field = create_model_field(name="Response", type_=List[SwitchResponseModel], mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=[inventory_common.build_response_switch(db_switch) for db_switch in db_switches]))
+    return JSONResponse(content=content).body
+
+
+def test_v1_inventory_switches_by_fabric_get_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify the switchesByFabric and inventory fast paths return bodies
+    byte-identical to the response_model-validated path.
+    """
+    create_fabric_with_switches(client)
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0002AAAA", "role": "border gateway"}])
+    assert response.status_code == 200
+    db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == "F1")).one()
+    expected = validated_switches_body(session, db_fabric.id)
+
+    response_switches = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric")
+    response_inventory = client.get(f"{FABRICS_PATH}/F1/inventory")
+
+    assert response_switches.status_code == 200
+    assert response_switches.headers["content-type"] == "application/json"
+    assert response_switches.content == expected
+    assert response_inventory.content == expected
+    assert inventory_common.build_response_switches_json(session, db_fabric.id) == expected
+    assert len(response_switches.json()) == 3
+
+
+def test_v1_inventory_switches_by_fabric_get_110(client: TestClient):
+    """
+    # Summary
+
+    Verify an empty list is returned for a fabric with no switches, and a
+    404 for switchesByFabric of a fabric that does not exist.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json() == []
+    assert client.get(f"{FABRICS_PATH}/F2/inventory/switchesByFabric").status_code == 404
+    assert client.get(f"{FABRICS_PATH}/F2/inventory").json() == []
+
+
+def test_v1_inventory_switches_by_fabric_get_200(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify stream=true returns a body byte-identical to the default body,
+    and Accept: application/x-ndjson returns one switch per line.
+    """
+    create_fabric_with_switches(client)
+    expected = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").content
+
+    for path in ("switchesByFabric", ""):
+        response = client.get(f"{FABRICS_PATH}/F1/inventory/{path}".rstrip("/"), params={"stream": "true"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == expected
+
+        response = client.get(f"{FABRICS_PATH}/F1/inventory/{path}".rstrip("/"), headers={"Accept": "application/x-ndjson"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.content.split(b"\n")
+        assert lines[-1] == b""
+        assert b"[" + b",".join(lines[:-1]) + b"]" == expected
+
+
+def test_v1_inventory_switches_by_fabric_get_210(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify iter_response_switches_json() yields one chunk per yield_per
+    rows, and an empty array for a fabric with no switches.
+    """
+    create_fabric_with_switches(client)
+    response = client.post(f"{FABRICS_PATH}/F2/Easy_Fabric", json={"BGP_AS": "65002"})
+    assert response.status_code == 200
+    db_fabrics = {db_fabric.FABRIC_NAME: db_fabric.id for db_fabric in session.exec(select(FabricDbModelV1)).all()}
+    db_engine = session.get_bind()
+
+    chunks = list(inventory_common.iter_response_switches_json(db_engine, db_fabrics["F1"], yield_per=2))
+    assert len(chunks) == 3
+    assert b"".join(chunks) == inventory_common.build_response_switches_json(session, db_fabrics["F1"])
+
+    chunks = list(inventory_common.iter_response_switches_json(db_engine, db_fabrics["F1"], ndjson=True, yield_per=2))
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 1]
+
+    assert b"".join(inventory_common.iter_response_switches_json(db_engine, db_fabrics["F2"])) == b"[]"
+    assert b"".join(inventory_common.iter_response_switches_json(db_engine, db_fabrics["F2"], ndjson=True)) == b""
+
+
+def test_v1_inventory_switches_by_fabric_get_300(client: TestClient):
+    """
+    # Summary
+
+    Verify limit and after page through the switches in switchDbID order,
+    with a Link header to each page but the last.
+    """
+    create_fabric_with_switches(client)
+    expected = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric").json()
+
+    response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", params={"limit": 2})
+    assert response.status_code == 200
+    assert response.json() == expected[:2]
+    assert response.links["next"]["url"] == f"http://testserver{FABRICS_PATH}/F1/inventory/switchesByFabric?limit=2&after={expected[1]['switchDbID']}"
+
+    response = client.get(response.links["next"]["url"])
+    assert response.json() == expected[2:]
+    assert "link" not in response.headers
+
+    response = client.get(f"{FABRICS_PATH}/F1/inventory", params={"limit": 3})
+    assert response.json() == expected
+    assert "link" not in response.headers
+
+    assert client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", params={"limit": 0}).status_code == 422
+
+
+def test_v1_inventory_switches_by_fabric_get_310(client: TestClient):
+    """
+    # Summary
+
+    Verify the role, model, release, ccStatus and operStatus filters, and
+    the fields projection.
+    """
+    create_fabric_with_switches(client)
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0002AAAA", "role": "leaf"}])
+    assert response.status_code == 200
+
+    params = {"role": "leaf", "fields": "switchRole, serialNumber"}
+    response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", params=params)
+    assert response.json() == [{"serialNumber": "FOX0002AAAA", "switchRole": "leaf"}]
+
+    params = {"model": "N9K-C93180YC-EX", "release": "10.2(5)", "ccStatus": "In-Sync", "operStatus": "Healthy", "fields": "serialNumber,fexMap"}
+    response = client.get(f"{FABRICS_PATH}/F1/inventory", params=params, headers={"Accept": "application/x-ndjson"})
+    assert response.content == b'{"serialNumber":"FOX0001AAAA","fexMap":{}}\n{"serialNumber":"FOX0002AAAA","fexMap":{}}\n'
+
+    response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", params={"release": "9.3(3)"})
+    assert response.json() == []
+
+    response = client.get(f"{FABRICS_PATH}/F1/inventory/switchesByFabric", params={"fields": "serialNumber,foo,bar"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid fields: bar, foo."
+
+
+def test_v1_inventory_switches_by_fabric_get_320(client: TestClient):
+    """
+    # Summary
+
+    Verify a projection to a single field, in every response mode, and that
+    an invalid projection returns 400 in the streaming modes too.
+    """
+    create_fabric_with_switches(client)
+    path = f"{FABRICS_PATH}/F1/inventory/switchesByFabric"
+    expected = [{"serialNumber": "FOX0001AAAA"}, {"serialNumber": "FOX0002AAAA"}, {"serialNumber": "FOX0003AAAA"}]
+
+    response = client.get(path, params={"fields": "serialNumber"})
+    assert response.status_code == 200
+    assert response.json() == expected
+    response = client.get(path, params={"fields": "serialNumber", "stream": "true"})
+    assert response.status_code == 200
+    assert response.json() == expected
+    response = client.get(path, params={"fields": "serialNumber"}, headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == expected
+
+    response = client.get(path, params={"fields": "bogus", "stream": "true"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid fields: bogus."
+    response = client.get(path, params={"fields": "bogus"}, headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid fields: bogus."
+
+
+def test_v1_inventory_conditional_get_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify switchesByFabric, inventory and switch overview GETs answer a
+    matching If-None-Match with 304 without querying the database, until
+    a switch in the fabric is added, removed or modified.
+    """
+    create_fabric_with_switches(client)
+    paths = [
+        f"{FABRICS_PATH}/F1/inventory/switchesByFabric",
+        f"{FABRICS_PATH}/F1/inventory/switchesByFabric?fields=serialNumber,switchRole",
+        f"{FABRICS_PATH}/F1/inventory",
+        f"{SWITCHES_PATH}/F1/overview",
+    ]
+    etags = [client.get(path).headers["ETag"] for path in paths]
+    assert len(set(etags)) == len(paths)
+
+    with count_statements(session.get_bind()) as statements:
+        for path, etag in zip(paths, etags):
+            response = client.get(path, headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+    assert not statements
+    response = client.get(paths[0], headers={"If-None-Match": etags[0], "Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etags[0]
+
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0002AAAA", "role": "leaf"}])
+    assert response.status_code == 200
+    for path, etag in zip(paths, etags):
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    assert client.get(paths[3]).json()["switchRoles"]["leaf"] == 1
+
+    etag = client.get(paths[0]).headers["ETag"]
+    response = client.delete(f"{FABRICS_PATH}/F1/switches/FOX0003AAAA")
+    assert response.status_code == 200
+    response = client.get(paths[0], headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [switch["serialNumber"] for switch in response.json()] == ["FOX0001AAAA", "FOX0002AAAA"]
+
+
+def test_v1_inventory_conditional_get_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify switchesByFabric and switch overview GETs return 404, not 304,
+    for a deleted fabric when If-None-Match matches its last ETag, and
+    the internal inventory GET returns an empty list.  This holds even if
+    the fabric's inventory generation was not advanced, e.g. the fabric
+    was deleted from the database directly.
+    """
+    paths = [
+        f"{FABRICS_PATH}/F1/inventory/switchesByFabric",
+        f"{SWITCHES_PATH}/F1/overview",
+        f"{FABRICS_PATH}/F1/inventory",
+    ]
+    for delete_directly in (False, True):
+        create_fabric_with_switches(client)
+        etags = [client.get(path).headers["ETag"] for path in paths]
+        if delete_directly:
+            for db_switch in session.exec(select(SwitchDbModel)).all():
+                session.delete(db_switch)
+            session.delete(session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == "F1")).one())
+            session.commit()
+            fabric_cache.invalidate(session.get_bind(), "F1")
+        else:
+            for switch in client.get(paths[0]).json():
+                assert client.delete(f"{FABRICS_PATH}/F1/switches/{switch['serialNumber']}").status_code == 200
+            assert client.delete(f"{FABRICS_PATH}/F1").status_code == 200
+        for path, etag in zip(paths[:2], etags):
+            assert client.get(path, headers={"If-None-Match": etag}).status_code == 404
+        response = client.get(paths[2], headers={"If-None-Match": etags[2]})
+        assert response.status_code == 200
+        assert response.json() == []
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# See the following regarding *_fixture imports
+# https://pylint.pycqa.org/en/latest/user_guide/messages/warning/redefined-outer-name.html
+# Due to the above, we also need to disable unused-import
+# Also, fixtures need to use *args to match the signature of the function they are mocking
+# pylint: disable=unused-import
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+# pylint: disable=unused-argument
+# pylint: disable=invalid-name
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel, select
+
+from ....app.common.enums.db import DbProfileEnum
+from ....app.common.functions.utilities import switch_role_db_to_external
+from ....app.db import build_engine, get_session
+from ....app.main import app
+from ....app.v1.endpoints.lan_fabric.rest.control.switches.models.switch_overview import SwitchConfigBase, SwitchHealthBase, SwitchRolesBase
+from ....app.v1.models.inventory import SwitchDbModel
+from ..common import FABRICS_PATH, SWITCHES_PATH, client_fixture, create_fabric_with_switches, discover_body, session_fixture
+
+
+def test_v1_switches_overview_get_100(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify the overview of a newly-created fabric contains zero counts.
+    """
+    response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+    assert response.status_code == 200
+
+    response = client.get(f"{SWITCHES_PATH}/F1/overview")
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["switchConfig"] == {"in_sync": 0, "out_of_sync": 0}
+    assert data["switchHealth"] == {"Healthy": 0, "Major": 0, "Minor": 0}
+    assert data["switchHWVersions"] == {}
+    assert data["switchSWVersions"] == {}
+    assert len(data["switchRoles"]) == 14
+    assert set(data["switchRoles"].values()) == {0}
+
+
+def test_v1_switches_overview_get_110(session: Session, client: TestClient):
+    """
+    # Summary
+
+    Verify the overview reflects discovered switches, role changes and
+    switch removal.
+    """
+    create_fabric_with_switches(client)
+    response = client.post(f"{SWITCHES_PATH}/roles", json=[{"serialNumber": "FOX0001AAAA", "role": "border gateway"}])
+    assert response.status_code == 200
+    response = client.delete(f"{FABRICS_PATH}/F1/switches/FOX0003AAAA")
+    assert response.status_code == 200
+
+    response = client.get(f"{SWITCHES_PATH}/F1/overview")
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["switchConfig"] == {"in_sync": 2, "out_of_sync": 0}
+    assert data["switchHealth"] == {"Healthy": 2, "Major": 0, "Minor": 0}
+    assert data["switchHWVersions"] == {"N9K-C93180YC-EX": 2}
+    assert data["switchSWVersions"] == {"10.2(5)": 2}
+    assert data["switchRoles"]["border gateway"] == 1
+    assert data["switchRoles"]["spine"] == 1
+
+
+def test_v1_switches_overview_get_200(client: TestClient):
+    """
+    # Summary
+
+    Verify a 404 is returned for a fabric that does not exist.
+    """
+    response = client.get(f"{SWITCHES_PATH}/F1/overview")
+    assert response.status_code == 404
+
+
+def inventory_overview(session: Session, fabric_name: str) -> dict:
+    """
+    # Summary
+
+    Return the overview of fabric_name, counted in Python from its
+    switches, in the format of the overview GET response.
+    """
+    db_switches = session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricName == fabric_name)).all()
+    sync = {key: 0 for key in SwitchConfigBase.model_fields}
+    health = {key: 0 for key in SwitchHealthBase.model_fields}
+    roles = {switch_role_db_to_external(key): 0 for key in SwitchRolesBase.model_fields}
+    hw: dict[str, int] = {}
+    sw: dict[str, int] = {}
+    for db_switch in db_switches:
+        sync[db_switch.ccStatus.lower().replace("-", "_")] += 1
+        health[db_switch.operStatus] += 1
+        roles[db_switch.switchRole] += 1
+        hw[db_switch.model] = hw.get(db_switch.model, 0) + 1
+        sw[db_switch.release] = sw.get(db_switch.release, 0) + 1
+    return {
+        "switchConfig": sync,
+        "switchHealth": health,
+        "switchHWVersions": dict(sorted(hw.items())),
+        "switchRoles": roles,
+        "switchSWVersions": dict(sorted(sw.items())),
+    }
+
+
+def test_v1_switches_overview_concurrency_100(tmp_path):
+    """
+    # Summary
+
+    Run hundreds of concurrent discover, remove and role change requests,
+    including duplicate discoveries, duplicate removals and conflicting
+    role changes, against a WAL database with one session per request.
+
+    Verify each switch is in the inventory at most once, and that the
+    overview then matches the inventory exactly.
+    """
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=str(tmp_path / "concurrency.db"))
+    SQLModel.metadata.create_all(db_engine)
+
+    def get_session_override():
+        with Session(db_engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+    try:
+        client = TestClient(app)
+        response = client.post(f"{FABRICS_PATH}/F1/Easy_Fabric", json={"BGP_AS": "65001"})
+        assert response.status_code == 200
+
+        platforms = [("N9K-C93180YC-EX", "10.2(5)"), ("N9K-C9336C-FX2", "10.3(1)"), ("N9K-C9364C", "10.4(1)")]
+        roles = ["leaf", "border gateway", "spine", "border"]
+        switches = [(f"FOX{index:04d}AAAA", f"10.1.{index // 256}.{index % 256}", *platforms[index % len(platforms)]) for index in range(60)]
+        requests: list[tuple[str, str, dict | list | None]] = []
+        for switch in switches:
+            for _ in range(2):
+                requests.append(("post", f"{FABRICS_PATH}/F1/inventory/discover", discover_body([switch])))
+            for role in roles:
+                requests.append(("post", f"{SWITCHES_PATH}/roles", [{"serialNumber": switch[0], "role": role}]))
+        for switch in switches[::3]:
+            for _ in range(2):
+                requests.append(("delete", f"{FABRICS_PATH}/F1/switches/{switch[0]}", None))
+        random.Random(10).shuffle(requests)
+
+        def send(request: tuple[str, str, dict | list | None]) -> int:
+            method, url, body = request
+            if method == "delete":
+                return client.delete(url).status_code
+            return client.post(url, json=body).status_code
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            status_codes = list(executor.map(send, requests))
+        assert set(status_codes) <= {200, 400, 404, 500}
+        assert 200 in status_codes
+
+        with Session(db_engine) as session:
+            serial_numbers = session.exec(select(SwitchDbModel.serialNumber)).all()
+            expected = inventory_overview(session, "F1")
+        assert len(serial_numbers) == len(set(serial_numbers)) > 0
+        assert client.get(f"{SWITCHES_PATH}/F1/overview").json() == expected
+    finally:
+        app.dependency_overrides.clear()
+        db_engine.dispose()
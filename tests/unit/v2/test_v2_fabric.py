@@ -11,14 +11,24 @@
 # Disable mypy errors from using the following:
 #     test_name = inspect.currentframe().f_code.co_name
 # mypy: disable-error-code=union-attr
+import asyncio
 import inspect
 import json
+import sqlite3
+import threading
+import time
 
+import httpx
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from ....app.common.enums.db import DbProfileEnum
+from ....app.db import build_async_engine, build_engine, db_profile_pragmas, get_async_session, get_session
+from ....app.main import app
+from ....app.v1.models.fabric import FabricDbModelV1
 from ....app.v2.models.fabric import FabricDbModelV2, FabricResponseModel
-from ..common import client_fixture, convert_db_date_to_timestamp, convert_model_date_to_timestamp, session_fixture, timestamps_within_delta
+from ..common import FABRICS_PATH, client_fixture, convert_db_date_to_timestamp, convert_model_date_to_timestamp, session_fixture, timestamps_within_delta
 from .data_loader import load_data
 
 print_test_info = True
@@ -298,7 +308,9 @@ def test_v2_fabric_delete_100(session: Session, client: TestClient):
     session.commit()
 
     response = client.delete(f"/api/v1/manage/fabrics/{f1.name}")
-    fabric_in_db = session.get(FabricDbModelV2, f1.name)
+    # The handler deletes f1 with its own AsyncSession.
+    session.expire_all()
+    fabric_in_db = session.get(FabricDbModelV2, "f1")
 
     assert response.status_code == 204
 
@@ -324,3 +336,184 @@ def test_v2_fabric_delete_110(session: Session, client: TestClient):
     assert response_decode["detail"]["message"] == "Fabric foo not found"
 
     assert fabric_in_db is None
+
+
+def test_v2_fabric_post_300(tmp_path):
+    """
+    # Summary
+
+    Verify a POST request that waits on the database write lock does not
+    delay concurrent GET requests.
+
+    1. Create fabric f1 in a WAL database.
+    2. Hold the write lock from another connection for 1 second.
+    3. Send a POST request, then 20 concurrent GET requests for f1.
+    4. Verify
+        -   the GET requests complete before the write lock is released
+        -   the POST request completes after the write lock is released
+    """
+    test_name = inspect.currentframe().f_code.co_name
+    body = load_test_data("fabric.json", test_name)
+    file_name = str(tmp_path / "concurrency.db")
+    db_engine = build_engine(DbProfileEnum.wal, echo=False, file_name=file_name)
+    SQLModel.metadata.create_all(db_engine)
+    with Session(db_engine) as session:
+        f1 = FabricDbModelV2(
+            bgpAsn="65001",
+            category="fabric",
+            latitude=71.1,
+            longitude=61.1,
+            licenseTier="advantage",
+            name="f1",
+            securityDomain="all",
+            telemetryCollectionType="inBand",
+            telemetrySourceInterface="Ethernet1/1",
+            telemetrySourceVrf="vrf_1",
+            telemetryStreamingProtocol="ipv4",
+            type="fabric",
+        )
+        session.add(f1)
+        session.commit()
+    async_engine = build_async_engine(db_engine, db_profile_pragmas[DbProfileEnum.wal])
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
+    lock_seconds = 1.0
+    blocker = sqlite3.connect(file_name, check_same_thread=False)
+    blocker.execute("BEGIN IMMEDIATE")
+    released: list[float] = []
+
+    def release():
+        released.append(time.monotonic())
+        blocker.rollback()
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            timer = threading.Timer(lock_seconds, release)
+            timer.start()
+            post_task = asyncio.create_task(client.post("/api/v1/manage/fabrics", json=body))
+            await asyncio.sleep(0.1)
+            get_responses = await asyncio.gather(*(client.get("/api/v1/manage/fabrics/f1") for _ in range(20)))
+            gets_done = time.monotonic()
+            post_response = await post_task
+            timer.join()
+            return get_responses, gets_done, post_response
+
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    try:
+        get_responses, gets_done, post_response = asyncio.run(run())
+    finally:
+        app.dependency_overrides.clear()
+        blocker.close()
+        asyncio.run(async_engine.dispose())
+        db_engine.dispose()
+
+    assert {response.status_code for response in get_responses} == {200}
+    assert gets_done < released[0]
+    assert post_response.status_code == 200
+    assert post_response.json()["name"] == "F2"
+
+
+def test_v2_fabric_post_310():
+    """
+    # Summary
+
+    Verify v1 and v2 POST requests sent concurrently on the memory profile,
+    whose database exists on one connection shared by the sync and async
+    engines, each commit exactly their own fabric.
+
+    1. Create v1 fabrics DUP_0 to DUP_19.
+    2. Send 20 v1 POST requests, 20 v2 POST requests, and 20 v1 POST
+       requests for the DUP fabrics, which fail and roll back,
+       concurrently.
+    3. Verify
+        -   the v1 and v2 POST requests succeed
+        -   the POST requests for the DUP fabrics fail
+        -   the database holds the fabric of every successful request
+    """
+    test_name = inspect.currentframe().f_code.co_name
+    body = load_test_data("fabric.json", test_name)
+    db_engine = build_engine(DbProfileEnum.memory, echo=False)
+    SQLModel.metadata.create_all(db_engine)
+    count = 20
+    with Session(db_engine) as session:
+        for index in range(count):
+            session.add(FabricDbModelV1(BGP_AS="65001", FABRIC_NAME=f"DUP_{index}"))
+        session.commit()
+    async_engine = build_async_engine(db_engine, db_profile_pragmas[DbProfileEnum.memory])
+
+    def get_session_override():
+        with Session(db_engine) as session:
+            yield session
+
+    async def get_async_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            requests = []
+            for index in range(count):
+                requests.append(client.post(f"{FABRICS_PATH}/V1_{index}/Easy_Fabric", json={"BGP_AS": "65001"}))
+                requests.append(client.post("/api/v1/manage/fabrics", json={**body, "name": f"V2_{index}"}))
+                requests.append(client.post(f"{FABRICS_PATH}/DUP_{index}/Easy_Fabric", json={"BGP_AS": "65001"}))
+            return await asyncio.gather(*requests)
+
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
+    try:
+        responses = asyncio.run(run())
+        with Session(db_engine) as session:
+            v1_names = set(session.exec(select(FabricDbModelV1.FABRIC_NAME)).all())
+            v2_names = set(session.exec(select(FabricDbModelV2.name)).all())
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(async_engine.dispose())
+        db_engine.dispose()
+
+    assert [response.status_code for response in responses[0::3]] == [200] * count
+    assert [response.status_code for response in responses[1::3]] == [200] * count
+    assert [response.status_code for response in responses[2::3]] == [500] * count
+    assert v1_names == {f"{prefix}_{index}" for prefix in ("V1", "DUP") for index in range(count)}
+    assert v2_names == {f"V2_{index}" for index in range(count)}
+
+
+def test_v2_fabric_conditional_get_100(client: TestClient):
+    """
+    # Summary
+
+    Verify GET /api/v1/manage/fabrics/{fabric_name} and GET
+    /api/v1/manage/fabrics answer a matching If-None-Match with 304, until
+    a fabric is modified or deleted.
+    """
+    test_name = inspect.currentframe().f_code.co_name
+    fabric = load_test_data("fabric.json", test_name)
+    response = client.post("/api/v1/manage/fabrics", json=fabric)
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/manage/fabrics/F3")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    fabrics_etag = client.get("/api/v1/manage/fabrics").headers["ETag"]
+    assert fabrics_etag != etag
+
+    response = client.get("/api/v1/manage/fabrics/F3", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert client.get("/api/v1/manage/fabrics", headers={"If-None-Match": fabrics_etag}).status_code == 304
+
+    response = client.put("/api/v1/manage/fabrics/F3", json={**fabric, "licenseTier": "premier"})
+    assert response.status_code == 200
+    response = client.get("/api/v1/manage/fabrics/F3", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["licenseTier"] == "premier"
+    assert client.get("/api/v1/manage/fabrics", headers={"If-None-Match": fabrics_etag}).status_code == 200
+
+    etag = response.headers["ETag"]
+    response = client.delete("/api/v1/manage/fabrics/F3")
+    assert response.status_code == 204
+    assert client.get("/api/v1/manage/fabrics/F3", headers={"If-None-Match": etag}).status_code == 404
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Measure requests/sec for each database engine profile (see app/db.py)
+against the v1 fabric and inventory endpoints.
+
+Each profile runs in its own Python process, since app.db builds its
+engine when first imported.  Requests are sent in-process through
+FastAPI's TestClient, so the numbers exclude socket overhead.
+
+## Usage
+
+From the repository root:
+
+```bash
+python utils/benchmark_db_profiles.py
+python utils/benchmark_db_profiles.py --profiles memory wal --fabrics 20 --switches 20
+```
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FABRICS_PATH = "/appcenter/cisco/ndfc/api/v1/lan-fabric/rest/control/fabrics"
+PROFILES = ["file", "wal", "memory", "shared"]
+
+
+def discover_body(fabric_index: int, switch_index: int) -> dict:
+    """
+    # Summary
+
+    Return a discover request body containing a single switch.
+    """
+    serial_number = f"BENCH{fabric_index:03d}{switch_index:04d}"
+    ip_address = f"10.{fabric_index // 256}.{fabric_index % 256}.{switch_index + 1}"
+    return {
+        "seedIP": ip_address,
+        "username": "admin",
+        "password": "password",
+        "preserveConfig": False,
+        "switches": [
+            {
+                "deviceIndex": f"leaf{switch_index}({serial_number})",
+                "serialNumber": serial_number,
+                "sysName": f"leaf{switch_index}",
+                "platform": "N9K-C93180YC-EX",
+                "version": "10.2(5)",
+                "ipaddr": ip_address,
+            }
+        ],
+    }
+
+
+def timed(results: dict, name: str, requests: list) -> None:
+    """
+    # Summary
+
+    Issue each (callable, expected_status) in requests and record
+    requests/sec under results[name].
+    """
+    start = time.perf_counter()
+    for send, expected_status in requests:
+        response = send()
+        if response.status_code != expected_status:
+            raise RuntimeError(f"{name}: unexpected status {response.status_code}: {response.text}")
+    elapsed = time.perf_counter() - start
+    results[name] = round(len(requests) / elapsed, 1)
+
+
+def run_child(fabrics: int, switches: int) -> dict:
+    """
+    # Summary
+
+    Run the workload against the profile selected by the environment
+    and return requests/sec per operation.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    results: dict = {}
+    with TestClient(app) as client:
+        names = [f"BENCH_{index}" for index in range(fabrics)]
+        timed(results, "fabric POST", [(lambda name=name: client.post(f"{FABRICS_PATH}/{name}/Easy_Fabric", json={"BGP_AS": "65001"}), 200) for name in names])
+        timed(results, "fabric GET", [(lambda name=name: client.get(f"{FABRICS_PATH}/{name}"), 200) for name in names])
+        timed(results, "fabrics GET", [(lambda: client.get(f"{FABRICS_PATH}/"), 200) for _ in names])
+        discovers = []
+        for fabric_index, name in enumerate(names):
+            for switch_index in range(switches):
+                body = discover_body(fabric_index, switch_index)
+                discovers.append((lambda name=name, body=body: client.post(f"{FABRICS_PATH}/{name}/inventory/discover", json=body), 200))
+        timed(results, "inventory discover POST", discovers)
+        timed(results, "switchesByFabric GET", [(lambda name=name: client.get(f"{FABRICS_PATH}/{name}/inventory/switchesByFabric"), 200) for name in names])
+    return results
+
+
+def run_profile(profile: str, fabrics: int, switches: int) -> dict:
+    """
+    # Summary
+
+    Run the workload for profile in a child process and return its results.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env = dict(os.environ)
+        env["NDFC_MOCK_DB_PROFILE"] = profile
+        env["NDFC_MOCK_DB_FILE"] = os.path.join(tmpdir, "bench.db")
+        env["NDFC_MOCK_DB_ECHO"] = "false"
+        command = [sys.executable, os.path.abspath(__file__), "--child", "--fabrics", str(fabrics), "--switches", str(switches)]
+        output = subprocess.run(command, env=env, cwd=REPO_ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Run the benchmark for each requested profile and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark database engine profiles.")
+    parser.add_argument("--profiles", nargs="+", default=PROFILES, choices=PROFILES)
+    parser.add_argument("--fabrics", type=int, default=10)
+    parser.add_argument("--switches", type=int, default=10, help="Switches discovered per fabric.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.fabrics, args.switches)))
+        return
+
+    table = {profile: run_profile(profile, args.fabrics, args.switches) for profile in args.profiles}
+    operations = list(next(iter(table.values())).keys())
+    print(f"requests/sec ({args.fabrics} fabrics, {args.switches} switches per fabric)")
+    print(f"{'operation':<26}" + "".join(f"{profile:>10}" for profile in args.profiles))
+    for operation in operations:
+        print(f"{operation:<26}" + "".join(f"{table[profile][operation]:>10}" for profile in args.profiles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Compare v1 fabric PUT latency for two ways of writing the update.
+
+- load: Select the fabric, apply the update with update_nv_pairs(),
+  commit, and refresh the fabric.  This is how v1_fabric_put worked
+  previously.
+- returning: One UPDATE ... RETURNING built by
+  FabricDbModelV1.update_statement(), then commit.  This is how
+  v1_fabric_put works now.
+
+Both include building the serialized response, as the handler does.  The
+fabrics have large nvPairs: every free-form configuration field holds
+--conf-bytes of text.  The final state of both is checked to be identical.
+
+## Usage
+
+From the repository root:
+
+```bash
+python utils/benchmark_fabric_put.py
+python utils/benchmark_fabric_put.py --fabrics 50 --puts 2000 --conf-bytes 8192 --profile wal
+```
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Run the benchmark for each method and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark v1 fabric PUT.")
+    parser.add_argument("--fabrics", type=int, default=20, help="Number of fabrics to create.")
+    parser.add_argument("--puts", type=int, default=1000, help="Number of PUTs, spread across the fabrics.")
+    parser.add_argument("--conf-bytes", type=int, default=4096, help="Size of each free-form configuration field.")
+    parser.add_argument("--profile", choices=["memory", "wal"], default="memory", help="Database engine profile.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("NDFC_MOCK_DB_ECHO", "false")
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    from sqlmodel import Session, SQLModel, select
+
+    from app.common.enums.db import DbProfileEnum
+    from app.db import build_engine
+    from app.v1.endpoints.lan_fabric.rest.control.fabrics.fabric_response_cache import build_response_json
+    from app.v1.models.fabric import FabricCreate, FabricDbModelV1, FabricUpdate
+
+    conf = ("interface loopback0\n  description benchmark\n" * (args.conf_bytes // 40 + 1))[: args.conf_bytes]
+    conf_fields = [
+        field
+        for field, info in FabricCreate.model_fields.items()
+        if info.annotation == str | None and (field.endswith("_CONF") or field.startswith("EXTRA_CONF_") or field.endswith("_FREEFORM"))
+    ]
+    fabrics = [FabricCreate(BGP_AS=f"{65000 + index}", FABRIC_NAME=f"BENCH{index:05d}", **{field: conf for field in conf_fields}) for index in range(args.fabrics)]
+    updates = [
+        (fabrics[index % args.fabrics].FABRIC_NAME, FabricUpdate(REPLICATION_MODE=("Ingress", "Multicast")[index % 2], BGP_AS=f"{66000 + index}").model_dump(exclude_unset=True))
+        for index in range(args.puts)
+    ]
+
+    def put_load(session: Session, fabric_name: str, values: dict) -> bytes:
+        db_fabric = session.exec(select(FabricDbModelV1).where(FabricDbModelV1.FABRIC_NAME == fabric_name)).one()
+        db_fabric.update_nv_pairs(values)
+        session.add(db_fabric)
+        session.commit()
+        session.refresh(db_fabric)
+        return build_response_json(db_fabric)
+
+    def put_returning(session: Session, fabric_name: str, values: dict) -> bytes:
+        statement = FabricDbModelV1.update_statement(FabricDbModelV1.FABRIC_NAME == fabric_name, values)
+        row = session.exec(statement).mappings().one()
+        session.commit()
+        return build_response_json(FabricDbModelV1(**row))
+
+    def run(put) -> tuple[list[float], list[str]]:
+        with tempfile.TemporaryDirectory() as directory:
+            db_engine = build_engine(DbProfileEnum(args.profile), echo=False, file_name=os.path.join(directory, "bench.db"))
+            SQLModel.metadata.create_all(db_engine, tables=[FabricDbModelV1.__table__])
+            latencies: list[float] = []
+            with Session(db_engine) as session:
+                for fabric in fabrics:
+                    session.add(FabricDbModelV1.from_fabric(fabric))
+                session.commit()
+                session.expunge_all()
+                for fabric_name, values in updates:
+                    start = time.perf_counter()
+                    put(session, fabric_name, values)
+                    latencies.append(time.perf_counter() - start)
+                final = [db_fabric.nvPairsJson for db_fabric in session.exec(select(FabricDbModelV1).order_by(FabricDbModelV1.id)).all()]
+            db_engine.dispose()
+            return latencies, final
+
+    results = {}
+    final_states = {}
+    for name, put in (("load", put_load), ("returning", put_returning)):
+        results[name], final_states[name] = run(put)
+    # json_set() may order keys differently from json.dumps(), so compare decoded.
+    if [json.loads(state) for state in final_states["load"]] != [json.loads(state) for state in final_states["returning"]]:
+        raise RuntimeError("The load and returning methods stored different fabrics")
+
+    print(f"profile: {args.profile}, fabrics: {args.fabrics}, puts: {args.puts}, nvPairsJson bytes: {len(final_states['load'][0])}")
+    print(f"{'method':>10}{'mean us':>10}{'p50 us':>10}{'p95 us':>10}{'speedup':>10}")
+    baseline = statistics.mean(results["load"])
+    for name, latencies in results.items():
+        ordered = sorted(latencies)
+        mean = statistics.mean(latencies)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[int(len(ordered) * 0.95)]
+        print(f"{name:>10}{mean * 1e6:>10.0f}{p50 * 1e6:>10.0f}{p95 * 1e6:>10.0f}{baseline / mean:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Compare fabric create/get/list throughput for two layouts of the v1
+fabric table.
+
+- wide: One column per FabricBase field (~300 columns).  This is how
+  FabricDbModelV1 was stored previously.  The model is rebuilt here, on
+  its own table, as FabricWideDbModel.
+- compact: FabricDbModelV1, which stores FABRIC_HOT_FIELDS as columns
+  and the remaining fields in the nvPairsJson column.
+
+Each operation includes building the nvPairs of the response, as
+build_nv_pairs() does, but not FastAPI's response_model validation,
+which is the same for both layouts.  The responses of both layouts are
+checked to be identical.
+
+## Usage
+
+From the repository root:
+
+```bash
+python utils/benchmark_fabric_storage.py
+python utils/benchmark_fabric_storage.py --fabrics 500 --repeat 5 --profile wal
+```
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Run the benchmark for each layout and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark fabric table layouts.")
+    parser.add_argument("--fabrics", type=int, default=200, help="Number of fabrics to create.")
+    parser.add_argument("--repeat", type=int, default=3, help="Take the best of this many runs.")
+    parser.add_argument("--profile", choices=["memory", "wal"], default="memory", help="Database engine profile.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("NDFC_MOCK_DB_ECHO", "false")
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    from datetime import datetime
+
+    from sqlmodel import Field, Session, SQLModel, select
+
+    from app.common.enums.db import DbProfileEnum
+    from app.common.functions.utilities import get_datetime
+    from app.db import build_engine
+    from app.v1.models.fabric import FabricBase, FabricCreate, FabricDbModelV1, NvPairs
+
+    class FabricWideDbModel(FabricBase, table=True):
+        """
+        The previous FabricDbModelV1: one column per FabricBase field.
+        """
+
+        id: int | None = Field(default=None, primary_key=True)
+        created_at: datetime | None = Field(default_factory=get_datetime)
+        updated_at: datetime | None = Field(default_factory=get_datetime, sa_column_kwargs={"onupdate": get_datetime})
+
+    layouts = {
+        "wide": (FabricWideDbModel, FabricWideDbModel.model_validate, lambda db_fabric: db_fabric.model_dump()),
+        "compact": (FabricDbModelV1, FabricDbModelV1.from_fabric, lambda db_fabric: db_fabric.nv_pairs()),
+    }
+    fabrics = [FabricCreate(BGP_AS=f"{65000 + index}", FABRIC_NAME=f"BENCH{index:05d}", REPLICATION_MODE="Ingress") for index in range(args.fabrics)]
+
+    def run(model, build, nv_pairs) -> tuple[dict[str, float], list[bytes]]:
+        with tempfile.TemporaryDirectory() as directory:
+            db_engine = build_engine(DbProfileEnum(args.profile), echo=False, file_name=os.path.join(directory, "bench.db"))
+            SQLModel.metadata.create_all(db_engine, tables=[model.__table__])
+            timings: dict[str, float] = {}
+            with Session(db_engine) as session:
+                start = time.perf_counter()
+                for fabric in fabrics:
+                    db_fabric = build(fabric)
+                    session.add(db_fabric)
+                    session.commit()
+                    session.refresh(db_fabric)
+                    nv_pairs(db_fabric)
+                timings["create"] = time.perf_counter() - start
+                session.expunge_all()
+
+                start = time.perf_counter()
+                responses = [nv_pairs(session.exec(select(model).where(model.FABRIC_NAME == fabric.FABRIC_NAME)).one()) for fabric in fabrics]
+                timings["get"] = time.perf_counter() - start
+                bodies = [NvPairs.model_validate(response).model_dump_json().encode() for response in responses]
+                session.expunge_all()
+
+                start = time.perf_counter()
+                for offset in range(0, len(fabrics), 100):
+                    for db_fabric in session.exec(select(model).offset(offset).limit(100)).all():
+                        nv_pairs(db_fabric)
+                timings["list"] = time.perf_counter() - start
+            db_engine.dispose()
+            return timings, bodies
+
+    results: dict[str, dict[str, float]] = {}
+    responses: dict[str, list[bytes]] = {}
+    for name, (model, build, nv_pairs) in layouts.items():
+        best: dict[str, float] = {}
+        for _ in range(args.repeat):
+            timings, responses[name] = run(model, build, nv_pairs)
+            best = {operation: min(elapsed, best.get(operation, elapsed)) for operation, elapsed in timings.items()}
+        results[name] = best
+    if responses["wide"] != responses["compact"]:
+        raise RuntimeError("The wide and compact layouts returned different responses")
+
+    print(f"profile: {args.profile}, fabrics: {args.fabrics}")
+    print(f"{'operation':>10}{'wide fabrics/s':>18}{'compact fabrics/s':>20}{'speedup':>10}")
+    for operation in ("create", "get", "list"):
+        wide = args.fabrics / results["wide"][operation]
+        compact = args.fabrics / results["compact"][operation]
+        print(f"{operation:>10}{wide:>18.0f}{compact:>20.0f}{compact / wide:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Measure the per-switch cost of serializing a fabric's inventory, as
+returned by switchesByFabric and the internal inventory GET.
+
+Two paths are compared:
+
+- validated: SELECT SwitchDbModel, build_response_switch() per switch,
+  then FastAPI's response_model validation and JSONResponse rendering.
+  This is how the endpoints built their responses previously.
+- fast: build_response_switches_json(), which goes from database rows
+  straight to JSON bytes.
+- streamed: iter_response_switches_json(), which fetches and serializes
+  SWITCH_STREAM_YIELD_PER rows at a time.  The chunks are consumed as
+  they are produced, as StreamingResponse does.
+
+The peak memory allocated by the fast and streamed paths, as measured by
+tracemalloc, is also reported.
+
+## Usage
+
+From the repository root:
+
+```bash
+python utils/benchmark_switch_serialization.py
+python utils/benchmark_switch_serialization.py --switches 1000 10000 --repeat 5
+```
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+from typing import List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Run the benchmark for each requested inventory size and print a table.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark switch response serialization.")
+    parser.add_argument("--switches", nargs="+", type=int, default=[1000, 10000], help="Inventory sizes to measure.")
+    parser.add_argument("--repeat", type=int, default=3, help="Take the best of this many runs.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("NDFC_MOCK_DB_ECHO", "false")
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from sqlmodel import Session, SQLModel, select
+
+    from app.common.enums.db import DbProfileEnum
+    from app.db import build_engine
+    from app.v1.endpoints.lan_fabric.rest.control.fabrics.inventory import common as inventory_common
+    from app.v1.models.fabric import FabricDbModelV1
+    from app.v1.models.inventory import SwitchDbModel, SwitchDiscoverItem, SwitchResponseModel
+
+    field = create_model_field(name="Response", type_=List[SwitchResponseModel], mode="serialization")
+
+    def validated(session: Session, fabric_id: int) -> bytes:
+        db_switches = session.exec(select(SwitchDbModel).where(SwitchDbModel.fabricId == fabric_id)).all()
+        content = asyncio.run(serialize_response(field=field, response_content=[inventory_common.build_response_switch(db_switch) for db_switch in db_switches]))
+        return JSONResponse(content=content).body
+
+    def fast(session: Session, fabric_id: int) -> bytes:
+        return inventory_common.build_response_switches_json(session, fabric_id)
+
+    def streamed(session: Session, fabric_id: int) -> bytes:
+        digest = hashlib.sha256()
+        for chunk in inventory_common.iter_response_switches_json(session.get_bind(), fabric_id):
+            digest.update(chunk)
+        return digest.digest()
+
+    def peak_mib(function, session: Session, fabric_id: int) -> float:
+        session.expunge_all()
+        tracemalloc.start()
+        function(session, fabric_id)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 2**20
+
+    print(f"{'switches':>10}{'validated us/switch':>22}{'fast us/switch':>18}{'speedup':>10}{'stream us/switch':>18}{'fast peak MiB':>16}{'stream peak MiB':>18}")
+    for count in args.switches:
+        db_engine = build_engine(DbProfileEnum.memory, echo=False)
+        SQLModel.metadata.create_all(db_engine)
+        with Session(db_engine) as session:
+            db_fabric = FabricDbModelV1(FABRIC_NAME="BENCH", BGP_AS="65001")
+            session.add(db_fabric)
+            session.commit()
+            template = inventory_common.build_switch_row_template(db_fabric)
+            items = [
+                SwitchDiscoverItem(
+                    deviceIndex=f"leaf{index}",
+                    serialNumber=f"BENCH{index:07d}",
+                    sysName=f"leaf{index}",
+                    platform="N9K-C93180YC-EX",
+                    version="10.2(5)",
+                    ipaddr=f"10.{index // 65536}.{(index // 256) % 256}.{index % 256}",
+                )
+                for index in range(count)
+            ]
+            inventory_common.insert_switch_rows(session, [inventory_common.build_switch_row(item, template) for item in items])
+            session.commit()
+            fabric_id = db_fabric.id
+
+            results = {}
+            for name, function in (("validated", validated), ("fast", fast), ("streamed", streamed)):
+                best = None
+                for _ in range(args.repeat):
+                    session.expunge_all()
+                    start = time.perf_counter()
+                    body = function(session, fabric_id)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                results[name] = (best, body)
+            fast_peak = peak_mib(fast, session, fabric_id)
+            stream_peak = peak_mib(streamed, session, fabric_id)
+        if results["validated"][1] != results["fast"][1]:
+            raise RuntimeError(f"Bodies differ for {count} switches")
+        if hashlib.sha256(results["fast"][1]).digest() != results["streamed"][1]:
+            raise RuntimeError(f"Streamed body differs for {count} switches")
+        validated_us = results["validated"][0] / count * 1e6
+        fast_us = results["fast"][0] / count * 1e6
+        stream_us = results["streamed"][0] / count * 1e6
+        print(f"{count:>10}{validated_us:>22.1f}{fast_us:>18.1f}{validated_us / fast_us:>9.1f}x{stream_us:>18.1f}{fast_peak:>16.1f}{stream_peak:>18.1f}")
+        db_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
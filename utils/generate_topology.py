@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Generate a synthetic spine/leaf/border gateway topology with
+TopologyGenerator, and either write it as a scenario file, or load it
+into a database.
+
+The same arguments, including --seed, always generate the same topology.
+
+## Usage
+
+From the repository root:
+
+```bash
+# Write a scenario file, to load with NDFC_MOCK_SCENARIO or POST /mock/scenario.
+python utils/generate_topology.py --fabrics 10 --switches 1000 --output scale.json
+# Load a 10k-switch fabric directly into a wal database.
+python utils/generate_topology.py --switches 10000 --db-profile wal --db-file scale.db
+```
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Generate the topology, then write or load it.
+    """
+    parser = argparse.ArgumentParser(description="Generate a synthetic topology.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--fabrics", type=int, default=1, help="Number of fabrics.")
+    parser.add_argument("--fabric-prefix", default="SCALE", help="Fabric name prefix.  Fabrics are named <prefix>1, <prefix>2, ...")
+    parser.add_argument("--switches", type=int, default=64, help="Number of switches per fabric.")
+    parser.add_argument("--spines", type=int, default=4, help="Number of spines per fabric.")
+    parser.add_argument("--border-gateways", type=int, default=2, help="Number of border gateways per fabric.")
+    parser.add_argument("--management-network", default="10.0.0.0/8", help="Network from which management IP addresses are assigned.")
+    parser.add_argument("--output", help="Scenario file to write (.json, .yaml or .yml).")
+    parser.add_argument("--db-profile", choices=["file", "wal"], help="Load the topology into a database with this profile.")
+    parser.add_argument("--db-file", default="database.db", help="Database file for --db-profile.")
+    args = parser.parse_args()
+    if (args.output is None) == (args.db_profile is None):
+        parser.error("Exactly one of --output and --db-profile is required.")
+
+    os.environ.setdefault("NDFC_MOCK_DB_ECHO", "false")
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    import yaml
+    from sqlmodel import Session, SQLModel
+
+    from app.common.enums.db import DbProfileEnum
+    from app.db import build_engine
+    from app.mock.scenario import load_scenario
+    from app.mock.topology import TopologyGenerator
+
+    generator = TopologyGenerator()
+    generator.seed = args.seed
+    generator.fabric_count = args.fabrics
+    generator.fabric_prefix = args.fabric_prefix
+    generator.switches_per_fabric = args.switches
+    generator.spines_per_fabric = args.spines
+    generator.border_gateways_per_fabric = args.border_gateways
+    generator.management_network = args.management_network
+
+    start = time.perf_counter()
+    if args.output:
+        content = generator.build()
+        with open(args.output, "w", encoding="utf-8") as file:
+            if args.output.endswith(".json"):
+                json.dump(content, file)
+            else:
+                yaml.dump(content, file, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), sort_keys=False)
+        print(f"Wrote {args.fabrics * args.switches} switches in {args.fabrics} fabrics to {args.output} in {time.perf_counter() - start:.2f}s")
+        return
+
+    db_engine = build_engine(DbProfileEnum(args.db_profile), echo=False, file_name=args.db_file)
+    SQLModel.metadata.create_all(db_engine)
+    with Session(db_engine) as session:
+        counts = load_scenario(session, generator.scenario())
+    db_engine.dispose()
+    print(f"Loaded {counts} into {args.db_file} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Replay a request journal recorded by the mock (NDFC_MOCK_JOURNAL, see
+docs/mock_tooling.md) and report the throughput, and the p50, p95 and
+p99 latency and error rate of each route.  Optionally, save the
+results as a baseline, or compare them with one and exit 1 on a
+regression.
+
+By default the journal is replayed in-process, through an
+httpx.ASGITransport (no sockets), against a fresh database.  With --url
+it is replayed over HTTP against a running mock.
+
+## Usage
+
+From the repository root:
+
+```bash
+# Record a session.
+NDFC_MOCK_JOURNAL=journal/session.jsonl fastapi run app/main.py
+# Replay it in-process, as fast as possible, and save a baseline.
+python utils/replay.py journal/session.jsonl --output baseline.json
+# After a change, replay it again and compare.
+python utils/replay.py journal/session.jsonl --baseline baseline.json
+# Replay it over HTTP, 8 requests at a time, at 10x the recorded pace.
+python utils/replay.py journal/session.jsonl --url http://127.0.0.1:8000 --concurrency 8 --speedup 10
+```
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def print_results(results: dict) -> None:
+    """
+    # Summary
+
+    Print the summary, and a table of the routes.
+    """
+    summary = results["summary"]
+    print(f"{summary['requests']} requests in {summary['elapsed_s']}s: {summary['throughput_rps']} requests/s, error rate {summary['error_rate']:.2%}")
+    width = max([len(route) for route in results["routes"]] + [5]) + 2
+    print(f"{'route':<{width}}{'requests':>9}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for route, stats in results["routes"].items():
+        print(f"{route:<{width}}{stats['requests']:>9}{stats['errors']:>8}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}")
+
+
+async def replay(args: argparse.Namespace, entries: list, replayer) -> tuple[list, float]:
+    """
+    # Summary
+
+    Replay entries in-process, or over HTTP if args.url is set.
+    """
+    # pylint: disable=import-outside-toplevel
+    import httpx
+
+    if args.url:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+            return await replayer.run(client, entries)
+
+    from app.db import create_db_and_tables, engine
+    from app.main import app
+    from app.mock.scenario import seed_scenario_file
+
+    create_db_and_tables()
+    if args.scenario:
+        print(f"Loaded scenario {args.scenario}: {seed_scenario_file(engine, args.scenario)}")
+    # Report exceptions raised by the app as 500s, as a server would.
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://mock", timeout=60) as client:
+        return await replayer.run(client, entries)
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Replay the journal, print the results, and save or compare them.
+    """
+    sys.path.insert(0, REPO_ROOT)
+    # pylint: disable=import-outside-toplevel
+    from app.common.enums.db import DbProfileEnum
+
+    parser = argparse.ArgumentParser(description="Replay a request journal and report latency per route.")
+    parser.add_argument("journal", nargs="+", help="Journal files, oldest first.")
+    parser.add_argument("--url", help="Replay over HTTP against the mock at this URL, rather than in-process.")
+    parser.add_argument(
+        "--db-profile",
+        choices=[profile.value for profile in DbProfileEnum],
+        default=DbProfileEnum.wal.value,
+        help="In-process database profile.  The memory profile's single connection does not support --concurrency above 1.",
+    )
+    parser.add_argument("--scenario", help="In-process: scenario file to load before replaying.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Most requests in flight.")
+    parser.add_argument("--speedup", type=float, default=0.0, help="Replay at this multiple of the recorded pace.  0 (default) replays as fast as possible.")
+    parser.add_argument("--output", help="Write the results, as JSON, to this file, e.g. to use as a baseline.")
+    parser.add_argument("--baseline", help="Compare the results with this file, and exit 1 on a regression.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Fraction by which a latency percentile may grow, or the throughput fall, before it is a regression.")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Latency growth, in ms, below which a percentile never regresses.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ.setdefault("NDFC_MOCK_DB_ECHO", "false")
+        os.environ["NDFC_MOCK_DB_PROFILE"] = args.db_profile
+        os.environ["NDFC_MOCK_DB_FILE"] = os.path.join(tmpdir, "replay.db")
+        os.environ.pop("NDFC_MOCK_JOURNAL", None)
+        from app.mock.replay import JournalReplayer, compare_to_baseline, read_journal
+
+        replayer = JournalReplayer()
+        replayer.concurrency = args.concurrency
+        replayer.speedup = args.speedup
+        entries = read_journal(args.journal)
+        samples, elapsed = asyncio.run(replay(args, entries, replayer))
+    results = replayer.summarize(samples, elapsed)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=4)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare_to_baseline(results, json.load(file), args.threshold, args.min_delta_ms)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
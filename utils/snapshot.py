@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+# Summary
+
+Take, restore, list and delete snapshots of a running mock's database,
+through its /mock/snapshots endpoints.
+
+## Usage
+
+```bash
+python utils/snapshot.py save baseline
+python utils/snapshot.py save baseline --storage disk
+python utils/snapshot.py restore baseline
+python utils/snapshot.py list
+python utils/snapshot.py delete baseline --url http://127.0.0.1:8080
+```
+"""
+
+import argparse
+import json
+import sys
+
+import httpx
+
+
+def main() -> None:
+    """
+    # Summary
+
+    Send the request for the selected command, and print the response.
+    """
+    parser = argparse.ArgumentParser(description="Manage snapshots of the mock's database.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of the mock.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    save = commands.add_parser("save", help="Snapshot the database.")
+    save.add_argument("name")
+    save.add_argument("--storage", choices=["memory", "disk"], default="memory", help="Keep the snapshot in the mock's memory, or on its disk.")
+    commands.add_parser("restore", help="Restore the database from a snapshot.").add_argument("name")
+    commands.add_parser("delete", help="Discard a snapshot.").add_argument("name")
+    commands.add_parser("list", help="List the snapshots.")
+    args = parser.parse_args()
+
+    with httpx.Client(base_url=args.url, timeout=60) as client:
+        if args.command == "save":
+            response = client.post(f"/mock/snapshots/{args.name}", params={"storage": args.storage})
+        elif args.command == "restore":
+            response = client.post(f"/mock/snapshots/{args.name}/restore")
+        elif args.command == "delete":
+            response = client.delete(f"/mock/snapshots/{args.name}")
+        else:
+            response = client.get("/mock/snapshots")
+    print(json.dumps(response.json(), indent=4))
+    if response.is_error:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()